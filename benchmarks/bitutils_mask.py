@@ -0,0 +1,67 @@
+"""
+    Micro-benchmark: table-driven BitUtils mask expansion against the former bit-by-bit loops,
+    for strobes of 8 to 128 bytes (64- to 1024-bit buses).
+
+    The loops below are the former implementations with the loop bound fixed to the strobe width
+    (they used to iterate `be.bit_count()` times, which is wrong for sparse strobes).
+
+    Usage:
+        python -m PyVeriUtils.benchmarks.bitutils_mask
+"""
+import random
+import timeit
+
+from PyVeriUtils.utils.Common.BitUtils import BitUtils, np
+
+NR_CALLS = 2000
+
+
+def loop_be_to_bit_en(be: int) -> int:
+    bit_en = 0
+    for i in range(be.bit_length()):
+        byte_flag = (be >> i) & 0x1
+        byte_mask = 0xFF if bool(byte_flag) else 0
+
+        bit_en |= byte_mask << (8 * i)
+
+    return bit_en
+
+
+def loop_nbe_to_be(nbe: int) -> int:
+    be = 0
+    for i in range(0, nbe.bit_length(), 2):
+        if ((nbe >> i) & 1) or ((nbe >> (i + 1)) & 1):
+            be |= (1 << (i >> 1))
+
+    return be
+
+
+def us_per_call(fn, args) -> float:
+    return timeit.timeit(lambda: [fn(a) for a in args], number = 1) / len(args) * 1e6
+
+
+def main():
+    rng = random.Random(0)
+
+    print(f"{'strobe bytes':>12} | {'loop be->bit':>12} | {'table be->bit':>13} | {'batch be->bit':>13} | {'loop nbe->be':>12} | {'table nbe->be':>13}   (us/strobe)")
+    for nr_bytes in (8, 32, 64, 128):
+        strobes = [rng.getrandbits(nr_bytes) for _ in range(NR_CALLS)]
+        assert [BitUtils.be_to_bit_en(s) for s in strobes] == [loop_be_to_bit_en(s) for s in strobes]
+        assert [BitUtils.nbe_to_be(s) for s in strobes] == [loop_nbe_to_be(s) for s in strobes]
+
+        loop  = us_per_call(loop_be_to_bit_en, strobes)
+        table = us_per_call(BitUtils.be_to_bit_en, strobes)
+        batch = timeit.timeit(lambda: BitUtils.be_to_bit_en_batch(strobes, nr_bytes), number = 1) / NR_CALLS * 1e6
+        n_loop  = us_per_call(loop_nbe_to_be, strobes)
+        n_table = us_per_call(BitUtils.nbe_to_be, strobes)
+
+        print(f"{nr_bytes:>12} | {loop:>12.2f} | {table:>13.2f} | {batch:>13.2f} | {n_loop:>12.2f} | {n_table:>13.2f}")
+
+    if np is not None:
+        strobes = np.frombuffer(rng.randbytes(16 * NR_CALLS), dtype = np.uint8).reshape(NR_CALLS, 16)
+        numpy = timeit.timeit(lambda: BitUtils.be_to_bit_en_batch(strobes, 128), number = 1) / NR_CALLS * 1e6
+        print(f"{128:>12} | NumPy batch be->bit: {numpy:.3f} us/strobe")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+    Transaction-logging overhead on the loopback, split into its two parts:
+    - monitor: every AW/W/B/AR/R handshake received as a flit (`*Flit.recv`), which any monitor pays;
+    - logging: saving those flits with AXI4_DB_Helper, i.e. the cost of the database itself.
+    The loopback is run bare, with the monitor only, and with monitor + logging; the logging overhead
+    is the difference between the last two, relative to the bare run. The per-row cost of the save
+    calls is also measured on their own, outside the loopback.
+
+    The budget is the CPU time of the simulation thread (`time.thread_time()`), which leaves out the
+    database writer thread. Wall-clock time is printed as well: it also includes the writer's work on a
+    single CPU, and its GIL-held part (parameter binding, BLOB conversion) on any host.
+    In the loop a row costs more than the isolated save calls suggest: the buffered rows keep their
+    fields alive until the writer takes them, where the monitor alone frees (and reuses) them at once.
+
+    Usage:
+        python -m PyVeriUtils.benchmarks.db_logging [cycles]
+"""
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, Optional, Tuple
+
+from PyVeriUtils.protocol.AXI4.components.AxiLoopback import AxiLoopback
+from PyVeriUtils.protocol.AXI4.components.Parameters import AxiAgentCfg
+from PyVeriUtils.protocol.AXI4.spec.Encodings import BurstType, Channel, RespType
+from PyVeriUtils.protocol.AXI4.spec.Flit import AxFlit, BFlit, RFlit, WFlit
+from PyVeriUtils.protocol.AXI4.utils.DataBase import AXI4_DB_Helper
+
+
+class LoggedLoopback(AxiLoopback):
+    """
+    Receives every handshake as a flit; saves it too when `db` is given.
+    """
+    def __init__(self, cfg: AxiAgentCfg, db: Optional[AXI4_DB_Helper] = None) -> None:
+        super().__init__(cfg)
+        self.db = db
+        io = self.mst.io
+        saves = [db.aw_save_db, db.w_save_db, db.b_save_db, db.ar_save_db, db.r_save_db] if db is not None else [None] * 5
+        self.loggers = list(zip((io.aw, io.w, io.b, io.ar, io.r), (AxFlit, WFlit, BFlit, AxFlit, RFlit), saves))
+
+    def step(self) -> None:
+        cycle = self.stats.cycles
+        super().step()
+        for io, flit_cls, save in self.loggers:
+            if io.fire():
+                flit = flit_cls.recv(io)
+                if save is not None:
+                    save(cycle, "loopback", flit)
+
+
+def timed_run(lb: AxiLoopback, cycles: int) -> Tuple[float, float]:
+    """
+    (wall-clock seconds, CPU seconds of the calling thread) of `cycles` steps.
+    """
+    cpu = time.thread_time()
+    stats = lb.run(cycles)
+    return stats.seconds, time.thread_time() - cpu
+
+
+def save_cost_ns(path: str, rows: int = 200000) -> Dict[str, float]:
+    """
+    Main-thread CPU time per saved row, hand-overs to the writer included.
+    """
+    flits = {
+        "aw": AxFlit(3, 0x1000, 7, 6, BurstType.INCR),
+        "w" : WFlit((1 << 511) | 0x55, (1 << 64) - 1, True),
+        "b" : BFlit(3, RespType.OKAY),
+        "r" : RFlit(3, (1 << 511) | 0xaa, RespType.OKAY, True),
+    }
+    costs = {}
+    with AXI4_DB_Helper(path) as db:
+        for table, flit in flits.items():
+            save = getattr(db, f"{table}_save_db")
+            start = time.thread_time()
+            for cycle in range(rows):
+                save(cycle, "loopback", flit)
+            db.hand_over()
+            costs[table] = (time.thread_time() - start) / rows * 1e9
+    return costs
+
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    cfg = AxiAgentCfg("loopback", 0, seed = 1, pipelined = True, maxInflightTxns = 16)
+
+    bare    = min(timed_run(AxiLoopback(cfg), cycles) for _ in range(3))
+    monitor = min(timed_run(LoggedLoopback(cfg), cycles) for _ in range(3))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = []
+        for n in range(3):
+            with AXI4_DB_Helper(os.path.join(tmp, f"axi{n}.db")) as db:
+                lb = LoggedLoopback(cfg, db)
+                runs.append(timed_run(lb, cycles))
+        logged = min(runs)
+        rows = {table: db.query(f"SELECT COUNT(*) FROM {table}")[0][0] for table in AXI4_DB_Helper.TABLES}
+        for chnl, n in lb.stats.beats.items():
+            table = Channel.enum_to_str(chnl).lower()
+            assert rows[table] == n, f"{n} {table} handshakes but {rows[table]} rows"
+
+        costs = save_cost_ns(os.path.join(tmp, "rows.db"))
+
+    print(f"{'':8} | {'wall s':>7} | {'main-thread CPU s':>17}")
+    for name, (wall, cpu) in (("bare", bare), ("monitor", monitor), ("logged", logged)):
+        print(f"{name:8} | {wall:7.3f} | {cpu:17.3f}")
+    print(f"monitor (Flit.recv of every handshake): +{monitor[1] / bare[1] - 1:.1%} main-thread CPU")
+    print(f"logging only (logged - monitor)       : +{(logged[1] - monitor[1]) / bare[1]:.1%} main-thread CPU, "
+          f"+{(logged[0] - monitor[0]) / bare[0]:.1%} wall clock on {os.cpu_count()} CPU(s)")
+    print(f"rows: {rows}")
+    print("main-thread CPU per saved row: " + ", ".join(f"{table} {ns:.0f} ns" for table, ns in costs.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+    Micro-benchmark: per-beat cost of the compiled send/recv field plans against the generic path
+    (a `cfg.has_*` check per optional field on every call), for AW bundles with no and with all optional fields.
+
+    Handles are MockDut signals, so the numbers are framework overhead only.
+
+    Usage:
+        python -m PyVeriUtils.benchmarks.field_plan
+"""
+import timeit
+
+from PyVeriUtils.protocol.AXI4.spec.DutBundle import AxBundle
+from PyVeriUtils.protocol.AXI4.spec.DutBundleCfg import AxCfg
+from PyVeriUtils.protocol.AXI4.spec.Encodings import BurstType, Channel
+from PyVeriUtils.protocol.AXI4.spec.Flit import AxFlit
+from PyVeriUtils.protocol.AXI4.spec.Task import AxTask
+from PyVeriUtils.protocol.AXI4.utils.MockAxi import axi_signal_widths
+from PyVeriUtils.signals.Mock.MockDut import MockDut
+
+NR_BEATS = 200000
+
+
+def generic_send(bdl: AxBundle, task: AxTask) -> None:
+    bdl.bits.id.value    = task.flit.id
+    bdl.bits.addr.value  = task.flit.addr
+    bdl.bits.len.value   = task.flit.len
+    bdl.bits.size.value  = task.flit.size
+    bdl.bits.burst.value = task.flit.burst.value
+
+    if bdl.cfg.has_lock:
+        bdl.bits.lock.value = task.flit.lock
+    if bdl.cfg.has_cache:
+        bdl.bits.cache.value = task.flit.cache
+    if bdl.cfg.has_prot:
+        bdl.bits.prot.value = task.flit.prot
+    if bdl.cfg.has_qos:
+        bdl.bits.qos.value = task.flit.qos
+    if bdl.cfg.has_region:
+        bdl.bits.region.value = task.flit.region
+    if bdl.cfg.has_user:
+        bdl.bits.user.value = task.flit.user
+
+    bdl.valid.value = 1
+
+
+def generic_recv(bdl: AxBundle) -> AxFlit:
+    bits = bdl.snapshot().bits
+    return AxFlit(
+        id     = bits.id,
+        addr   = bits.addr,
+        len    = bits.len,
+        size   = bits.size,
+        burst  = BurstType.int_to_enum(int(bits.burst)),
+        lock   = bits.lock if bdl.cfg.has_lock else None,
+        cache  = bits.cache if bdl.cfg.has_cache else None,
+        prot   = bits.prot if bdl.cfg.has_prot else None,
+        qos    = bits.qos if bdl.cfg.has_qos else None,
+        region = bits.region if bdl.cfg.has_region else None,
+        user   = bits.user if bdl.cfg.has_user else None,
+    )
+
+
+def per_beat_ns(fn) -> float:
+    return timeit.timeit(fn, number = NR_BEATS) / NR_BEATS * 1e9
+
+
+def main():
+    task = AxTask.customized(AxFlit(id = 1, addr = 0x1000, len = 7, size = 6, lock = 0, cache = 0, prot = 0, qos = 0, region = 0, user = 0), Channel.AW, 0)
+    cfgs = {
+        "AW, no optional fields" : AxCfg(),
+        "AW, all optional fields": AxCfg(True, True, True, True, True, True)
+    }
+
+    print(f"{'':<24} | {'generic send':>12} | {'plan send':>9} | {'generic recv':>12} | {'plan recv':>9}   (ns/beat)")
+    for label, cfg in cfgs.items():
+        bdl = AxBundle(MockDut(widths = axi_signal_widths()), "axi_aw", cfg = cfg)
+        bdl.valid.value = 1
+        bdl.ready.value = 1
+        bdl.send(task)
+        bdl.sample()
+
+        g_send = per_beat_ns(lambda: generic_send(bdl, task))
+        p_send = per_beat_ns(lambda: bdl.send(task))
+        g_recv = per_beat_ns(lambda: generic_recv(bdl))
+        p_recv = per_beat_ns(lambda: AxFlit.recv(bdl))
+
+        print(f"{label:<24} | {g_send:>12.0f} | {p_send:>9.0f} | {g_recv:>12.0f} | {p_recv:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
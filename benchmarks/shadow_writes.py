@@ -0,0 +1,78 @@
+"""
+    Shadow-register tradeoff: loopback throughput with and without AxiBundleCfg(shadow = True),
+    on the plain MockDut and on a MockDut whose signal writes spin for `WRITE_COST_US`
+    to mimic a GPI write through cocotb.
+
+    Shadow mode adds Python work per write (buffering, one flush per drive_phase) and saves
+    the simulator writes of unchanged values, so it only wins when those writes are expensive.
+
+    Usage:
+        python -m PyVeriUtils.benchmarks.shadow_writes [cycles]
+"""
+import sys
+import time
+
+from PyVeriUtils.protocol.AXI4.components.AxiLoopback import AxiLoopback
+from PyVeriUtils.protocol.AXI4.components.Parameters import AxiAgentCfg
+from PyVeriUtils.protocol.AXI4.spec.DutBundleCfg import AxiBundleCfg
+from PyVeriUtils.protocol.AXI4.utils.MockAxi import mock_axi_dut
+from PyVeriUtils.signals.Mock.MockDut import MockSignal
+
+WRITE_COST_US = 2
+
+
+class _CostlySignal(MockSignal):
+    __slots__ = ("writes",)
+
+    def __init__(self, name: str, width: int = 1, init: int = 0) -> None:
+        super().__init__(name, width, init)
+        self.writes = 0
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value) -> None:
+        deadline = time.perf_counter() + WRITE_COST_US * 1e-6
+        while time.perf_counter() < deadline:
+            pass
+        self.writes += 1
+        MockSignal.value.fset(self, value)
+
+
+def costly_dut(cfg: AxiAgentCfg):
+    dut = mock_axi_dut(cfg)
+    widths = dut.widths
+
+    def add_signal(path: str, width: int = 1, init: int = 0):
+        sig = _CostlySignal(path, width, init)
+        dut.signals[path] = sig
+        dut.__dict__[path] = sig
+        return sig
+
+    dut.add_signal = add_signal
+    dut.widths = widths
+    return dut
+
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    for costly in (False, True):
+        for shadow in (False, True):
+            cfg = AxiAgentCfg("loopback", 0, seed = 1, pipelined = True, maxInflightTxns = 16,
+                              bundleCfg = AxiBundleCfg(shadow = shadow))
+            dut = costly_dut(cfg) if costly else None
+            stats = AxiLoopback(cfg, dut = dut).run(cycles)
+
+            writes = ""
+            if costly:
+                nr_writes = sum(sig.writes for sig in dut.signals.values() if isinstance(sig, _CostlySignal))
+                writes = f", {nr_writes / cycles:.1f} simulator writes/cycle"
+            print(f"write cost = {WRITE_COST_US if costly else 0} us, shadow = {shadow}: "
+                  f"{stats.beats_per_sec():,.0f} beats/s, {stats.cycles / stats.seconds:,.0f} cycles/s{writes}")
+
+
+if __name__ == "__main__":
+    main()
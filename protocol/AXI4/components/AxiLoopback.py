@@ -0,0 +1,178 @@
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Type
+
+from PyVeriUtils.protocol.AXI4.components.BaseAxiMaster import BaseAxiMaster
+from PyVeriUtils.protocol.AXI4.components.BaseAxiSlave import BaseAxiSlave
+from PyVeriUtils.protocol.AXI4.components.Parameters import AxiAgentCfg
+from PyVeriUtils.protocol.AXI4.components.PerfMonitor import PerfMonitor
+from PyVeriUtils.protocol.AXI4.spec.Encodings import Channel
+from PyVeriUtils.protocol.AXI4.spec.Task import AxTask, WTask
+from PyVeriUtils.protocol.AXI4.utils.MockAxi import mock_axi_dut
+from PyVeriUtils.protocol.AXI4.utils.StimulusStream import StimulusStream
+
+
+class LoopbackMaster(BaseAxiMaster):
+    """
+    A self-driving master for the loopback harness.
+
+    It keeps its request queues topped up with random AW/W and AR traffic (drawn from StimulusStreams) in `req_alloc()`,
+    and drains the B/R queues right after they are filled (or, pipelined, gets write_done()/read_done() calls),
+    counting completed transactions.
+
+    In every mode at most `cfg.maxInflightTxns` writes and reads are outstanding (allocated but not completed):
+    BaseAxiSlave's response queues are unbounded, so without this cap a non-pipelined run would keep issuing
+    reads much faster than their R bursts drain.
+    """
+    def __init__(
+            self,
+            dut,
+            name: str,
+            cfg: AxiAgentCfg,
+            id_bits: int = 4,
+            max_len: int = 15,
+            addr_range: tuple = (0, (1 << 32) - 1)
+    ) -> None:
+        super().__init__(dut, name, cfg)
+        self.id_bits = id_bits
+        self.max_len = max_len
+        self.addr_range = addr_range
+
+        # Write and read requests come from two independent pregenerated streams,
+        # so a seeded run replays the same traffic whatever the handshake timing.
+        self.wr_stream = StimulusStream(cfg, f"{name}_wr", id_bits, addr_range, max_len)
+        self.rd_stream = StimulusStream(cfg, f"{name}_rd", id_bits, addr_range, max_len, with_data = False)
+
+        self.nr_writes_alloc = 0
+        self.nr_reads_alloc  = 0
+        self.nr_writes_done  = 0
+        self.nr_reads_done   = 0
+
+    def can_alloc_write(self) -> bool:
+        return super().can_alloc_write() and self.nr_writes_alloc - self.nr_writes_done < self.cfg.maxInflightTxns
+
+    def can_alloc_read(self) -> bool:
+        return super().can_alloc_read() and self.nr_reads_alloc - self.nr_reads_done < self.cfg.maxInflightTxns
+
+    def req_alloc(self):
+        cycle = self.cycle
+
+        if self.cfg.hasWr and self.can_alloc_write():
+            aw, w = self.wr_stream.next_write()
+            self.aw_queue.enq(AxTask.customized(aw, Channel.AW, cycle, self.cfg.timeout_threshold, self.name))
+            self.w_queue.enq(WTask.customized(w, cycle, self.cfg.timeout_threshold, self.name))
+            self.nr_writes_alloc += 1
+
+        if self.cfg.hasRd and self.can_alloc_read():
+            self.ar_queue.enq(AxTask.customized(next(self.rd_stream), Channel.AR, cycle, self.cfg.timeout_threshold, self.name))
+            self.nr_reads_alloc += 1
+
+    def recv(self):
+        super().recv()
+
+        if not self.r_queue.is_empty():
+            if self.r_queue.popleft().flit.last:
+                self.nr_reads_done += 1
+
+        if not self.b_queue.is_empty():
+            self.b_queue.deq()
+            self.nr_writes_done += 1
+
+    def write_done(self, aw, b):
+        self.nr_writes_done += 1
+
+    def read_done(self, ar, r):
+        self.nr_reads_done += 1
+
+
+@dataclass
+class LoopbackStats:
+    cycles : int = 0
+    seconds: float = 0.0
+    beats  : Dict[Channel, int] = field(default_factory = lambda: {chnl: 0 for chnl in Channel})
+    writes_done: int = 0  # Completed transactions (B received / last R beat received).
+    reads_done : int = 0
+
+    def total_beats(self) -> int:
+        return sum(self.beats.values())
+
+    def resp_beats(self) -> int:
+        """
+        B and R beats, i.e. completed responses rather than requests that may still be outstanding.
+        """
+        return self.beats[Channel.B] + self.beats[Channel.R]
+
+    def beats_per_sec(self) -> float:
+        return self.total_beats() / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        per_chnl = ", ".join(f"{Channel.enum_to_str(chnl)} = {n}" for chnl, n in self.beats.items())
+        return (
+            f"[Loopback] {self.cycles} cycles in {self.seconds:.3f} s: "
+            f"{self.total_beats()} beats ({per_chnl}), "
+            f"{self.beats_per_sec():,.0f} beats/s, {self.cycles / self.seconds if self.seconds > 0 else 0.0:,.0f} cycles/s\n"
+            f"\tcompleted: {self.writes_done} writes, {self.reads_done} reads, "
+            f"{self.resp_beats()} B/R beats ({self.resp_beats() / self.seconds if self.seconds > 0 else 0.0:,.0f} beats/s)"
+        )
+
+
+class AxiLoopback:
+    """
+    Cycle-accurate master/slave loopback without a simulator.
+
+    The master and the slave bind the same signals of one MockDut, so the master's Axi4Bundle is wired
+    directly to the slave's. Since MockDut writes take effect immediately, `step()` reproduces the delta
+    ordering of a cocotb testbench explicitly: every agent drives, then every agent samples, then the clock ticks.
+    """
+    def __init__(
+            self,
+            cfg: AxiAgentCfg,
+            master_cls: Type[BaseAxiMaster] = LoopbackMaster,
+            slave_cls : Type[BaseAxiSlave]  = BaseAxiSlave,
+            dut = None,
+            monitor: bool = False
+    ) -> None:
+        self.dut = dut if dut is not None else mock_axi_dut(cfg)
+        self.mst = master_cls(self.dut, "mst", cfg)
+        self.slv = slave_cls (self.dut, "slv", cfg)
+
+        self.stats = LoopbackStats()
+        # Optional throughput/latency monitor on the shared bus (see PerfMonitor);
+        # it reuses the snapshots the agents take in sample_phase.
+        self.perf = PerfMonitor(self.mst.io, "loopback", cfg.busBytes, own_sampling = False) if monitor else None
+        self.io_by_chnl = [
+            (chnl, getattr(self.mst.io, Channel.enum_to_str(chnl).lower())) for chnl in Channel
+        ]
+
+    def step(self) -> None:
+        self.mst.drive_phase()
+        self.slv.drive_phase()
+
+        self.mst.sample_phase()
+        self.slv.sample_phase()
+
+        # Snapshots stay valid until the next drive_phase, so counting fires reads no signals.
+        beats = self.stats.beats
+        for chnl, io in self.io_by_chnl:
+            if io.fire():
+                beats[chnl] += 1
+        if self.perf is not None:
+            self.perf.sample()
+
+        self.dut.tick()
+        self.stats.cycles += 1
+
+    def run(self, cycles: int, max_beats: Optional[int] = None) -> LoopbackStats:
+        """
+        Step `cycles` clock cycles (or until `max_beats` beats have fired) and return the accumulated stats.
+        """
+        start = time.perf_counter()
+        for _ in range(cycles):
+            self.step()
+            if max_beats is not None and self.stats.total_beats() >= max_beats:
+                break
+        self.stats.seconds += time.perf_counter() - start
+        self.stats.writes_done = getattr(self.mst, "nr_writes_done", 0)
+        self.stats.reads_done  = getattr(self.mst, "nr_reads_done", 0)
+
+        return self.stats
@@ -0,0 +1,49 @@
+from typing import Dict, List, Optional
+
+from PyVeriUtils.protocol.AXI4.spec.Encodings import Channel
+from PyVeriUtils.utils.Common.BitPattern import BitPattern
+
+
+class Backpressure:
+    """
+    Per-channel ready and valid-gap patterns of one agent.
+
+    - `ready(chnl, cycle)`: the bit of the channel's ready pattern (1 if it has none). The agent ANDs it
+      with its own ready condition, e.g. a slave only accepts AW when its queue has room *and* the pattern allows.
+    - `gate_valid(chnl, cycle)`: whether the agent may start offering a transfer on a channel it drives.
+      A gap only delays the *start* of a transfer: once valid is asserted it stays asserted until
+      the handshake (`fired(chnl)`), as AXI requires.
+
+    Patterns are precomputed BitPatterns, usually shared by many agents; the per-agent state is
+    just the pending flag of each channel. `offset` shifts the patterns in time for this agent.
+    """
+    def __init__(
+            self,
+            ready : Optional[Dict[Channel, BitPattern]] = None,
+            valid : Optional[Dict[Channel, BitPattern]] = None,
+            offset: int = 0
+    ) -> None:
+        ready = ready or {}
+        valid = valid or {}
+        self.ready_of: List[Optional[BitPattern]] = [ready.get(chnl) for chnl in Channel]
+        self.valid_of: List[Optional[BitPattern]] = [valid.get(chnl) for chnl in Channel]
+        self.pending : List[bool] = [False] * len(Channel)
+        self.offset = offset
+
+    def ready(self, chnl: Channel, cycle: int) -> int:
+        pattern = self.ready_of[chnl.value]
+        return 1 if pattern is None else pattern[cycle + self.offset]
+
+    def gate_valid(self, chnl: Channel, cycle: int) -> bool:
+        """
+        Call only when the agent has a transfer to offer on `chnl`.
+        """
+        if self.pending[chnl.value]:
+            return True
+        pattern = self.valid_of[chnl.value]
+        allowed = pattern is None or pattern[cycle + self.offset] == 1
+        self.pending[chnl.value] = allowed
+        return allowed
+
+    def fired(self, chnl: Channel) -> None:
+        self.pending[chnl.value] = False
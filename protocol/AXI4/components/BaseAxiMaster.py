@@ -1,7 +1,13 @@
+from typing import Dict, List, Optional
+
+from PyVeriUtils.protocol.AXI4.components.Backpressure import Backpressure
 from PyVeriUtils.protocol.AXI4.components.Parameters import AxiAgentCfg
 from PyVeriUtils.protocol.AXI4.spec.DutBundle import Axi4Bundle
+from PyVeriUtils.protocol.AXI4.spec.Encodings import Channel
+from PyVeriUtils.protocol.AXI4.spec.Flit import BFlit, RBatch, RFlit
 from PyVeriUtils.protocol.AXI4.spec.Task import AxTask, WTask, RTask, BTask
 from PyVeriUtils.utils.Common.Queue import Queue
+from PyVeriUtils.utils.Common.TxnTracker import TxnTracker
 
 
 class BaseAxiMaster:
@@ -20,6 +26,17 @@ class BaseAxiMaster:
 
     This class is not meant to represent a fully featured AXI master,
     but rather to serve as a reusable and extensible base for more specialized agents.
+
+    Pipelined mode (`cfg.pipelined`):
+    - The AW/W/AR queues are `cfg.maxInflightTxns` deep and `can_alloc_write()`/`can_alloc_read()`
+      keep at most `cfg.maxInflightTxns` writes and reads in flight (queued or issued).
+    - W data is driven from its own queue, independently of AW, so it may go ahead of its address.
+    - B/R are always ready. Issued requests wait in per-ID trackers (`wr_tracker`/`rd_tracker`);
+      each B and each completed R burst (beats may interleave across IDs) is matched to the oldest
+      outstanding request of its ID and reported through `write_done()`/`read_done()`.
+
+    Backpressure (`cfg.readyPatterns`/`cfg.validPatterns`): B/R ready follow their ready patterns,
+    and a queued AW/W/AR transfer is only offered once its valid pattern allows it (see Backpressure).
     """
     def __init__(
             self,
@@ -31,17 +48,71 @@ class BaseAxiMaster:
         self.name = name
         self.cfg: AxiAgentCfg = cfg
         self.io = Axi4Bundle(dut, cfg.bundleCfg)
+        self.rng = cfg.make_rng(name)
+
+        # The depth doesn't need to be so large, ping-pong buffer is enough (unless pipelined).
+        req_depth = cfg.maxInflightTxns if cfg.pipelined else 2
+        self.aw_queue: Queue[AxTask] = Queue[AxTask](req_depth, f"{name}_aw")
+        self.w_queue : Queue[WTask ] = Queue[WTask ](req_depth, f"{name}_w" )
+        self.ar_queue: Queue[AxTask] = Queue[AxTask](req_depth, f"{name}_ar")
+
+        self.r_queue: Queue[RTask] = Queue[RTask](1, f"{name}_r")
+        self.b_queue: Queue[BTask] = Queue[BTask](1, f"{name}_b")
 
-        self.aw_queue: Queue[AxTask] = Queue[AxTask](2) # The depth doesn't need to be so large, ping-pong buffer is enough.
-        self.w_queue : Queue[WTask ] = Queue[WTask ](2)
-        self.ar_queue: Queue[AxTask] = Queue[AxTask](2)
+        # Pipelined mode: issued requests waiting for their response, and R beats of unfinished bursts per ID.
+        self.wr_tracker: TxnTracker[AxTask] = TxnTracker[AxTask](f"{name}_wr", cfg.maxInflightTxns)
+        self.rd_tracker: TxnTracker[AxTask] = TxnTracker[AxTask](f"{name}_rd", cfg.maxInflightTxns)
+        self.r_beats: Dict[int, List[RFlit]] = {}
 
-        self.r_queue: Queue[RTask] = Queue[RTask](1)
-        self.b_queue: Queue[BTask] = Queue[BTask](1)
+        self.bp: Optional[Backpressure] = None
+        if cfg.readyPatterns or cfg.validPatterns:
+            self.bp = Backpressure(cfg.readyPatterns, cfg.validPatterns)
+
+        # The clock cycle, read once at the start of each phase (see drive_phase()/sample_phase()).
+        self.cycle = 0
+        # queues() as a tuple, built on the first tick_queues() so that subclasses may add queues after __init__.
+        self.queue_list: Optional[tuple] = None
 
     def req_alloc(self):
         pass
 
+    def can_alloc_write(self) -> bool:
+        """
+        Whether `req_alloc()` may queue another write (AW + W), respecting maxInflightTxns in pipelined mode.
+        """
+        if self.aw_queue.is_full() or self.w_queue.is_full():
+            return False
+        return not self.cfg.pipelined or len(self.aw_queue) + len(self.wr_tracker) < self.cfg.maxInflightTxns
+
+    def can_alloc_read(self) -> bool:
+        if self.ar_queue.is_full():
+            return False
+        return not self.cfg.pipelined or len(self.ar_queue) + len(self.rd_tracker) < self.cfg.maxInflightTxns
+
+    def write_done(self, aw: AxTask, b: BFlit) -> None:
+        """
+        Pipelined mode: called when the B response of `aw` arrives. Override to check or count responses.
+        """
+        pass
+
+    def read_done(self, ar: AxTask, r: RBatch) -> None:
+        """
+        Pipelined mode: called when the last R beat of `ar` arrives, with all its beats in `r`.
+        """
+        pass
+
+    def rx_ready(self, chnl: Channel) -> int:
+        """
+        The ready pattern bit of `chnl` in the current cycle (1 without backpressure).
+        """
+        return 1 if self.bp is None else self.bp.ready(chnl, self.cycle)
+
+    def tx_allowed(self, chnl: Channel) -> bool:
+        """
+        Whether a queued transfer may be offered on `chnl` in the current cycle (always without backpressure).
+        """
+        return self.bp is None or self.bp.gate_valid(chnl, self.cycle)
+
     def set_rx_ready(self):
         """
         By default, as long as the B/R channel Queue has available slots
@@ -51,31 +122,40 @@ class BaseAxiMaster:
         However, subclasses can implement customized handling,
         such as introducing delays or other logic modifications.
         """
-        self.io.b.ready.value = int(not self.b_queue.is_full())
-        self.io.r.ready.value = int(not self.r_queue.is_full())
+        if self.cfg.pipelined:
+            self.io.b.ready.value = self.rx_ready(Channel.B)
+            self.io.r.ready.value = self.rx_ready(Channel.R)
+            return
+
+        self.io.b.ready.value = int(not self.b_queue.is_full()) & self.rx_ready(Channel.B)
+        self.io.r.ready.value = int(not self.r_queue.is_full()) & self.rx_ready(Channel.R)
 
     def send(self):
-        if not self.aw_queue.is_empty():
+        if not self.aw_queue.is_empty() and self.tx_allowed(Channel.AW):
             self.io.aw.send(self.aw_queue.peek())
         else:
             self.io.aw.valid.value = 0
 
-        if not self.w_queue.is_empty():
+        if not self.w_queue.is_empty() and self.tx_allowed(Channel.W):
             self.io.w.send(self.w_queue.peek())
         else:
             self.io.w.valid.value = 0
 
-        if not self.aw_queue.is_empty():
+        if not self.ar_queue.is_empty() and self.tx_allowed(Channel.AR):
             self.io.ar.send(self.ar_queue.peek())
         else:
             self.io.ar.valid.value = 0
 
     def recv(self):
+        if self.cfg.pipelined:
+            self.recv_pipelined()
+            return
+
         if self.io.r.fire():
             self.r_queue.enq(
                 RTask.recv(
                     bdl = self.io.r,
-                    alloc_cycle = self.dut.cycles.value.integer,
+                    alloc_cycle = self.cycle,
                     timeout_threshold = self.cfg.timeout_threshold,
                     label = self.name
             ))
@@ -84,13 +164,40 @@ class BaseAxiMaster:
             self.b_queue.enq(
                 BTask.recv(
                     bdl = self.io.b,
-                    alloc_cycle = self.dut.cycles.value.integer,
+                    alloc_cycle = self.cycle,
                     timeout_threshold = self.cfg.timeout_threshold,
                     label = self.name
             ))
 
+    def recv_pipelined(self):
+        if self.io.r.fire():
+            r = RFlit.recv(self.io.r)
+            beats = self.r_beats.get(r.id)
+            if beats is None:
+                beats = self.r_beats[r.id] = []
+            beats.append(r)
+
+            if r.last:
+                del self.r_beats[r.id]
+                self.read_done(
+                    self.rd_tracker.match(r.id),
+                    RBatch(r.id, [beat.data for beat in beats], r.resp, user = beats[0].user)
+                )
+
+        if self.io.b.fire():
+            b = BFlit.recv(self.io.b)
+            self.write_done(self.wr_tracker.match(b.id), b)
+
     def update_req(self):
+        if self.bp is not None:
+            for chnl, bdl in ((Channel.AW, self.io.aw), (Channel.W, self.io.w), (Channel.AR, self.io.ar)):
+                if bdl.fire():
+                    self.bp.fired(chnl)
+
         if self.io.aw.fire():
+            if self.cfg.pipelined:
+                aw = self.aw_queue.peek()
+                self.wr_tracker.push(aw.flit.id, aw)
             self.aw_queue.deq()
 
         if self.io.w.fire():
@@ -100,6 +207,9 @@ class BaseAxiMaster:
                 self.w_queue.peek().batch.beat_incr()
 
         if self.io.ar.fire():
+            if self.cfg.pipelined:
+                ar = self.ar_queue.peek()
+                self.rd_tracker.push(ar.flit.id, ar)
             self.ar_queue.deq()
 
     def drive_phase(self):
@@ -113,11 +223,15 @@ class BaseAxiMaster:
           - Task allocation (if any)
           - Driving valid signals for AW/W/AR channels
           - Asserting ready signals for B/R channels based on queue availability
+          - Flushing shadow registers (only when the bundle is in shadow-register mode)
         """
+        self.cycle = self.dut.cycles.value.integer
+        self.io.invalidate()
         self.req_alloc()
 
         self.send()
         self.set_rx_ready()
+        self.io.flush()
 
     def sample_phase(self):
         """
@@ -131,8 +245,33 @@ class BaseAxiMaster:
 
         This must follow the `drive_phase()` in the same simulation cycle.
         """
+        self.cycle = self.dut.cycles.value.integer
+        # Read every handshake and payload once; fire()/recv() below reuse the snapshot.
+        self.io.sample()
         self.recv()
         self.update_req()
+        self.tick_queues()
+
+    def queues(self):
+        return [self.aw_queue, self.w_queue, self.ar_queue, self.r_queue, self.b_queue]
+
+    def tick_queues(self):
+        if self.queue_list is None:
+            self.queue_list = tuple(self.queues())
+        Queue.tick_all(self.queue_list)
+
+    def queue_stats(self) -> str:
+        """
+        Occupancy statistics (high-water mark, full/empty cycles) of every queue,
+        e.g. to size aw_queue/w_queue from data.
+        """
+        return "\n".join(queue.stats() for queue in self.queues())
+
+    def nr_inflight(self) -> int:
+        """
+        Number of issued requests still waiting for their response (pipelined mode).
+        """
+        return len(self.wr_tracker) + len(self.rd_tracker)
 
 
 
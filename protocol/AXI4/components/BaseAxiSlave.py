@@ -1,7 +1,14 @@
+from typing import Optional
+
+from PyVeriUtils.protocol.AXI4.components.Backpressure import Backpressure
 from PyVeriUtils.protocol.AXI4.components.Parameters import AxiAgentCfg
+from PyVeriUtils.protocol.AXI4.components.RespScheduler import Latency, RespScheduler
+from PyVeriUtils.protocol.AXI4.spec.BurstGeometry import BurstGeometry
 from PyVeriUtils.protocol.AXI4.spec.DutBundle import Axi4Bundle
+from PyVeriUtils.protocol.AXI4.spec.Flit import AxFlit, RBatch, WFlit
 from PyVeriUtils.protocol.AXI4.spec.Task import AxTask, WTask, RTask, BTask
 from PyVeriUtils.utils.Common.Queue import Queue
+from PyVeriUtils.utils.HWComponents.SparseMemory import SparseMemory
 from PyVeriUtils.protocol.AXI4.spec.Encodings import Channel
 
 class BaseAxiSlave:
@@ -15,17 +22,18 @@ class BaseAxiSlave:
         self.name = name
         self.cfg: AxiAgentCfg = cfg
         self.io = Axi4Bundle(dut, cfg.bundleCfg)
+        self.rng = cfg.make_rng(name)
 
         # B/R response queues with no depth limit for simplicity.
         # Since AW/AR queues have bounded depth, the number of B/R tasks
         # will naturally remain small in practice.
-        self.r_queue: Queue[RTask] = Queue[RTask](depth = None)
-        self.b_queue: Queue[BTask] = Queue[BTask](depth = None)
+        self.r_queue: Queue[RTask] = Queue[RTask](depth = None, label = f"{name}_r")
+        self.b_queue: Queue[BTask] = Queue[BTask](depth = None, label = f"{name}_b")
 
         # AW/AR request queues used for response allocation.
         # Dequeued when the corresponding B/R response is allocated.
-        self.aw_queue: Queue[AxTask] = Queue[AxTask](2)
-        self.ar_queue: Queue[AxTask] = Queue[AxTask](2)
+        self.aw_queue: Queue[AxTask] = Queue[AxTask](2, f"{name}_aw")
+        self.ar_queue: Queue[AxTask] = Queue[AxTask](2, f"{name}_ar")
 
         # AW/AR check queues used for protocol checking.
         # Dequeued immediately after the request is checked.
@@ -33,38 +41,121 @@ class BaseAxiSlave:
         # Separate from aw/ar_queue to avoid premature removal of requests
         # that are still needed for allocating downstream responses,
         # especially when the response cannot be accepted immediately.
-        self.aw_check_queue: Queue[AxTask] = Queue[AxTask](2)
-        self.ar_check_queue: Queue[AxTask] = Queue[AxTask](2)
-        self.w_check_queue: Queue[WTask] = Queue[WTask](2)
+        self.aw_check_queue: Queue[AxTask] = Queue[AxTask](2, f"{name}_aw_check")
+        self.ar_check_queue: Queue[AxTask] = Queue[AxTask](2, f"{name}_ar_check")
+        self.w_check_queue: Queue[WTask] = Queue[WTask](2, f"{name}_w_check")
+
+        # Memory-backed mode: W beats are merged into `mem` and R data is read back from it.
+        # `w_beat`/`w_geom` track the burst currently being written (the one at the head of aw_queue).
+        self.mem = SparseMemory(size = cfg.memSize, name = f"{name}_mem") if cfg.memBacked else None
+        self.w_beat = 0
+        self.w_geom: Optional[BurstGeometry] = None
+
+        # Scheduled mode: B/R responses go through `sched` (latency, out-of-order across IDs, R interleaving)
+        # instead of r_queue/b_queue.
+        self.sched: Optional[RespScheduler] = None
+        if cfg.rLatency is not None or cfg.bLatency is not None or cfg.rInterleave:
+            self.sched = RespScheduler(
+                name = f"{name}_sched",
+                rng = self.rng,
+                r_latency = cfg.rLatency if cfg.rLatency is not None else Latency.fixed(0),
+                b_latency = cfg.bLatency if cfg.bLatency is not None else Latency.fixed(0),
+                interleave = cfg.rInterleave
+            )
+
+        # Backpressure: AW/W/AR ready follow their ready patterns, R/B are only offered when their valid patterns allow.
+        self.bp: Optional[Backpressure] = None
+        if cfg.readyPatterns or cfg.validPatterns:
+            self.bp = Backpressure(cfg.readyPatterns, cfg.validPatterns)
+
+        # The clock cycle, read once at the start of each phase (see drive_phase()/sample_phase()).
+        self.cycle = 0
+        # queues() as a tuple, built on the first tick_queues() so that subclasses may add queues after __init__.
+        self.queue_list: Optional[tuple] = None
+
+    def mem_write(self, w: WFlit) -> None:
+        """
+        Merge a W beat into `mem`, honoring its strobe and the addressing of its burst.
+        """
+        if self.w_beat == 0:
+            self.w_geom = BurstGeometry.of(self.aw_queue.peek().flit, self.cfg.busSize)
+
+        geom = self.w_geom
+        self.mem.write_int(geom.bus_addr(self.w_beat), w.data, self.cfg.busBytes, w.strb & geom.shape.strbs[self.w_beat])
+        self.w_beat = 0 if w.last else self.w_beat + 1
+
+    def mem_read(self, ar: AxFlit) -> RBatch:
+        """
+        Build the R data of `ar` from `mem`: the bus words spanned by the burst are read in one go
+        and every beat keeps only its own byte lanes.
+        """
+        bus_bytes = self.cfg.busBytes
+        geom = BurstGeometry.of(ar, self.cfg.busSize)
+
+        base, nr_bytes = geom.span()
+        span = memoryview(self.mem.read(base, nr_bytes))
+        skip = base - geom.base
+        datas = [
+            int.from_bytes(span[off - skip:off - skip + bus_bytes], "little") & bit_en
+            for off, bit_en in zip(geom.shape.bus_offsets, geom.shape.bit_ens)
+        ]
+
+        return RBatch(ar.id, datas)
 
     def resp_alloc(self):
         # Allocate B Channel response as long as the last beat fires.
-        if self.io.w.fire() and bool(self.io.w.bits.last.value):
+        if self.io.w.fire() and bool(self.io.w.snapshot().bits.last):
             assert not self.aw_queue.is_empty(), f"[{self.name} resp alloc error] Should be at least one aw task in aw queue!"
 
-            self.b_queue.enq(
-                BTask.random_gen(
-                    aw = self.aw_queue.peek().flit,
-                    alloc_cycle = self.dut.cycles.value.integer,
-                    timeout_threshold = self.cfg.timeout_threshold,
-                    label = self.name
-                )
+            b_task = BTask.random_gen(
+                aw = self.aw_queue.peek().flit,
+                alloc_cycle = self.cycle,
+                timeout_threshold = self.cfg.timeout_threshold,
+                label = self.name
             )
+            if self.sched is not None:
+                self.sched.push_b(b_task, b_task.alloc_cycle)
+            else:
+                self.b_queue.enq(b_task)
             self.aw_queue.deq()
 
         if not self.ar_queue.is_empty():
-            self.r_queue.enq(
-                RTask.random_gen(
-                    ar = self.ar_queue.peek().flit,
+            ar = self.ar_queue.peek().flit
+            if self.mem is not None:
+                r_task = RTask.customized(
+                    batch = self.mem_read(ar),
+                    alloc_cycle = self.cycle,
+                    timeout_threshold = self.cfg.timeout_threshold,
+                    label = self.name
+                )
+            else:
+                r_task = RTask.random_gen(
+                    ar = ar,
                     maxDataBytes = self.cfg.maxDataBytes,
                     busSize = self.cfg.busSize,
-                    alloc_cycle = self.dut.cycles.value.integer,
+                    alloc_cycle = self.cycle,
                     timeout_threshold = self.cfg.timeout_threshold,
-                    label = self.name
+                    label = self.name,
+                    rng = self.rng
                 )
-            )
+            if self.sched is not None:
+                self.sched.push_r(r_task, r_task.alloc_cycle)
+            else:
+                self.r_queue.enq(r_task)
             self.ar_queue.deq()
 
+    def rx_ready(self, chnl: Channel) -> int:
+        """
+        The ready pattern bit of `chnl` in the current cycle (1 without backpressure).
+        """
+        return 1 if self.bp is None else self.bp.ready(chnl, self.cycle)
+
+    def tx_allowed(self, chnl: Channel) -> bool:
+        """
+        Whether a pending response may be offered on `chnl` in the current cycle (always without backpressure).
+        """
+        return self.bp is None or self.bp.gate_valid(chnl, self.cycle)
+
     def set_rx_ready(self):
         """
         By default, as long as the AW/AR/R channel Queue has available slots
@@ -78,23 +169,56 @@ class BaseAxiSlave:
         # we expect the check_queue to perpetually maintain available slots.
         # Therefore, the assertion of the ready signals for the aw/ar channels
         # does not depend on whether the check_queue is full.
-        self.io.aw.ready.value = int(not self.aw_queue.is_full())
-        self.io.w .ready.value = int(not self.w_check_queue.is_full() and not self.aw_queue.is_empty())
-        self.io.ar.ready.value = int(not self.ar_queue.is_full())
+        self.io.aw.ready.value = int(not self.aw_queue.is_full()) & self.rx_ready(Channel.AW)
+        self.io.w .ready.value = int(not self.w_check_queue.is_full() and not self.aw_queue.is_empty()) & self.rx_ready(Channel.W)
+        self.io.ar.ready.value = int(not self.ar_queue.is_full()) & self.rx_ready(Channel.AR)
 
     # TODO: decouple tx valid set from send.
     def send(self):
-        if not self.r_queue.is_empty():
+        if self.sched is not None:
+            self.send_scheduled()
+            return
+
+        if not self.r_queue.is_empty() and self.tx_allowed(Channel.R):
             self.io.r.send(self.r_queue.peek())
         else:
             self.io.r.valid.value = 0
 
-        if not self.b_queue.is_empty():
+        if not self.b_queue.is_empty() and self.tx_allowed(Channel.B):
             self.io.b.send(self.b_queue.peek())
         else:
             self.io.b.valid.value = 0
 
+    def send_scheduled(self):
+        sched = self.sched
+        sched.advance(self.cycle)
+
+        r_task = sched.r_head()
+        if r_task is not None and self.tx_allowed(Channel.R):
+            self.io.r.send(r_task)
+        else:
+            self.io.r.valid.value = 0
+
+        b_task = sched.b_head()
+        if b_task is not None and self.tx_allowed(Channel.B):
+            self.io.b.send(b_task)
+        else:
+            self.io.b.valid.value = 0
+
     def update_resp(self):
+        if self.bp is not None:
+            if self.io.r.fire():
+                self.bp.fired(Channel.R)
+            if self.io.b.fire():
+                self.bp.fired(Channel.B)
+
+        if self.sched is not None:
+            if self.io.r.fire():
+                self.sched.r_fired()
+            if self.io.b.fire():
+                self.sched.b_fired()
+            return
+
         if self.io.r.fire():
             if self.r_queue.peek().batch.last():
                 self.r_queue.deq()
@@ -109,7 +233,7 @@ class BaseAxiSlave:
             aw_task = AxTask.recv(
                 bdl = self.io.aw,
                 channel = Channel.AW,
-                alloc_cycle = self.dut.cycles.value.integer,
+                alloc_cycle = self.cycle,
                 timeout_threshold = self.cfg.timeout_threshold,
                 label = self.name
             )
@@ -117,20 +241,21 @@ class BaseAxiSlave:
             self.aw_check_queue.enq(aw_task)
 
         if self.io.w.fire():
-            self.w_check_queue.enq(
-                WTask.recv(
-                    bdl = self.io.w,
-                    alloc_cycle = self.dut.cycles.value.integer,
-                    timeout_threshold = self.cfg.timeout_threshold,
-                    label = self.name
-                )
+            w_task = WTask.recv(
+                bdl = self.io.w,
+                alloc_cycle = self.cycle,
+                timeout_threshold = self.cfg.timeout_threshold,
+                label = self.name
             )
+            self.w_check_queue.enq(w_task)
+            if self.mem is not None:
+                self.mem_write(w_task.flit)
 
         if self.io.ar.fire():
             ar_task = AxTask.recv(
                 bdl = self.io.ar,
                 channel = Channel.AR,
-                alloc_cycle = self.dut.cycles.value.integer,
+                alloc_cycle = self.cycle,
                 timeout_threshold = self.cfg.timeout_threshold,
                 label = self.name
             )
@@ -156,9 +281,13 @@ class BaseAxiSlave:
 
           - Asserting ready signals for AW/AR/W channels based on queue availability.
           - Driving valid signals for B/R responses, if there are responses ready to send.
+          - Flushing shadow registers (only when the bundle is in shadow-register mode).
         """
+        self.cycle = self.dut.cycles.value.integer
+        self.io.invalidate()
         self.set_rx_ready()
         self.send()
+        self.io.flush()
 
     def sample_phase(self):
         """
@@ -172,9 +301,30 @@ class BaseAxiSlave:
 
         This phase should always follow `drive_phase()` within the same simulation step.
         """
+        self.cycle = self.dut.cycles.value.integer
+        # Read every handshake and payload once; fire()/recv() below reuse the snapshot.
+        self.io.sample()
         self.recv()
         # Unlike master, resp_alloc() should be in sample_phase in slave,
         # because it depends on handshake signals to decide whether to allocate or not.
         self.resp_alloc()
         self.update_resp()
         self.check()
+        self.tick_queues()
+
+    def queues(self):
+        return [
+            self.aw_queue, self.ar_queue, self.r_queue, self.b_queue,
+            self.aw_check_queue, self.ar_check_queue, self.w_check_queue
+        ]
+
+    def tick_queues(self):
+        if self.queue_list is None:
+            self.queue_list = tuple(self.queues())
+        Queue.tick_all(self.queue_list)
+
+    def queue_stats(self) -> str:
+        """
+        Occupancy statistics (high-water mark, full/empty cycles) of every queue.
+        """
+        return "\n".join(queue.stats() for queue in self.queues())
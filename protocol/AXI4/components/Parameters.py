@@ -1,8 +1,11 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Dict, Optional
 import math
+import random
 
 from PyVeriUtils.protocol.AXI4.spec.DutBundle import AxiBundleCfg
+from PyVeriUtils.protocol.AXI4.spec.Encodings import Channel
+from PyVeriUtils.utils.Common.BitPattern import BitPattern
 
 
 class AxiAgentCfg:
@@ -17,7 +20,16 @@ class AxiAgentCfg:
         hasRd: bool = True,
         maxDataBytes: Optional[int] = 2,
         bundleCfg: AxiBundleCfg = AxiBundleCfg(),
-        timeout_threshold: int = 10000
+        timeout_threshold: int = 10000,
+        memBacked: bool = False,
+        memSize: int = 1 << 40,
+        seed: Optional[int] = None,
+        pipelined: bool = False,
+        rLatency: Optional[Callable[[random.Random], int]] = None,
+        bLatency: Optional[Callable[[random.Random], int]] = None,
+        rInterleave: bool = False,
+        readyPatterns: Optional[Dict[Channel, BitPattern]] = None,
+        validPatterns: Optional[Dict[Channel, BitPattern]] = None
     ):
         self.agentId = agentId
         self.busBits = busBits
@@ -35,4 +47,40 @@ class AxiAgentCfg:
         self.bundleCfg = bundleCfg
         self.timeout_threshold = timeout_threshold
 
+        # Slave only: keep written data in a sparse memory of memSize bytes and serve reads from it,
+        # instead of dropping W data and generating random R data.
+        self.memBacked = memBacked
+        self.memSize = memSize
+
+        # Master only: keep up to maxInflightTxns transactions in flight, with responses matched per ID
+        # in trackers instead of going through depth-1 B/R queues.
+        self.pipelined = pipelined
+
+        # Slave only: schedule B/R responses with per-transaction latencies drawn from these models
+        # (see RespScheduler.Latency), completing out of order across IDs and, with rInterleave,
+        # interleaving R beats of different IDs. None of them set: responses go out in order with no latency.
+        self.rLatency = rLatency
+        self.bLatency = bLatency
+        self.rInterleave = rInterleave
+
+        # Backpressure (see Backpressure): per-channel precomputed patterns, indexed by cycle.
+        # readyPatterns gate the ready of the channels an agent receives (B/R for a master, AW/W/AR for a slave);
+        # validPatterns delay the start of the transfers it drives. Channels without a pattern are not throttled.
+        self.readyPatterns = readyPatterns
+        self.validPatterns = validPatterns
+
+        # Seed of the random generators of the agents built from this cfg (None: seeded from the OS).
+        self.seed = seed
+
+    def make_rng(self, stream: str) -> random.Random:
+        """
+        Random generator for one agent (`stream` is usually the agent name).
+
+        Seeded from (seed, agentId, stream), so a seeded run is reproducible and agents sharing a cfg
+        still draw independent streams.
+        """
+        if self.seed is None:
+            return random.Random()
+        return random.Random(f"{self.seed}/{self.agentId}/{stream}")
+
 
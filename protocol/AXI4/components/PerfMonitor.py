@@ -0,0 +1,238 @@
+from array import array
+from typing import List, Optional, Tuple
+
+from PyVeriUtils.protocol.AXI4.spec.DutBundle import Axi4Bundle
+from PyVeriUtils.protocol.AXI4.spec.Encodings import Channel
+from PyVeriUtils.signals.Hardware.signalBinding import Snapshot
+from PyVeriUtils.utils.Common.Histogram import Histogram
+from PyVeriUtils.utils.Common.TxnTracker import TxnTracker
+
+CHNL_NAMES = [Channel.enum_to_str(chnl).lower() for chnl in Channel]
+
+# Columns of one time-series window.
+COLUMNS = (
+    ["cycle", "cycles"]
+    + [f"{name}_beats" for name in CHNL_NAMES]
+    + [f"{name}_stalls" for name in CHNL_NAMES]
+    + ["wr_outstanding_sum", "wr_outstanding_max", "rd_outstanding_sum", "rd_outstanding_max"]
+)
+NR_COLUMNS = len(COLUMNS)
+
+
+class PerfMonitor:
+    """
+    Passive throughput and latency monitor of an Axi4Bundle.
+
+    Call `sample()` once per cycle, in sample_phase; each call counts as one cycle. The monitor never drives a signal.
+    By default it samples the bundle itself on every call, into snapshots of its own (the agents' `io.snap`
+    is left untouched). With `own_sampling = False` it reuses the snapshots the agents took this cycle
+    (so it reads no extra valid/ready); the caller then owns sampling, and a
+    missing snapshot (e.g. `sample()` called after the next drive_phase invalidated it) is an error.
+    Per channel, it counts:
+    - beats: cycles with valid && ready;
+    - stalls: cycles with valid && !ready.
+    AW->B and AR->last R latencies are matched per ID (as AXI orders responses within an ID)
+    and recorded in fixed-bin Histograms; the numbers of outstanding writes and reads are tracked each cycle.
+
+    Memory does not grow with the run length: counters are folded every `window` cycles into a ring
+    of the last `keep_windows` windows (array-backed), which `series()`/`export_csv()` return.
+    With `series_path`, every window is also appended to that CSV file as it closes, for the full time series.
+    Only the start cycles of outstanding transactions are kept, which the DUT bounds.
+    """
+    def __init__(
+            self,
+            io           : Axi4Bundle,
+            name         : str = "perf",
+            bus_bytes    : Optional[int] = None,
+            window       : int = 1024,
+            keep_windows : int = 4096,
+            lat_bins     : int = 1024,
+            lat_bin_width: int = 1,
+            series_path  : Optional[str] = None,
+            own_sampling : bool = True
+    ) -> None:
+        assert window > 0 and keep_windows > 0, f"{name}: window and keep_windows must be positive"
+
+        self.name = name
+        self.bus_bytes = bus_bytes
+        self.window = window
+        self.keep_windows = keep_windows
+        self.own_sampling = own_sampling
+
+        self.chnls = [
+            (chnl, getattr(io, CHNL_NAMES[chnl.value]))
+            for chnl in Channel if getattr(io, CHNL_NAMES[chnl.value]) is not None
+        ]
+
+        self.cycles = 0
+        self.beats  = [0] * len(Channel)  # Totals of the closed windows.
+        self.stalls = [0] * len(Channel)
+
+        # Current window.
+        self.win_start  = 0
+        self.win_left   = window
+        self.win_beats  = [0] * len(Channel)
+        self.win_stalls = [0] * len(Channel)
+        self.win_wr_sum = self.win_wr_max = 0
+        self.win_rd_sum = self.win_rd_max = 0
+
+        # Start cycle of every outstanding write/read, per ID.
+        self.wr_start: TxnTracker[int] = TxnTracker[int](f"{name}_wr")
+        self.rd_start: TxnTracker[int] = TxnTracker[int](f"{name}_rd")
+        self.wr_latency = Histogram(lat_bins, lat_bin_width, name = f"{name} AW->B latency")
+        self.rd_latency = Histogram(lat_bins, lat_bin_width, name = f"{name} AR->R latency")
+        self.nr_unmatched = 0  # Responses without a request, e.g. when the monitor is attached mid-run.
+
+        self.wr_outstanding_sum = self.wr_outstanding_max = 0
+        self.rd_outstanding_sum = self.rd_outstanding_max = 0
+
+        self.series_ring = array("Q", bytes(8 * keep_windows * NR_COLUMNS))
+        self.nr_windows = 0
+
+        self.series_file = None
+        if series_path is not None:
+            self.series_file = open(series_path, "w")
+            self.series_file.write(",".join(COLUMNS) + "\n")
+
+    def sample(self) -> None:
+        cycle = self.cycles
+        for chnl, io in self.chnls:
+            if self.own_sampling:
+                # Not io.sample(): that would refill the snapshot the agent on this bundle is using.
+                snap = Snapshot(bool(io.valid.value), bool(io.ready.value), io.bits)
+            else:
+                snap = io.snap
+                assert snap is not None, f"{self.name}: {CHNL_NAMES[chnl.value]} was not sampled this cycle"
+            if not snap.valid:
+                continue
+            if not snap.ready:
+                self.win_stalls[chnl.value] += 1
+                continue
+
+            self.win_beats[chnl.value] += 1
+            # Raw handle values: IDs go through int() before keying the trackers.
+            if chnl is Channel.AW:
+                self.wr_start.push(int(getattr(snap.bits, "id", 0)), cycle)
+            elif chnl is Channel.B:
+                self.complete(self.wr_start, self.wr_latency, int(getattr(snap.bits, "id", 0)), cycle)
+            elif chnl is Channel.AR:
+                self.rd_start.push(int(getattr(snap.bits, "id", 0)), cycle)
+            elif chnl is Channel.R and bool(snap.bits.last):
+                self.complete(self.rd_start, self.rd_latency, int(getattr(snap.bits, "id", 0)), cycle)
+
+        wr, rd = len(self.wr_start), len(self.rd_start)
+        self.win_wr_sum += wr
+        self.win_rd_sum += rd
+        if wr > self.win_wr_max:
+            self.win_wr_max = wr
+        if rd > self.win_rd_max:
+            self.win_rd_max = rd
+
+        self.cycles += 1
+        self.win_left -= 1
+        if self.win_left == 0:
+            self.close_window()
+
+    def complete(self, starts: TxnTracker[int], hist: Histogram, id: int, cycle: int) -> None:
+        if starts.peek(id) is None:
+            self.nr_unmatched += 1
+            return
+        hist.add(cycle - starts.match(id))
+
+    def close_window(self) -> None:
+        """
+        Fold the current window into the totals and the time series, and start a new one.
+        Called every `window` cycles; call it once more at the end of a run to keep the last partial window.
+        """
+        nr_cycles = self.cycles - self.win_start
+        if nr_cycles == 0:
+            return
+
+        row = [self.win_start, nr_cycles, *self.win_beats, *self.win_stalls,
+               self.win_wr_sum, self.win_wr_max, self.win_rd_sum, self.win_rd_max]
+        off = (self.nr_windows % self.keep_windows) * NR_COLUMNS
+        self.series_ring[off:off + NR_COLUMNS] = array("Q", row)
+        self.nr_windows += 1
+        if self.series_file is not None:
+            self.series_file.write(",".join(map(str, row)) + "\n")
+
+        for c in range(len(Channel)):
+            self.beats [c] += self.win_beats [c]
+            self.stalls[c] += self.win_stalls[c]
+        self.wr_outstanding_sum += self.win_wr_sum
+        self.rd_outstanding_sum += self.win_rd_sum
+        self.wr_outstanding_max = max(self.wr_outstanding_max, self.win_wr_max)
+        self.rd_outstanding_max = max(self.rd_outstanding_max, self.win_rd_max)
+
+        self.win_start  = self.cycles
+        self.win_left   = self.window
+        self.win_beats  = [0] * len(Channel)
+        self.win_stalls = [0] * len(Channel)
+        self.win_wr_sum = self.win_wr_max = 0
+        self.win_rd_sum = self.win_rd_max = 0
+
+    def series(self) -> List[Tuple[int, ...]]:
+        """
+        The kept windows, oldest first, as tuples in COLUMNS order.
+        """
+        first = max(0, self.nr_windows - self.keep_windows)
+        rows = []
+        for n in range(first, self.nr_windows):
+            off = (n % self.keep_windows) * NR_COLUMNS
+            rows.append(tuple(self.series_ring[off:off + NR_COLUMNS]))
+        return rows
+
+    def export_csv(self, path: str) -> None:
+        with open(path, "w") as f:
+            f.write(",".join(COLUMNS) + "\n")
+            for row in self.series():
+                f.write(",".join(map(str, row)) + "\n")
+
+    def total_beats(self, chnl: Channel) -> int:
+        return self.beats[chnl.value] + self.win_beats[chnl.value]
+
+    def total_stalls(self, chnl: Channel) -> int:
+        return self.stalls[chnl.value] + self.win_stalls[chnl.value]
+
+    def utilization(self, chnl: Channel) -> float:
+        """
+        Beats per cycle of `chnl` (1.0 is a transfer every cycle).
+        """
+        return self.total_beats(chnl) / self.cycles if self.cycles else 0.0
+
+    def summary(self) -> str:
+        cycles = max(self.cycles, 1)
+        lines = [f"{self.name}: {self.cycles} cycles"]
+        for chnl, _ in self.chnls:
+            beats, stalls = self.total_beats(chnl), self.total_stalls(chnl)
+            line = (
+                f"\t{CHNL_NAMES[chnl.value]:>2}: {beats} beats, {beats / cycles:.3f} beats/cycle, "
+                f"{stalls} stall cycles ({stalls / max(beats + stalls, 1):.1%} of valid cycles)"
+            )
+            if self.bus_bytes is not None and Channel.is_data_chnl(chnl):
+                line += f", {beats * self.bus_bytes / cycles:.1f} B/cycle"
+            lines.append(line)
+
+        wr_sum = self.wr_outstanding_sum + self.win_wr_sum
+        rd_sum = self.rd_outstanding_sum + self.win_rd_sum
+        lines.append(
+            f"\toutstanding: writes avg {wr_sum / cycles:.1f} max {max(self.wr_outstanding_max, self.win_wr_max)}, "
+            f"reads avg {rd_sum / cycles:.1f} max {max(self.rd_outstanding_max, self.win_rd_max)}"
+        )
+        lines.append(f"\t{self.wr_latency}")
+        lines.append(f"\t{self.rd_latency}")
+        if self.nr_unmatched:
+            lines.append(f"\t{self.nr_unmatched} responses without a recorded request")
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        """
+        Close the last partial window and the series file.
+        """
+        self.close_window()
+        if self.series_file is not None:
+            self.series_file.close()
+            self.series_file = None
+
+    def __str__(self) -> str:
+        return self.summary()
@@ -0,0 +1,176 @@
+import heapq
+import random
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from PyVeriUtils.protocol.AXI4.spec.Task import BTask, RTask
+
+LatencyModel = Callable[[random.Random], int]
+
+
+class Latency:
+    """
+    Factories of per-transaction latency distributions: each returns a function drawing a latency
+    (in cycles) from the agent's random generator.
+    """
+    @staticmethod
+    def fixed(cycles: int) -> LatencyModel:
+        return lambda rng: cycles
+
+    @staticmethod
+    def uniform(lo: int, hi: int) -> LatencyModel:
+        return lambda rng: rng.randint(lo, hi)
+
+    @staticmethod
+    def exponential(base: int, mean_extra: float, cap: Optional[int] = None) -> LatencyModel:
+        """
+        `base` cycles plus an exponential tail of mean `mean_extra` (optionally capped), e.g. a DRAM-like
+        fixed access time plus queuing delay.
+        """
+        def draw(rng: random.Random) -> int:
+            extra = int(rng.expovariate(1.0 / mean_extra)) if mean_extra > 0 else 0
+            return base + (extra if cap is None else min(extra, cap))
+        return draw
+
+    @staticmethod
+    def choice(values: Sequence[int], weights: Optional[Sequence[float]] = None) -> LatencyModel:
+        """
+        Empirical distribution: one of `values`, with the given relative `weights`.
+        """
+        cum_weights = None
+        if weights is not None:
+            cum_weights, total = [], 0.0
+            for w in weights:
+                total += w
+                cum_weights.append(total)
+        return lambda rng: rng.choices(values, cum_weights = cum_weights)[0]
+
+
+class RespScheduler:
+    """
+    Schedules the B/R responses of a slave with per-transaction latency.
+
+    Every response is pushed with a deadline (`now + latency`) into a heap, so a cycle costs
+    O(log n) per response that becomes due, whatever the number of outstanding responses.
+
+    Ordering follows AXI4: responses of one ID complete in request order (a response is never due before
+    the previous one of its ID), while different IDs complete out of order, as their deadlines fall.
+
+    R bursts that are due wait in per-ID FIFOs; only the oldest burst of each ID is active.
+    With `interleave`, the active bursts of different IDs take turns beat by beat (round robin),
+    otherwise a burst keeps the bus until its last beat.
+
+    The beat or response offered on the bus stays the same until it is accepted (`r_fired()`/`b_fired()`),
+    so valid/payload never change while the master stalls.
+
+    IDs and latencies are converted with int() when pushed, so tasks built from raw handle values
+    (not hashable with cocotb) can still key the per-ID state.
+    """
+    def __init__(
+            self,
+            name      : str,
+            rng       : random.Random,
+            r_latency : LatencyModel = Latency.fixed(0),
+            b_latency : LatencyModel = Latency.fixed(0),
+            interleave: bool = False
+    ) -> None:
+        self.name = name
+        self.rng = rng
+        self.r_latency = r_latency
+        self.b_latency = b_latency
+        self.interleave = interleave
+
+        self.seq = 0  # Tie-breaker keeping heap entries with equal deadlines in push order.
+
+        self.r_heap: List[Tuple[int, int, int, RTask]] = []
+        self.r_due_at: Dict[int, int] = {}  # ID -> deadline of its youngest R burst.
+        self.r_ready: Dict[int, Deque[RTask]] = {}
+        self.r_turns: Deque[int] = deque()  # IDs with due bursts; the front one owns the bus.
+        self.r_cur: Optional[RTask] = None
+
+        self.b_heap: List[Tuple[int, int, BTask]] = []
+        self.b_due_at: Dict[int, int] = {}
+        self.b_ready: Deque[BTask] = deque()
+
+        self.nr_outstanding  = 0  # Responses scheduled but not fully sent yet.
+        self.max_outstanding = 0
+
+    def push_r(self, task: RTask, now: int) -> None:
+        id = int(task.batch.id)
+        due = max(now + int(self.r_latency(self.rng)), self.r_due_at.get(id, 0))
+        self.r_due_at[id] = due
+        self.seq += 1
+        heapq.heappush(self.r_heap, (due, self.seq, id, task))
+        self._count_push()
+
+    def push_b(self, task: BTask, now: int) -> None:
+        id = int(task.flit.id)
+        due = max(now + int(self.b_latency(self.rng)), self.b_due_at.get(id, 0))
+        self.b_due_at[id] = due
+        self.seq += 1
+        heapq.heappush(self.b_heap, (due, self.seq, task))
+        self._count_push()
+
+    def advance(self, now: int) -> None:
+        """
+        Release every response whose deadline has come. Call once per cycle before `r_head()`/`b_head()`.
+        """
+        r_heap = self.r_heap
+        while r_heap and r_heap[0][0] <= now:
+            _, _, id, task = heapq.heappop(r_heap)
+            fifo = self.r_ready.get(id)
+            if fifo is None:
+                fifo = self.r_ready[id] = deque()
+            if not fifo:
+                self.r_turns.append(id)
+            fifo.append(task)
+
+        b_heap = self.b_heap
+        while b_heap and b_heap[0][0] <= now:
+            self.b_ready.append(heapq.heappop(b_heap)[2])
+
+    def r_head(self) -> Optional[RTask]:
+        """
+        The R burst whose current beat should be driven, or None.
+        """
+        if self.r_cur is None and self.r_turns:
+            self.r_cur = self.r_ready[self.r_turns[0]][0]
+        return self.r_cur
+
+    def r_fired(self) -> None:
+        """
+        The beat offered by `r_head()` was accepted.
+        """
+        task = self.r_cur
+        self.r_cur = None
+        id = self.r_turns.popleft()
+
+        if task.batch.last():
+            fifo = self.r_ready[id]
+            fifo.popleft()
+            self.nr_outstanding -= 1
+            if fifo:
+                self.r_turns.append(id)
+            else:
+                del self.r_ready[id]
+        else:
+            task.batch.beat_incr()
+            if self.interleave:
+                self.r_turns.append(id)
+            else:
+                self.r_turns.appendleft(id)
+
+    def b_head(self) -> Optional[BTask]:
+        return self.b_ready[0] if self.b_ready else None
+
+    def b_fired(self) -> None:
+        self.b_ready.popleft()
+        self.nr_outstanding -= 1
+
+    def _count_push(self) -> None:
+        self.nr_outstanding += 1
+        if self.nr_outstanding > self.max_outstanding:
+            self.max_outstanding = self.nr_outstanding
+
+    def stats(self) -> str:
+        return f"{self.name}: {self.nr_outstanding} outstanding responses (max {self.max_outstanding})"
@@ -0,0 +1,41 @@
+"""
+    A self-sampling PerfMonitor against one reusing the agents' snapshots: both count the same beats
+    and latencies, and sampling on its own leaves the snapshots the agents hold untouched
+    (nor does it install one when drive_phase has dropped them).
+"""
+from PyVeriUtils.protocol.AXI4.components.AxiLoopback import AxiLoopback
+from PyVeriUtils.protocol.AXI4.components.Parameters import AxiAgentCfg
+from PyVeriUtils.protocol.AXI4.components.PerfMonitor import CHNL_NAMES, PerfMonitor
+from PyVeriUtils.protocol.AXI4.spec.Encodings import Channel
+
+
+def make_loopback():
+    lb = AxiLoopback(AxiAgentCfg("lb", 0, seed = 5, pipelined = True, maxInflightTxns = 8), monitor = True)
+    return lb, PerfMonitor(lb.mst.io, "own"), [getattr(lb.mst.io, name) for name in CHNL_NAMES]
+
+
+def test_own_sampling_matches_shared_snapshots():
+    lb, own, ios = make_loopback()
+
+    for _ in range(3000):
+        lb.step()
+        snaps = [(io.snap, io.snap.valid, io.snap.ready, io.snap.record) for io in ios]
+        own.sample()
+        assert [(io.snap, io.snap.valid, io.snap.ready, io.snap.record) for io in ios] == snaps
+
+    for chnl in Channel:
+        assert own.total_beats(chnl) == lb.perf.total_beats(chnl) > 0, chnl
+        assert own.total_stalls(chnl) == lb.perf.total_stalls(chnl), chnl
+    assert own.wr_latency.bins() == lb.perf.wr_latency.bins()
+    assert own.rd_latency.bins() == lb.perf.rd_latency.bins()
+
+
+def test_own_sampling_installs_no_snapshot():
+    lb, own, ios = make_loopback()
+    lb.run(100)
+
+    lb.mst.drive_phase()
+    lb.slv.drive_phase()
+    assert all(io.snap is None for io in ios)
+    own.sample()
+    assert all(io.snap is None for io in ios), "the monitor installed a snapshot during drive_phase"
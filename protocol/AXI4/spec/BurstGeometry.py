@@ -0,0 +1,154 @@
+from functools import lru_cache
+from typing import List, NamedTuple, Tuple
+
+from PyVeriUtils.protocol.AXI4.spec.Encodings import BurstType
+from PyVeriUtils.utils.Common.BitUtils import BitUtils
+
+# Legal WRAP burst lengths (len field, i.e. beats - 1).
+WRAP_LENS = (1, 3, 7, 15)
+
+# No INCR burst may cross a boundary of this many bytes (AXI4 A3.4.1).
+BOUNDARY_BYTES = 1 << 12
+
+
+class BurstShape(NamedTuple):
+    """
+    Per-beat placement of a burst, relative to the `base` of its BurstGeometry.
+
+    Attributes:
+        offsets    : Address of each beat minus base.
+        bus_offsets: Bus-aligned address of each beat minus base.
+        lanes      : Lowest byte lane each beat occupies on the bus.
+        strbs      : Byte lanes each beat occupies, as a strobe mask.
+        bit_ens    : `strbs` expanded to bit-enables.
+        bus_bytes  : Bus width in bytes.
+    """
+    offsets    : Tuple[int, ...]
+    bus_offsets: Tuple[int, ...]
+    lanes      : Tuple[int, ...]
+    strbs      : Tuple[int, ...]
+    bit_ens    : Tuple[int, ...]
+    bus_bytes  : int
+
+
+def burst_window(len: int, size: int, burst: BurstType, bus_size: int) -> int:
+    """
+    Size of the naturally aligned region the burst shape depends on:
+    the bus width, or the wrap boundary of a WRAP burst if that is larger.
+    """
+    bus_bytes = 1 << bus_size
+    if burst == BurstType.WRAP:
+        return max(bus_bytes, (len + 1) << size)
+    return bus_bytes
+
+
+def max_incr_beats(addr: int, size: int) -> int:
+    """
+    Most beats of 2 ** size bytes an INCR burst starting at `addr` can have without crossing a 4KB boundary.
+    """
+    aligned = addr & ~((1 << size) - 1)
+    return (BOUNDARY_BYTES - (aligned & (BOUNDARY_BYTES - 1))) >> size
+
+
+@lru_cache(maxsize=4096)
+def burst_shape(offset: int, len: int, size: int, burst: BurstType, bus_size: int) -> BurstShape:
+    """
+    Compute the shape of a burst starting `offset` bytes into its window (see `burst_window`).
+
+    Follows the AXI4 address rules:
+        FIXED: every beat uses the start address.
+        INCR : the first beat may be unaligned, the next ones start at the following aligned addresses.
+        WRAP : beats increment and wrap at the (len + 1) * 2 ** size boundary.
+
+    Memoized: bursts with the same offset and attributes share one shape, whatever their base address.
+    """
+    assert burst != BurstType.WRAP or len in WRAP_LENS, f"WRAP burst of len {len}, expected one of {WRAP_LENS}"
+
+    nr_beats   = len + 1
+    beat_bytes = 1 << size
+    bus_bytes  = 1 << bus_size
+    aligned    = offset & ~(beat_bytes - 1)
+
+    if burst == BurstType.FIXED:
+        offsets = [offset] * nr_beats
+    elif burst == BurstType.WRAP:
+        total = beat_bytes * nr_beats
+        lower = offset // total * total
+        offsets = [lower + (aligned - lower + i * beat_bytes) % total for i in range(nr_beats)]
+    else:
+        offsets = [offset] + [aligned + i * beat_bytes for i in range(1, nr_beats)]
+
+    bus_offsets = [off & ~(bus_bytes - 1) for off in offsets]
+    lanes = [off - bus_off for off, bus_off in zip(offsets, bus_offsets)]
+    strbs = [
+        ((1 << ((off & ~(beat_bytes - 1)) - bus_off + beat_bytes)) - 1) & ~((1 << lane) - 1)
+        for off, bus_off, lane in zip(offsets, bus_offsets, lanes)
+    ]
+
+    return BurstShape(
+        offsets     = tuple(offsets),
+        bus_offsets = tuple(bus_offsets),
+        lanes       = tuple(lanes),
+        strbs       = tuple(strbs),
+        bit_ens     = tuple(BitUtils.be_to_bit_en_batch(strbs, bus_bytes)),
+        bus_bytes   = bus_bytes
+    )
+
+
+class BurstGeometry(NamedTuple):
+    """
+    Per-beat addresses, byte lanes and strobes of one burst: the cached `shape` placed at `base`.
+
+    Shared by stimulus generation, memory models and checkers, so that repeated burst shapes
+    only cost a cache lookup.
+    """
+    base : int
+    shape: BurstShape
+
+    @classmethod
+    def compute(cls, addr: int, len: int, size: int, burst: BurstType, bus_size: int) -> "BurstGeometry":
+        burst = BurstType(burst)
+        assert burst != BurstType.INCR or len < max_incr_beats(addr, size), \
+            f"INCR burst of {len + 1} x {1 << size} bytes at {addr:#x} crosses a 4KB boundary"
+        window = burst_window(len, size, burst, bus_size)
+        base = addr & ~(window - 1)
+
+        return cls(base, burst_shape(addr - base, len, size, burst, bus_size))
+
+    @classmethod
+    def of(cls, ax, bus_size: int) -> "BurstGeometry":
+        """
+        Geometry of the burst described by the AxFlit `ax`.
+        """
+        return cls.compute(ax.addr, ax.len, ax.size, ax.burst, bus_size)
+
+    def nr_beats(self) -> int:
+        return len(self.shape.offsets)
+
+    def addrs(self) -> List[int]:
+        base = self.base
+        return [base + off for off in self.shape.offsets]
+
+    def bus_addrs(self) -> List[int]:
+        base = self.base
+        return [base + off for off in self.shape.bus_offsets]
+
+    def bus_addr(self, beat: int) -> int:
+        return self.base + self.shape.bus_offsets[beat]
+
+    def lanes(self) -> Tuple[int, ...]:
+        return self.shape.lanes
+
+    def strbs(self) -> Tuple[int, ...]:
+        return self.shape.strbs
+
+    def bit_ens(self) -> Tuple[int, ...]:
+        return self.shape.bit_ens
+
+    def span(self) -> Tuple[int, int]:
+        """
+        (first bus-aligned address, number of bytes) of the bus words covered by the burst.
+        """
+        bus_offsets = self.shape.bus_offsets
+        lo, hi = min(bus_offsets), max(bus_offsets)
+        return self.base + lo, hi - lo + self.shape.bus_bytes
@@ -1,20 +1,75 @@
-from typing import Optional
-from PyVeriUtils.signals.Hardware.signalBinding import DecoupledIO
+import copy
+from typing import Dict, List, Optional, Tuple
+from PyVeriUtils.signals.Hardware.signalBinding import DecoupledIO, DecoupledIOArray
 # from PyVeriUtils.protocol.AXI4.spec.Task import AxTask, WTask, RTask, BTask
 from PyVeriUtils.protocol.AXI4.spec.DutBundleCfg import AxiBundleCfg, AxCfg, WCfg, RCfg, BCfg
+from PyVeriUtils.utils.Common.CodeGen import compile_function
 
 
 
 # -------------------------------------
 # DecoupledIO Bundles for Axi Channel
 # -------------------------------------
-class AxBundle(DecoupledIO):
+class AxiChnlBundle(DecoupledIO):
+    """
+        Common base of the AXI channel bundles.
+
+        The channel config never changes after construction, so instead of checking `cfg.has_*` flags on every call,
+        `send()` compiles a straight-line function that only writes the fields present in this bundle,
+        and installs it on the instance in place of the method.
+        In the same way, the Flit `recv()` constructors cache their field plan in `recv_plan`.
+
+        The plan is built on the first `send()`, not in the constructor: it captures the field handles,
+        and building it at construction would resolve every handle eagerly, defeating lazy binding
+        (a bundle that never sends, e.g. the master's B/R bundles, never resolves its payload handles for sending).
+    """
+    # Task attribute that carries the payload to send ("flit" or "batch").
+    PAYLOAD: str = "flit"
+    # Expression producing each field from the payload `p`.
+    SEND_SRC: Dict[str, str] = {}
+
+    recv_plan = None
+
+    def send(self, task):
+        """
+            Send tasks generated in env to dut.
+        """
+        self.send = self.build_send_plan()
+        self.send(task)
+
+    def build_send_plan(self):
+        env = {f"h_{field}": getattr(self.bits, field) for field in self.bits.fields}
+        env["valid"] = self.valid
+
+        lines  = [f"p = task.{self.PAYLOAD}"]
+        lines += [f"h_{field}.value = {self.SEND_SRC[field]}" for field in self.bits.fields]
+        lines += ["valid.value = 1"]
+
+        return compile_function(f"{type(self).__name__}_send", ["task"], lines, env)
+
+
+class AxBundle(AxiChnlBundle):
+    SEND_SRC = {
+        "id"    : "p.id",
+        "addr"  : "p.addr",
+        "len"   : "p.len",
+        "size"  : "p.size",
+        "burst" : "p.burst.value",
+        "lock"  : "p.lock",
+        "cache" : "p.cache",
+        "prot"  : "p.prot",
+        "qos"   : "p.qos",
+        "region": "p.region",
+        "user"  : "p.user"
+    }
+
     def __init__(
         self,
         dut,
         prefix: str,
         hierarchy: Optional[str] = None,
-        cfg: AxCfg = AxCfg()
+        cfg: AxCfg = AxCfg(),
+        shadow: bool = False
     ):
         base_fields = ["id", "addr", "len", "size", "burst"]
         optional_fields = [
@@ -26,43 +81,26 @@ class AxBundle(DecoupledIO):
             ("user"  , cfg.has_user  )
         ]
         fields = base_fields + [name for name, flag in optional_fields if flag]
-        super().__init__(dut, fields, prefix, hierarchy)
+        super().__init__(dut, fields, prefix, hierarchy, shadow = shadow)
         self.cfg = cfg
 
-    def send(self, task):
-        """
-            Send tasks generated in env to dut.
-        """
-        self.bits.id.value    = task.flit.id
-        self.bits.addr.value  = task.flit.addr
-        self.bits.len.value   = task.flit.len
-        self.bits.size.value  = task.flit.size
-        self.bits.burst.value = task.flit.burst
-
-        if self.cfg.has_lock:
-            self.bits.lock.value = task.flit.lock
-        if self.cfg.has_cache:
-            self.bits.cache.value = task.flit.cache
-        if self.cfg.has_prot:
-            self.bits.prot.value = task.flit.prot
-        if self.cfg.has_qos:
-            self.bits.qos.value = task.flit.qos
-        if self.cfg.has_region:
-            self.bits.region.value = task.flit.region
-        if self.cfg.has_user:
-            self.bits.user.value = task.flit.user
-
-        self.valid.value = 1
-        
-
-
-class WBundle(DecoupledIO):
+
+class WBundle(AxiChnlBundle):
+    PAYLOAD  = "batch"
+    SEND_SRC = {
+        "data": "p.data()",
+        "strb": "p.strb()",
+        "last": "int(p.last())",
+        "user": "p.user"
+    }
+
     def __init__(
         self,
         dut,
         prefix: str,
         hierarchy: Optional[str] = None,
-        cfg: WCfg = WCfg()
+        cfg: WCfg = WCfg(),
+        shadow: bool = False
     ):
         base_fields = ["data", "strb", "last"]
         optional_fields = [
@@ -70,31 +108,27 @@ class WBundle(DecoupledIO):
         ]
         fields = base_fields + [name for name, flag in optional_fields if flag]
 
-        super().__init__(dut, fields, prefix, hierarchy)
+        super().__init__(dut, fields, prefix, hierarchy, shadow = shadow)
         self.cfg = cfg
 
-    def send(self, task):
-        """
-            Send tasks generated in env to dut.
-        """
-        bits = task.flit
-        
-        self.bits.data.value = task.flit.data()
-        self.bits.strb.value = task.flit.strb()
-        self.bits.last.value = task.flit.last()
-        if self.cfg.has_user:
-            self.bits.user.value = task.flit.user
-
-        self.valid.value = 1
 
+class RBundle(AxiChnlBundle):
+    PAYLOAD  = "batch"
+    SEND_SRC = {
+        "id"  : "p.id",
+        "data": "p.data()",  # Beat index for burst transfers
+        "resp": "p.resp.value",
+        "last": "int(p.last())",
+        "user": "p.user"
+    }
 
-class RBundle(DecoupledIO):
     def __init__(
             self,
             dut,
             prefix: str,
             hierarchy: Optional[str] = None,
-            cfg: RCfg = RCfg()
+            cfg: RCfg = RCfg(),
+            shadow: bool = False
     ):
         base_fields = ["id", "data", "resp", "last"]
         optional_fields = [
@@ -102,31 +136,24 @@ class RBundle(DecoupledIO):
         ]
         fields = base_fields + [name for name, flag in optional_fields if flag]
 
-        super().__init__(dut, fields, prefix, hierarchy)
+        super().__init__(dut, fields, prefix, hierarchy, shadow = shadow)
         self.cfg = cfg
 
-    def send(self, task):
-        """
-            Send tasks generated in env to dut.
-        """
-        self.bits.id.value   = task.batch.id
-        self.bits.data.value = task.batch.data()  # Beat index for burst transfers
-        self.bits.resp.value = task.batch.resp.value
-        self.bits.last.value = task.batch.last()
-
-        if self.cfg.has_user:
-            self.bits.user.value = task.flit.user
-
-        self.valid.value = 1
 
+class BBundle(AxiChnlBundle):
+    SEND_SRC = {
+        "id"  : "p.id",
+        "resp": "p.resp.value",
+        "user": "p.user"
+    }
 
-class BBundle(DecoupledIO):
     def __init__(
             self,
             dut,
             prefix: str,
             hierarchy: Optional[str] = None,
-            cfg: BCfg = BCfg()
+            cfg: BCfg = BCfg(),
+            shadow: bool = False
     ):
         base_fields = ["id", "resp"]
         optional_fields = [
@@ -134,29 +161,134 @@ class BBundle(DecoupledIO):
         ]
         fields = base_fields + [name for name, flag in optional_fields if flag]
 
-        super().__init__(dut, fields, prefix, hierarchy)
+        super().__init__(dut, fields, prefix, hierarchy, shadow = shadow)
         self.cfg = cfg
 
-    def send(self, task):
+class Axi4Bundle:
+    def __init__(
+            self,
+            dut,
+            cfg: AxiBundleCfg
+    ) -> None:
+        self.aw = AxBundle(dut, f"{cfg.prefix}_aw", cfg.hierarchy, cfg.aw, cfg.shadow) if cfg.aw is not None else None
+        self.w  = WBundle (dut, f"{cfg.prefix}_w" , cfg.hierarchy, cfg.w , cfg.shadow) if cfg.w  is not None else None
+        self.b  = BBundle (dut, f"{cfg.prefix}_b" , cfg.hierarchy, cfg.b , cfg.shadow) if cfg.b  is not None else None
+        self.ar = AxBundle(dut, f"{cfg.prefix}_ar", cfg.hierarchy, cfg.ar, cfg.shadow) if cfg.ar is not None else None
+        self.r  = RBundle (dut, f"{cfg.prefix}_r" , cfg.hierarchy, cfg.r , cfg.shadow) if cfg.r  is not None else None
+
+        # Present channels, built once: sample()/invalidate()/flush() walk it every cycle.
+        self.chnls: Tuple[DecoupledIO, ...] = tuple(
+            chnl for chnl in (self.aw, self.w, self.b, self.ar, self.r) if chnl is not None
+        )
+        self.shadow = cfg.shadow
+
+    def channels(self) -> List[DecoupledIO]:
+        return list(self.chnls)
+
+    def bind_all(self) -> None:
         """
-            Send tasks generated in env to dut.
+            Resolve all signal handles of the bundle eagerly (they are bound lazily by default).
+        """
+        for chnl in self.channels():
+            chnl.bind_all()
+
+    def __le__(self, up: "Axi4Bundle") -> "Axi4Bundle":
         """
-        self.bits.id.value = task.flit.id
-        self.bits.resp.value = task.flit.resp.value
+            Bulk connect two AXI interfaces: `down <= up` forwards AW/W/AR from up to down
+            and B/R from down back to up (with ready flowing the opposite way on every channel).
+        """
+        for name in ("aw", "w", "ar"):
+            if getattr(self, name) is not None and getattr(up, name) is not None:
+                getattr(self, name) <= getattr(up, name)
+        for name in ("b", "r"):
+            if getattr(self, name) is not None and getattr(up, name) is not None:
+                getattr(up, name) <= getattr(self, name)
+        return self
 
-        if self.cfg.has_user:
-            self.bits.user.value = task.flit.user
+    def sample(self) -> None:
+        """
+            Take the per-cycle snapshot of every channel. Call once at the start of sample_phase.
+        """
+        for chnl in self.chnls:
+            chnl.sample()
 
-        self.valid.value = 1
-        
-class Axi4Bundle:
+    def invalidate(self) -> None:
+        """
+            Drop the snapshots of every channel. Call once at the start of drive_phase.
+        """
+        for chnl in self.chnls:
+            chnl.snap = None
+
+    def flush(self) -> None:
+        """
+            Flush the shadow registers of every channel. Call once at the end of drive_phase.
+        """
+        if not self.shadow:
+            return
+        for chnl in self.chnls:
+            chnl.flush()
+
+    def shadow_stats(self) -> Dict[str, Tuple[int, int]]:
+        """
+            Return {channel: (writes issued, writes elided)} for every present channel.
+        """
+        names = ("aw", "w", "b", "ar", "r")
+        return {name: getattr(self, name).shadow_stats() for name in names if getattr(self, name) is not None}
+
+
+class Axi4BundleArray:
+    """
+        N identical AXI ports bound from one AxiBundleCfg.
+
+        Port i uses the prefix `<cfg.prefix>_<i>`, i.e. axi_0_aw_* ... axi_<N-1>_aw_*.
+        Each channel is also exposed as a DecoupledIOArray (`aw`, `w`, `b`, `ar`, `r`)
+        for batched operations such as `arr.aw.fire_mask()` or `arr.r.set_ready(mask)`.
+    """
     def __init__(
             self,
             dut,
-            cfg: AxiBundleCfg
+            cfg: AxiBundleCfg,
+            size: int
     ) -> None:
-        self.aw = AxBundle(dut, f"{cfg.prefix}_aw", cfg.hierarchy, cfg.aw) if cfg.aw is not None else None
-        self.w  = WBundle (dut, f"{cfg.prefix}_w" , cfg.hierarchy, cfg.w ) if cfg.w  is not None else None
-        self.b  = BBundle (dut, f"{cfg.prefix}_b" , cfg.hierarchy, cfg.b ) if cfg.b  is not None else None
-        self.ar = AxBundle(dut, f"{cfg.prefix}_ar", cfg.hierarchy, cfg.ar) if cfg.ar is not None else None
-        self.r  = RBundle (dut, f"{cfg.prefix}_r" , cfg.hierarchy, cfg.r ) if cfg.r  is not None else None
+        self.cfg = cfg
+        self.ports: List[Axi4Bundle] = []
+        for i in range(size):
+            port_cfg = copy.copy(cfg)
+            port_cfg.prefix = f"{cfg.prefix}_{i}"
+            self.ports.append(Axi4Bundle(dut, port_cfg))
+
+        self.aw = self._channel_array("aw")
+        self.w  = self._channel_array("w" )
+        self.b  = self._channel_array("b" )
+        self.ar = self._channel_array("ar")
+        self.r  = self._channel_array("r" )
+
+    def _channel_array(self, name: str) -> Optional[DecoupledIOArray]:
+        if getattr(self.cfg, name) is None:
+            return None
+        return DecoupledIOArray.from_ports([getattr(port, name) for port in self.ports])
+
+    def __len__(self) -> int:
+        return len(self.ports)
+
+    def __getitem__(self, idx: int) -> Axi4Bundle:
+        return self.ports[idx]
+
+    def __iter__(self):
+        return iter(self.ports)
+
+    def bind_all(self) -> None:
+        for port in self.ports:
+            port.bind_all()
+
+    def sample(self) -> None:
+        for port in self.ports:
+            port.sample()
+
+    def invalidate(self) -> None:
+        for port in self.ports:
+            port.invalidate()
+
+    def flush(self) -> None:
+        for port in self.ports:
+            port.flush()
@@ -33,10 +33,18 @@ class AxiBundleCfg:
                  w=None,
                  b=None,
                  ar=None,
-                 r=None):
+                 r=None,
+                 shadow=False):
         self.prefix = prefix
         self.hierarchy = hierarchy
 
+        # Shadow-register mode (opt-in): field writes are buffered and only changed fields
+        # are written to the simulator when the bundle is flushed (once per drive_phase).
+        # It pays off when simulator writes are expensive (GPI writes through cocotb); on MockDut,
+        # where a write is a Python attribute store, the buffering costs more than it saves
+        # (see benchmarks/shadow_writes.py for both cases). The bundle must be the only driver of its signals.
+        self.shadow = shadow
+
         # A None value for the Channel Cfg indicates that the bundle does not include this channel.
         self.aw = aw if aw is not None else AxCfg()
         self.w  = w  if w  is not None else WCfg()
@@ -4,10 +4,55 @@ import random
 from typing import List, Generic, TypeVar, Optional, Tuple
 from PyVeriUtils.protocol.AXI4.spec.Encodings import BurstType, RespType
 
+from PyVeriUtils.protocol.AXI4.spec.BurstGeometry import BurstGeometry, max_incr_beats
 from PyVeriUtils.protocol.AXI4.spec.DutBundle import AxBundle, WBundle, RBundle, BBundle
+from PyVeriUtils.utils.Common.CodeGen import compile_function
 
 T = TypeVar('T')
 
+
+def recv_plan(cls, bdl):
+    """
+    Compile the function that builds a `cls` flit from the Snapshot record of `bdl`.
+
+    Only the fields present in the bundle are read, by position; absent optional fields keep their defaults.
+    Per-field conversions are taken from `cls.RECV_CONV` ("{v}" stands for the raw value).
+    Raw handle values (e.g. cocotb's BinaryValue) are neither ints nor hashable, so every numeric field
+    is converted here, at the sampling boundary: flits hold plain ints, bools and Enums.
+    """
+    conv = getattr(cls, "RECV_CONV", {})
+    args = [f"{field} = {conv.get(field, '{v}').format(v = f'b[{i}]')}" for i, field in enumerate(bdl.bits.fields)]
+
+    plan = compile_function(
+        f"{cls.__name__}_recv", ["b"], [f"return cls({', '.join(args)})"],
+        {"cls": cls, "BurstType": BurstType, "RespType": RespType}
+    )
+    plan.cls = cls  # A bundle caches one plan; rebuild it if a different Flit class receives from it.
+
+    return plan
+
+def place_beats(ax, raw: bytes, bus_size: int, max_bytes: Optional[int] = None) -> Tuple[List[int], Tuple[int, ...]]:
+    """
+    Cut the beats of the `ax` burst from `raw` (one bus word of little-endian bytes per beat)
+    and keep, in every beat, only the byte lanes it occupies, limited to `max_bytes` bytes if given.
+
+    Returns:
+        (datas, strbs): the beat data, and the lane strobes of every beat.
+    """
+    shape = BurstGeometry.of(ax, bus_size).shape
+    bus_bytes = 1 << bus_size
+
+    data_bytes = min(1 << ax.size, max_bytes) if max_bytes is not None else 1 << ax.size
+    data_mask  = (1 << (data_bytes << 3)) - 1
+
+    view = memoryview(raw)
+    datas = [
+        int.from_bytes(view[i * bus_bytes:(i + 1) * bus_bytes], "little") & bit_en & (data_mask << (lane << 3))
+        for i, (lane, bit_en) in enumerate(zip(shape.lanes, shape.bit_ens))
+    ]
+
+    return datas, shape.strbs
+
 # ========================================
 # Define AXI4 Flit for each channel
 # ========================================
@@ -25,6 +70,20 @@ class AxFlit(Generic[T]):
     region: Optional[int] = None
     user  : Optional[T]   = None
 
+    RECV_CONV = {
+        "id"    : "int({v})",
+        "addr"  : "int({v})",
+        "len"   : "int({v})",
+        "size"  : "int({v})",
+        "burst" : "BurstType(int({v}))",
+        "lock"  : "int({v})",
+        "cache" : "int({v})",
+        "prot"  : "int({v})",
+        "qos"   : "int({v})",
+        "region": "int({v})",
+        "user"  : "int({v})",
+    }
+
     @classmethod
     def random_gen(
         cls,
@@ -32,33 +91,31 @@ class AxFlit(Generic[T]):
         addr_range: Tuple[int, int],
         max_len: int,
         max_size: int,
-        bus_size: int
+        bus_size: int,
+        rng: Optional[random.Random] = None
     ) -> "AxFlit":
+        """
+        One random request (from the global `random` if `rng` is None).
+        To generate many requests, prefer `StimulusStream`, which draws them in blocks.
+        """
+        rng = rng if rng is not None else random
         min_addr, max_addr = addr_range
 
-        id   = random.randint(0, (1 << id_bits) - 1) # same ID is allowed
-        addr = random.randint(min_addr, max_addr) >> bus_size << bus_size
-        len  = random.randint(0, max_len)
-        size = random.randint(0, max_size)
+        id   = rng.randint(0, (1 << id_bits) - 1) # same ID is allowed
+        addr = rng.randint(min_addr, max_addr) >> bus_size << bus_size
+        len  = rng.randint(0, max_len)
+        size = rng.randint(0, max_size)
+        len  = min(len, max_incr_beats(addr, size) - 1)  # INCR bursts must not cross a 4KB boundary.
 
         # we don't consider user in random_gen
         return cls(id, addr, len, size)
 
     @classmethod
     def recv(cls, bdl: AxBundle) -> "AxFlit":
-        return cls(
-            id     = bdl.bits.id.value,
-            addr   = bdl.bits.addr.value,
-            len    = bdl.bits.len.value,
-            size   = bdl.bits.size.value,
-            burst  = BurstType.int_to_enum(int(bdl.bits.burst.value)),
-            lock   = bdl.bits.lock.value if bdl.cfg.has_lock else None,
-            cache  = bdl.bits.cache.value if bdl.cfg.has_cache else None,
-            prot   = bdl.bits.prot.value if bdl.cfg.has_prot else None,
-            qos    = bdl.bits.qos.value if bdl.cfg.has_qos else None,
-            region = bdl.bits.region.value if bdl.cfg.has_region else None,
-            user   = bdl.bits.user.value if bdl.cfg.has_user else None,
-        )
+        plan = bdl.recv_plan
+        if plan is None or plan.cls is not cls:
+            plan = bdl.recv_plan = recv_plan(cls, bdl)
+        return plan(bdl.snapshot().bits)
 
 
 @dataclass
@@ -68,14 +125,14 @@ class WFlit(Generic[T]):
     last: bool
     user: Optional[T] = None
 
+    RECV_CONV = {"data": "int({v})", "strb": "int({v})", "last": "bool({v})", "user": "int({v})"}
+
     @classmethod
     def recv(cls, bdl: WBundle) -> "WFlit":
-        return cls(
-            data = bdl.bits.data.value,
-            strb = bdl.bits.strb.value,
-            last = bool(bdl.bits.last.value),
-            user = bdl.bits.user.value if bdl.cfg.has_user else None,
-        )
+        plan = bdl.recv_plan
+        if plan is None or plan.cls is not cls:
+            plan = bdl.recv_plan = recv_plan(cls, bdl)
+        return plan(bdl.snapshot().bits)
 
 @dataclass
 class RFlit(Generic[T]):
@@ -85,15 +142,16 @@ class RFlit(Generic[T]):
     last: bool
     user: Optional[T] = None
 
+    RECV_CONV = {
+        "id": "int({v})", "data": "int({v})", "resp": "RespType(int({v}))", "last": "bool({v})", "user": "int({v})"
+    }
+
     @classmethod
     def recv(cls, bdl: RBundle) -> "RFlit":
-        return cls(
-            id   = bdl.bits.id.value,
-            data = bdl.bits.data.value,
-            resp = bdl.bits.resp.value,
-            last = bool(bdl.bits.last.value),
-            user = bdl.bits.user.value if bdl.cfg.has_user else None,
-        )
+        plan = bdl.recv_plan
+        if plan is None or plan.cls is not cls:
+            plan = bdl.recv_plan = recv_plan(cls, bdl)
+        return plan(bdl.snapshot().bits)
 
 @dataclass
 class BFlit(Generic[T]):
@@ -101,6 +159,8 @@ class BFlit(Generic[T]):
     resp: RespType = RespType.OKAY
     user: Optional[T] = None
 
+    RECV_CONV = {"id": "int({v})", "resp": "RespType(int({v}))", "user": "int({v})"}
+
     @classmethod
     def random_gen(cls, aw: AxFlit) -> "BFlit":
         # Not randomized actually, just to keep consistent with other channels.
@@ -108,11 +168,10 @@ class BFlit(Generic[T]):
 
     @classmethod
     def recv(cls, bdl: BBundle) -> "BFlit":
-        return cls(
-            id   = bdl.bits.id.value,
-            resp = bdl.bits.resp.value,
-            user = bdl.bits.user.value if bdl.cfg.has_user else None,
-        )
+        plan = bdl.recv_plan
+        if plan is None or plan.cls is not cls:
+            plan = bdl.recv_plan = recv_plan(cls, bdl)
+        return plan(bdl.snapshot().bits)
 
 
 @dataclass
@@ -137,17 +196,37 @@ class WBatch(Generic[T]):
     @classmethod
     def random_gen(
             cls,
-            nr_beats: int,
-            size: int,
+            aw: AxFlit,
             bus_size: int,
-            max_size: Optional[int] = None
+            max_size: Optional[int] = None,
+            rng: Optional[random.Random] = None
     ) -> "WBatch":
-        actual_data_size = min(size, max_size) if max_size is not None else size
-        nr_data_bits = 1 << (actual_data_size + 3)
-        max_data = (1 << nr_data_bits) - 1
-        bus_bytes = 1 << bus_size
+        """
+        Random data and strobes for the whole `aw` burst at once.
 
-        # TODO: Not finished
+        Every beat is placed on the byte lanes it occupies (see BurstGeometry), which covers narrow transfers
+        and unaligned starts, and its strobe enables exactly those lanes.
+        With `max_size`, only the lowest 2 ** max_size bytes of each beat carry random data (the rest is zero),
+        which keeps waveforms readable.
+
+        The data of all beats is cut from a single `rng.randbytes()` draw (the global `random` if `rng` is None).
+        """
+        rng = rng if rng is not None else random
+        return cls.from_raw(aw, rng.randbytes((aw.len + 1) << bus_size), bus_size, max_size)
+
+    @classmethod
+    def from_raw(
+            cls,
+            aw: AxFlit,
+            raw: bytes,
+            bus_size: int,
+            max_size: Optional[int] = None
+    ) -> "WBatch":
+        """
+        Build the batch of `aw` from `raw`, one bus word of little-endian bytes per beat (see `random_gen`).
+        """
+        datas, strbs = place_beats(aw, raw, bus_size, 1 << max_size if max_size is not None else None)
+        return cls(datas, list(strbs))
 
 @dataclass
 class RBatch(Generic[T]):
@@ -173,36 +252,27 @@ class RBatch(Generic[T]):
             cls,
             ar: AxFlit,
             maxDataBytes: int,
-            busSize: int
+            busSize: int,
+            rng: Optional[random.Random] = None
     ) -> "RBatch":
-        beat_bytes = 1 << ar.size
-        data_bytes = min(beat_bytes, maxDataBytes) if maxDataBytes is not None else beat_bytes
-        data_bits  = data_bytes << 3
-        max_data   = (1 << data_bits) - 1
-
-        bus_bytes = 1 << busSize
-        bus_bits  = bus_bytes << 3
-
-        bus_off_mask = (1 << busSize) - 1
-        base_offset = ar.addr & bus_off_mask
-
-        bus_data_mask = (1 << bus_bits) - 1  # The data generated should not be greater than bus_data_mask!
-
-        datas = []
-
-        beat_offset = base_offset
+        """
+        Random data for the whole `ar` burst, cut from a single `rng.randbytes()` draw
+        (the global `random` if `rng` is None). Each beat is placed on its byte lanes,
+        and only its lowest `maxDataBytes` bytes carry data.
+        """
+        rng = rng if rng is not None else random
+        return cls.from_raw(ar, rng.randbytes((ar.len + 1) << busSize), maxDataBytes, busSize)
 
-        # print(f"[RANDOM_GEN_RBatch] AR addr = {hex(ar.addr)}, id = {hex(ar.id)}, size = {hex(ar.size)}, len = {ar.len}")
-
-        for i in range(ar.len + 1):
-            valid_data   = random.randint(0, max_data)
-            data_off     = beat_offset << 3
-            shifted_data = valid_data << data_off
-            data         = shifted_data & bus_data_mask
-            datas.append(data)
-
-            # print(f"[RANDOM_GEN_RBatch] Beat {i}: beat_offset = {beat_offset}, data = {hex(data)}")
-
-            beat_offset = 0 if (beat_offset + beat_bytes) >= bus_bytes else beat_offset + beat_bytes
-
-        return cls(ar.id, datas)
\ No newline at end of file
+    @classmethod
+    def from_raw(
+            cls,
+            ar: AxFlit,
+            raw: bytes,
+            maxDataBytes: Optional[int],
+            busSize: int
+    ) -> "RBatch":
+        """
+        Build the batch of `ar` from `raw`, one bus word of little-endian bytes per beat (see `random_gen`).
+        """
+        datas, _ = place_beats(ar, raw, busSize, maxDataBytes)
+        return cls(ar.id, datas)
@@ -1,3 +1,4 @@
+import random
 from typing import Optional
 
 from PyVeriUtils.utils.Common.Task import BaseTask
@@ -146,10 +147,11 @@ class RTask(BaseTask):
 			busSize: int,
 			alloc_cycle: int,
 			timeout_threshold: int = 10000,
-			label: Optional[str] = None
+			label: Optional[str] = None,
+			rng: Optional[random.Random] = None
 	) -> "RTask":
 		task = cls(alloc_cycle, timeout_threshold, label)
-		task.batch = RBatch.random_gen(ar, maxDataBytes, busSize)
+		task.batch = RBatch.random_gen(ar, maxDataBytes, busSize, rng)
 
 		return task
 
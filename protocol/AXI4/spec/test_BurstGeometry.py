@@ -0,0 +1,94 @@
+"""
+    Cached burst shapes against the address and byte-lane equations of the AXI4 spec (A3.4.1),
+    evaluated beat by beat; illegal WRAP lengths and 4KB-crossing INCR bursts are refused,
+    and the random generators never produce the latter.
+"""
+import random
+
+import pytest
+
+from PyVeriUtils.protocol.AXI4.components.Parameters import AxiAgentCfg
+from PyVeriUtils.protocol.AXI4.spec.BurstGeometry import WRAP_LENS, BurstGeometry
+from PyVeriUtils.protocol.AXI4.spec.Encodings import BurstType
+from PyVeriUtils.protocol.AXI4.spec.Flit import AxFlit
+from PyVeriUtils.protocol.AXI4.utils.StimulusStream import StimulusStream
+
+
+def spec_beats(addr, len, size, burst, bus_size):
+    """
+    (address, lowest byte lane, strobe) of every beat, straight from the spec equations.
+    """
+    nr_bytes, burst_len, bus_bytes = 1 << size, len + 1, 1 << bus_size
+    aligned = addr // nr_bytes * nr_bytes
+    wrap_boundary = addr // (nr_bytes * burst_len) * (nr_bytes * burst_len)
+
+    beats = []
+    address = addr
+    for n in range(1, burst_len + 1):
+        if burst == BurstType.FIXED or n == 1:
+            address = addr
+            lower = addr - addr // bus_bytes * bus_bytes
+            upper = aligned + (nr_bytes - 1) - addr // bus_bytes * bus_bytes
+        else:
+            address = aligned + (n - 1) * nr_bytes
+            if burst == BurstType.WRAP and address >= wrap_boundary + nr_bytes * burst_len:
+                address -= nr_bytes * burst_len
+            lower = address - address // bus_bytes * bus_bytes
+            upper = lower + nr_bytes - 1
+        strb = sum(1 << lane for lane in range(lower, upper + 1))
+        beats.append((address, lower, strb))
+    return beats
+
+
+def random_bursts(rng, nr):
+    for _ in range(nr):
+        bus_size = rng.randint(2, 6)
+        size = rng.randint(0, bus_size)
+        burst = rng.choice(list(BurstType)[:3])
+        if burst == BurstType.WRAP:
+            len = rng.choice(WRAP_LENS)
+            addr = rng.getrandbits(32) >> size << size  # WRAP bursts start aligned.
+        else:
+            addr = rng.getrandbits(32)
+            len = rng.randint(0, 15)
+            if burst == BurstType.INCR:
+                addr = addr >> 12 << 12 | rng.randint(0, (1 << 12) - ((len + 1) << size))
+        yield addr, len, size, burst, bus_size
+
+
+def test_matches_spec_equations():
+    for addr, len, size, burst, bus_size in random_bursts(random.Random(0), 20000):
+        geo = BurstGeometry.compute(addr, len, size, burst, bus_size)
+        expected = spec_beats(addr, len, size, burst, bus_size)
+        got = list(zip(geo.addrs(), geo.lanes(), geo.strbs()))
+        assert got == expected, (hex(addr), len, size, burst, bus_size)
+        for strb, bit_en in zip(geo.strbs(), geo.bit_ens()):
+            assert bit_en == sum(0xff << (8 * lane) for lane in range(1 << bus_size) if strb >> lane & 1)
+
+
+def test_illegal_bursts_are_refused():
+    for len in range(16):
+        if len not in WRAP_LENS:
+            with pytest.raises(AssertionError):
+                BurstGeometry.compute(0x1000, len, 2, BurstType.WRAP, 6)
+
+    BurstGeometry.compute(0x1fc0, 0, 6, BurstType.INCR, 6)  # Ends right at the boundary.
+    with pytest.raises(AssertionError):
+        BurstGeometry.compute(0x1fc0, 1, 6, BurstType.INCR, 6)
+    BurstGeometry.compute(0x1ffd, 1, 1, BurstType.INCR, 6)
+    with pytest.raises(AssertionError):
+        BurstGeometry.compute(0x1ffd, 2, 1, BurstType.INCR, 6)  # Counted from the aligned start, 0x1ffc.
+    BurstGeometry.compute(0x1fc0, 15, 6, BurstType.FIXED, 6)
+
+
+def test_generators_stay_within_4kb():
+    cfg = AxiAgentCfg("gen", 0, seed = 3)
+    stream = StimulusStream(cfg, "mst_wr", max_len = 63, block_size = 512)
+    for _ in range(2000):
+        ax = next(stream)
+        BurstGeometry.of(ax, cfg.busSize)
+
+    rng = random.Random(3)
+    for _ in range(2000):
+        ax = AxFlit.random_gen(4, (0, (1 << 32) - 1), 63, cfg.busSize, cfg.busSize, rng)
+        BurstGeometry.of(ax, cfg.busSize)
@@ -1,22 +1,249 @@
-from db_helper import DBHelper
-from tb_config import TBConfig
-from spec.Flit import *
+import queue
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PyVeriUtils.protocol.AXI4.spec.Flit import AxFlit, WFlit, RFlit, BFlit
+
+INT_LIMIT = 1 << 63  # sqlite INTEGER columns are signed 64-bit.
+
+
+class DBHelper:
+	"""
+	Transaction database on sqlite3 with a batching background writer.
+
+	`save()` only appends a row tuple to an in-memory buffer. Once `batch_size` rows are buffered,
+	the buffers are handed over (not copied) to a writer thread, which converts wide values
+	and inserts the whole batch with `executemany` in a single transaction.
+	The database is opened in WAL mode, so it can be queried (e.g. with `query()`) while the run is still writing.
+
+	The hand-over queue holds at most `max_pending` batches: if the writer falls that far behind,
+	`save()` blocks instead of letting memory grow without bound.
+
+	Subclasses declare their tables in `TABLES`:
+		{table: [(column, sqlite type), ...]}
+	Columns of type BLOB receive ints, which are stored as little-endian bytes
+	(bus-wide data does not fit sqlite's 64-bit INTEGER). INTEGER columns hold values below 2 ** 63 (INT_LIMIT):
+	callers should check that before saving, since the writer thread only reports errors at the next hand-over.
+	`INDEXES` lists the (table, columns) indexes to create when the database is closed
+	(building them once after the bulk load is cheaper than maintaining them on every insert).
+	"""
+
+	TABLES : Dict[str, List[Tuple[str, str]]] = {}
+	INDEXES: List[Tuple[str, Tuple[str, ...]]] = []
+
+	STOP = None  # Sentinel telling the writer thread to exit.
+
+	def __init__(self, path: str, batch_size: int = 65536, max_pending: int = 8) -> None:
+		self.path = path
+		self.batch_size = batch_size
+
+		self.buffers: Dict[str, list] = {table: [] for table in ["agents", *self.TABLES]}
+		self.nr_buffered = 0
+		self.nr_saved = 0
+
+		self.agents: Dict[str, int] = {}  # Agent name -> agent id (the tables store ids, not names).
+		self.error: Optional[BaseException] = None
+
+		self.pending: "queue.Queue" = queue.Queue(maxsize = max_pending)
+		self.writer = threading.Thread(target = self._writer_loop, name = f"db writer {path}", daemon = True)
+
+		# Create the schema synchronously, so that errors surface here and readers find the tables at once.
+		conn = self._connect()
+		conn.execute("CREATE TABLE IF NOT EXISTS agents (agent INTEGER PRIMARY KEY, name TEXT UNIQUE)")
+		for table, columns in self.TABLES.items():
+			cols = ", ".join(f"{name} {kind}" for name, kind in columns)
+			conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({cols})")
+		for name, agent in conn.execute("SELECT name, agent FROM agents"):
+			self.agents[name] = agent
+		conn.commit()
+		conn.close()
+
+		self.writer.start()
+
+	def _connect(self) -> sqlite3.Connection:
+		conn = sqlite3.connect(self.path)
+		conn.execute("PRAGMA journal_mode = WAL")
+		conn.execute("PRAGMA synchronous = NORMAL")
+		return conn
+
+	def agent_id(self, name: str) -> int:
+		agent = self.agents.get(name)
+		if agent is None:
+			agent = self.agents[name] = len(self.agents) + 1
+			self.save("agents", (agent, name))
+		return agent
+
+	def save(self, table: str, row: tuple) -> None:
+		"""
+		Buffer one row of `table`. Cheap: the row is written later by the writer thread.
+		"""
+		self.buffers[table].append(row)
+		self.nr_buffered += 1
+		if self.nr_buffered >= self.batch_size:
+			self.hand_over()
+
+	def hand_over(self) -> None:
+		"""
+		Pass the buffered rows to the writer thread and start new buffers.
+		"""
+		if self.error is not None:
+			raise RuntimeError(f"{self.path}: database writer failed") from self.error
+		if self.nr_buffered == 0:
+			return
+
+		batch = self.buffers
+		self.buffers = {table: [] for table in batch}
+		self.nr_saved += self.nr_buffered
+		self.nr_buffered = 0
+		self.pending.put(batch)
+
+	def _writer_loop(self) -> None:
+		conn = self._connect()
+		inserts = {
+			table: f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})"
+			for table, columns in self.TABLES.items()
+		}
+		inserts["agents"] = "INSERT OR IGNORE INTO agents VALUES (?, ?)"
+		blobs = {
+			table: [i for i, (_, kind) in enumerate(columns) if kind == "BLOB"]
+			for table, columns in self.TABLES.items()
+		}
+
+		while True:
+			batch = self.pending.get()
+			try:
+				if batch is self.STOP:
+					break
+				if self.error is None:
+					with conn:  # One transaction per batch.
+						for table, rows in batch.items():
+							if not rows:
+								continue
+							if blobs.get(table):
+								rows = self._to_blobs(rows, blobs[table])
+							conn.executemany(inserts[table], rows)
+			except BaseException as e:
+				self.error = e
+			finally:
+				self.pending.task_done()
+
+		conn.close()
+
+	@staticmethod
+	def _to_blobs(rows: Sequence[tuple], blob_cols: List[int]) -> List[tuple]:
+		converted = []
+		for row in rows:
+			row = list(row)
+			for i in blob_cols:
+				v = row[i]
+				if v is not None:
+					row[i] = v.to_bytes(max(1, (v.bit_length() + 7) >> 3), "little")
+			converted.append(row)
+		return converted
+
+	def flush(self) -> None:
+		"""
+		Hand over the buffered rows and wait until every row saved so far is committed.
+		"""
+		self.hand_over()
+		self.pending.join()
+		if self.error is not None:
+			raise RuntimeError(f"{self.path}: database writer failed") from self.error
+
+	def close(self) -> None:
+		"""
+		Commit everything, stop the writer thread and build the indexes.
+		"""
+		self.flush()
+		self.pending.put(self.STOP)
+		self.writer.join()
+
+		conn = self._connect()
+		for table, columns in self.INDEXES:
+			conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_{'_'.join(columns)} ON {table} ({', '.join(columns)})")
+		conn.commit()
+		conn.close()
+
+	def query(self, sql: str, params: Sequence = ()) -> list:
+		"""
+		Run a read query on its own connection (rows not handed over yet are not visible, see `flush()`).
+		"""
+		conn = sqlite3.connect(self.path)
+		try:
+			return conn.execute(sql, params).fetchall()
+		finally:
+			conn.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
+
 
 class AXI4_DB_Helper(DBHelper):
-	def __init__(self, cfg: TBConfig) -> None:
-		super().__init__(cfg)
+	"""
+	One table per AXI4 channel, so per-channel queries (e.g. every R beat of an id) only scan that channel.
+	Data and strobes are stored as little-endian BLOBs; enums as their integer encoding.
+	Flits are saved as they are, so they must hold ints and Enums, as those from `recv()` and the generators do
+	(raw handle values are converted at the sampling boundary, see `recv_plan()`).
+	"""
+
+	TABLES = {
+		"aw": [("cycle", "INTEGER"), ("agent", "INTEGER"), ("id", "INTEGER"), ("addr", "INTEGER"),
+			   ("len", "INTEGER"), ("size", "INTEGER"), ("burst", "INTEGER")],
+		"w" : [("cycle", "INTEGER"), ("agent", "INTEGER"), ("data", "BLOB"), ("strb", "BLOB"), ("last", "INTEGER")],
+		"b" : [("cycle", "INTEGER"), ("agent", "INTEGER"), ("id", "INTEGER"), ("resp", "INTEGER")],
+		"ar": [("cycle", "INTEGER"), ("agent", "INTEGER"), ("id", "INTEGER"), ("addr", "INTEGER"),
+			   ("len", "INTEGER"), ("size", "INTEGER"), ("burst", "INTEGER")],
+		"r" : [("cycle", "INTEGER"), ("agent", "INTEGER"), ("id", "INTEGER"), ("data", "BLOB"),
+			   ("resp", "INTEGER"), ("last", "INTEGER")],
+	}
+
+	INDEXES = [
+		("aw", ("agent", "id", "cycle")),
+		("w" , ("agent", "cycle")),
+		("b" , ("agent", "id", "cycle")),
+		("ar", ("agent", "id", "cycle")),
+		("r" , ("agent", "id", "cycle")),
+	]
 
-	def aw_save_db(self, cycles, name, bits: AW_Flit):
-		self.save_db(cycles, name, "AW", bits.id, bits.addr, bits.len, bits.size)
+	# The save methods inline `save()` and `agent_id()`: they run on every handshake of the simulation thread.
+	def aw_save_db(self, cycles, name, bits: AxFlit):
+		# Checked here, on the calling thread: the writer would only report the overflow at a later hand-over.
+		assert bits.addr < INT_LIMIT, f"{self.path}: aw addr {bits.addr:#x} does not fit an INTEGER column"
+		agent = self.agents.get(name) or self.agent_id(name)
+		self.buffers["aw"].append((cycles, agent, bits.id, bits.addr, bits.len, bits.size, bits.burst.value))
+		self.nr_buffered += 1
+		if self.nr_buffered >= self.batch_size:
+			self.hand_over()
 
-	def w_save_db(self, cycles, name, bits: W_Flit):
-		self.save_db(cycles, name, "W", bits.id, data=bits.data, strb=bits.strb, last=bits.last)
+	def w_save_db(self, cycles, name, bits: WFlit):
+		agent = self.agents.get(name) or self.agent_id(name)
+		self.buffers["w"].append((cycles, agent, bits.data, bits.strb, bits.last))
+		self.nr_buffered += 1
+		if self.nr_buffered >= self.batch_size:
+			self.hand_over()
 
-	def b_save_db(self, cycles, name, bits: B_Flit):
-		self.save_db(cycles, name, "B", bits.id)
+	def b_save_db(self, cycles, name, bits: BFlit):
+		agent = self.agents.get(name) or self.agent_id(name)
+		self.buffers["b"].append((cycles, agent, bits.id, bits.resp.value))
+		self.nr_buffered += 1
+		if self.nr_buffered >= self.batch_size:
+			self.hand_over()
 
-	def ar_save_db(self, cycles, name, bits: AR_Flit):
-		self.save_db(cycles, name, "AR", bits.id, bits.addr, bits.len, bits.size)
+	def ar_save_db(self, cycles, name, bits: AxFlit):
+		assert bits.addr < INT_LIMIT, f"{self.path}: ar addr {bits.addr:#x} does not fit an INTEGER column"
+		agent = self.agents.get(name) or self.agent_id(name)
+		self.buffers["ar"].append((cycles, agent, bits.id, bits.addr, bits.len, bits.size, bits.burst.value))
+		self.nr_buffered += 1
+		if self.nr_buffered >= self.batch_size:
+			self.hand_over()
 
-	def r_save_db(self, cycles, name, bits: R_Flit):
-		self.save_db(cycles, name, "R", bits.id, data=bits.data, last=bits.last)
\ No newline at end of file
+	def r_save_db(self, cycles, name, bits: RFlit):
+		agent = self.agents.get(name) or self.agent_id(name)
+		self.buffers["r"].append((cycles, agent, bits.id, bits.data, bits.resp.value, bits.last))
+		self.nr_buffered += 1
+		if self.nr_buffered >= self.batch_size:
+			self.hand_over()
@@ -0,0 +1,50 @@
+from typing import Callable
+
+from PyVeriUtils.signals.Mock.MockDut import MockDut
+from PyVeriUtils.protocol.AXI4.components.Parameters import AxiAgentCfg
+
+
+def axi_signal_widths(
+        busBits : int = 512,
+        idBits  : int = 12,
+        addrBits: int = 64,
+        userBits: int = 1
+) -> Callable[[str], int]:
+    """
+        Return a MockDut width resolver for AXI4 signals, keyed by the field name at the end of the path
+        (e.g. "axi_aw_bits_addr" -> addrBits).
+    """
+    widths = {
+        "valid" : 1,
+        "ready" : 1,
+        "id"    : idBits,
+        "addr"  : addrBits,
+        "len"   : 8,
+        "size"  : 3,
+        "burst" : 2,
+        "lock"  : 1,
+        "cache" : 4,
+        "prot"  : 3,
+        "qos"   : 4,
+        "region": 4,
+        "user"  : userBits,
+        "data"  : busBits,
+        "strb"  : busBits >> 3,
+        "last"  : 1,
+        "resp"  : 2
+    }
+
+    def width_of(path: str) -> int:
+        return widths[path.rsplit("_", 1)[-1]]
+
+    return width_of
+
+
+def mock_axi_dut(cfg: AxiAgentCfg, idBits: int = 12, addrBits: int = 64, userBits: int = 1) -> MockDut:
+    """
+        Build a MockDut that provides every AXI4 signal a BaseAxiMaster/BaseAxiSlave with `cfg` binds to.
+    """
+    return MockDut(
+        name   = f"mock_{cfg.bundleCfg.prefix}",
+        widths = axi_signal_widths(cfg.busBits, idBits, addrBits, userBits)
+    )
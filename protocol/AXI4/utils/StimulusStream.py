@@ -0,0 +1,191 @@
+import random
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from PyVeriUtils.protocol.AXI4.components.Parameters import AxiAgentCfg
+from PyVeriUtils.protocol.AXI4.spec.BurstGeometry import BOUNDARY_BYTES, WRAP_LENS
+from PyVeriUtils.protocol.AXI4.spec.Encodings import BurstType
+from PyVeriUtils.protocol.AXI4.spec.Flit import AxFlit, WBatch
+from PyVeriUtils.utils.Common.BitUtils import np
+
+# BurstType of each encoding, indexed by value (cheaper than calling the Enum).
+BURST_OF = {burst.value: burst for burst in BurstType}
+
+NR_COLUMNS = 5  # Random 64-bit words drawn per request: id, addr, len, size, burst.
+
+
+@dataclass
+class AxBlock:
+    """
+    A block of pregenerated requests, stored column by column.
+
+    The columns are NumPy arrays when NumPy is available, lists otherwise.
+    `data` holds the random bytes of the W data of every request, one bus word per beat,
+    request i starting at bus word `beat_offsets[i]`.
+    """
+    block_no    : int
+    ids         : Sequence[int]
+    addrs       : Sequence[int]
+    lens        : Sequence[int]
+    sizes       : Sequence[int]
+    bursts      : Sequence[int]
+    beat_offsets: List[int]
+    data        : bytes
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows(self) -> Iterator[Tuple[int, int, int, int, int]]:
+        """
+        (id, addr, len, size, burst) of every request, as plain ints.
+        """
+        cols = [col.tolist() if np is not None else col for col in (self.ids, self.addrs, self.lens, self.sizes, self.bursts)]
+        return zip(*cols)
+
+
+class StimulusStream:
+    """
+    A reproducible, lazily consumed stream of random AXI requests (and their W data) for one agent.
+
+    Requests are generated `block_size` at a time: the random words of a whole block are drawn at once
+    and decoded column by column (vectorized with NumPy when available, the result is the same either way).
+
+    Block `n` is generated from its own generator seeded with (seed, agentId, stream, n), so the requests
+    an agent sees depend only on its cfg and stream name, not on how other agents interleave with it,
+    how fast it consumes them or which blocks were generated before.
+
+    Addresses are bus-aligned, as with `AxFlit.random_gen`. WRAP requests (only generated if
+    `bursts` contains BurstType.WRAP) use a legal WRAP length not above `max_len`.
+    INCR requests are shortened where needed so that they end before the next 4KB boundary.
+
+    Usage:
+        stream = StimulusStream(cfg, "mst_rd")
+        ar = next(stream)                 # AxFlit
+        aw, w = stream.next_write()       # AxFlit and its WBatch
+    """
+    def __init__(
+            self,
+            cfg       : AxiAgentCfg,
+            stream    : str,
+            id_bits   : int = 4,
+            addr_range: Tuple[int, int] = (0, (1 << 32) - 1),
+            max_len   : int = 15,
+            max_size  : Optional[int] = None,
+            bursts    : Sequence[BurstType] = (BurstType.INCR,),
+            with_data : bool = True,
+            block_size: int = 4096
+    ) -> None:
+        self.cfg = cfg
+        self.stream = stream
+        # An unseeded cfg still gets a reproducible stream: report `self.seed` to replay it.
+        self.seed = cfg.seed if cfg.seed is not None else random.SystemRandom().getrandbits(64)
+
+        self.id_bits    = id_bits
+        self.addr_range = addr_range
+        self.max_len    = max_len
+        self.max_size   = max_size if max_size is not None else cfg.busSize
+        self.bursts     = [BurstType(burst).value for burst in bursts]
+        self.wrap_lens  = [l for l in WRAP_LENS if l <= max_len]
+        self.with_data  = with_data
+        self.block_size = block_size
+
+        assert BurstType.WRAP.value not in self.bursts or self.wrap_lens, \
+            f"WRAP bursts need max_len >= 1, got {max_len}"
+
+        self.block_no = 0
+        self.block: Optional[AxBlock] = None
+        self.rows: Iterator[Tuple[int, int, int, int, int]] = iter(())
+        self.index = 0
+
+    def rng(self, block_no: int) -> random.Random:
+        return random.Random(f"{self.seed}/{self.cfg.agentId}/{self.stream}/{block_no}")
+
+    def gen_block(self, block_no: int) -> AxBlock:
+        """
+        Generate block `block_no` (deterministic, independent of the other blocks).
+        """
+        n = self.block_size
+        rng = self.rng(block_no)
+        raw = rng.randbytes(n * NR_COLUMNS * 8)
+
+        bus_size = self.cfg.busSize
+        min_word = self.addr_range[0] >> bus_size
+        nr_words = (self.addr_range[1] >> bus_size) - min_word + 1
+        wrap = BurstType.WRAP.value
+        incr = BurstType.INCR.value
+        in_page = BOUNDARY_BYTES - 1
+
+        if np is not None:
+            cols   = np.frombuffer(raw, dtype = "<u8").reshape(n, NR_COLUMNS)
+            ids    = cols[:, 0] & np.uint64((1 << self.id_bits) - 1)
+            addrs  = ((cols[:, 1] % np.uint64(nr_words)) + np.uint64(min_word)) << np.uint64(bus_size)
+            sizes  = cols[:, 3] % np.uint64(self.max_size + 1)
+            bursts = np.array(self.bursts, dtype = np.uint64)[cols[:, 4] % np.uint64(len(self.bursts))]
+            lens   = cols[:, 2] % np.uint64(self.max_len + 1)
+            if self.wrap_lens:
+                wrap_lens = np.array(self.wrap_lens, dtype = np.uint64)[cols[:, 2] % np.uint64(len(self.wrap_lens))]
+                lens = np.where(bursts == wrap, wrap_lens, lens)
+            # Addresses are bus-aligned, so aligned to the size of every beat too.
+            room = (np.uint64(BOUNDARY_BYTES) - (addrs & np.uint64(in_page))) >> sizes
+            lens = np.where(bursts == incr, np.minimum(lens, room - np.uint64(1)), lens)
+            nr_beats = (lens + 1).tolist()
+        else:
+            cols = array("Q", raw)
+            if sys.byteorder != "little":
+                cols.byteswap()
+            id_mask = (1 << self.id_bits) - 1
+            ids    = [v & id_mask for v in cols[0::NR_COLUMNS]]
+            addrs  = [(v % nr_words + min_word) << bus_size for v in cols[1::NR_COLUMNS]]
+            sizes  = [v % (self.max_size + 1) for v in cols[3::NR_COLUMNS]]
+            bursts = [self.bursts[v % len(self.bursts)] for v in cols[4::NR_COLUMNS]]
+            lens   = [
+                self.wrap_lens[v % len(self.wrap_lens)] if burst == wrap else v % (self.max_len + 1)
+                for v, burst in zip(cols[2::NR_COLUMNS], bursts)
+            ]
+            lens = [
+                min(l, ((BOUNDARY_BYTES - (addr & in_page)) >> size) - 1) if burst == incr else l
+                for l, addr, size, burst in zip(lens, addrs, sizes, bursts)
+            ]
+            nr_beats = [l + 1 for l in lens]
+
+        beat_offsets = [0] * n
+        total = 0
+        for i, beats in enumerate(nr_beats):
+            beat_offsets[i] = total
+            total += beats
+        data = rng.randbytes(total << bus_size) if self.with_data else b""
+
+        return AxBlock(block_no, ids, addrs, lens, sizes, bursts, beat_offsets, data)
+
+    def _advance(self) -> Tuple[int, int, int, int, int]:
+        row = next(self.rows, None)
+        if row is None:
+            self.block = self.gen_block(self.block_no)
+            self.block_no += 1
+            self.rows = self.block.rows()
+            self.index = 0
+            row = next(self.rows)
+        self.index += 1
+        return row
+
+    def __iter__(self) -> "StimulusStream":
+        return self
+
+    def __next__(self) -> AxFlit:
+        id, addr, len, size, burst = self._advance()
+        return AxFlit(id, addr, len, size, BURST_OF[burst])
+
+    def next_write(self) -> Tuple[AxFlit, WBatch]:
+        """
+        Next request together with its W data (random bytes placed on the lanes of every beat).
+        """
+        assert self.with_data, f"Stimulus stream {self.stream} was created without data"
+        aw = next(self)
+
+        bus_size = self.cfg.busSize
+        start = self.block.beat_offsets[self.index - 1] << bus_size
+        raw = memoryview(self.block.data)[start:start + ((aw.len + 1) << bus_size)]
+
+        return aw, WBatch.from_raw(aw, raw, bus_size)
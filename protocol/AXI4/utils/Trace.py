@@ -0,0 +1,328 @@
+"""
+    Binary AXI trace format.
+
+    A trace is a 16-byte file header followed by fixed-size records, one per AW/AR/B transfer
+    and one per W/R beat, in capture order:
+
+        header: magic (8s) | version (H) | bus_bytes (H) | record_size (I)
+        record: cycle (Q) | channel (B) | flags (B) | len (B) | size (B) | burst/resp (B)
+                | lock (B) | cache (B) | prot (B) | qos (B) | region (B) | pad (2x)
+                | id (I) | addr (Q) | user (Q) | data (bus_bytes) | strb (ceil(bus_bytes / 8))
+
+    Data and strobes are stored as raw little-endian bytes, so the record size only depends on the bus width
+    (112 bytes for a 512-bit bus) and record i is at a fixed offset: the reader maps the file and decodes
+    records lazily, without loading it.
+"""
+import mmap
+import struct
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from PyVeriUtils.protocol.AXI4.spec.Encodings import BurstType, Channel, RespType
+from PyVeriUtils.protocol.AXI4.spec.Flit import AxFlit, BFlit, RBatch, RFlit, WBatch, WFlit
+from PyVeriUtils.protocol.AXI4.spec.Task import AxTask, BTask, RTask, WTask
+
+MAGIC   = b"PVAXITRC"
+VERSION = 1
+
+FILE_HDR = struct.Struct("<8sHHI")
+REC_HDR  = struct.Struct("<QBBBBBBBBBB2xIQQ")
+
+# Record flags.
+F_LAST  = 0x1
+F_USER  = 0x2  # user is present
+F_ATTRS = 0x4  # lock/cache/prot/qos/region are present
+
+# Channel and encodings by value (cheaper than calling the Enums while decoding).
+CHANNEL_OF = {chnl.value: chnl for chnl in Channel}
+BURST_OF   = {burst.value: burst for burst in BurstType}
+RESP_OF    = {resp.value: resp for resp in RespType}
+
+Flit = Union[AxFlit, WFlit, RFlit, BFlit]
+
+
+def record_size(bus_bytes: int) -> int:
+    return REC_HDR.size + bus_bytes + ((bus_bytes + 7) >> 3)
+
+
+class TraceWriter:
+    """
+    Streaming trace writer: records are packed into a preallocated buffer
+    and written to the file every `buffer_records` records.
+
+    Usage:
+        with TraceWriter("run.trc", cfg.busBytes) as trace:
+            trace.write(Channel.AW, cycle, aw_flit)
+            trace.write_batch(Channel.W, cycle, w_batch)
+    """
+    def __init__(self, path: str, bus_bytes: int, buffer_records: int = 4096) -> None:
+        self.path = path
+        self.bus_bytes = bus_bytes
+        self.strb_bytes = (bus_bytes + 7) >> 3
+        self.rec_size = record_size(bus_bytes)
+        self.nr_records = 0
+
+        self.file = open(path, "wb")
+        self.file.write(FILE_HDR.pack(MAGIC, VERSION, bus_bytes, self.rec_size))
+
+        self.buf = bytearray(buffer_records * self.rec_size)
+        self.buf_records = buffer_records
+        self.fill = 0  # Records currently in buf.
+
+    def _pack(
+            self,
+            cycle: int,
+            chnl : Channel,
+            flags: int,
+            len  : int = 0,
+            size : int = 0,
+            code : int = 0,
+            attrs: Tuple[int, int, int, int, int] = (0, 0, 0, 0, 0),
+            id   : int = 0,
+            addr : int = 0,
+            user : Optional[int] = None,
+            data : int = 0,
+            strb : int = 0
+    ) -> None:
+        if user is not None:
+            # Raw handle values (e.g. cocotb's BinaryValue) are not ints; the field is 64 bits wide.
+            user = int(user)
+            assert 0 <= user < 1 << 64, f"{self.path}: user {user:#x} does not fit the 64-bit user field"
+            flags |= F_USER
+        else:
+            user = 0
+        off = self.fill * self.rec_size
+        REC_HDR.pack_into(self.buf, off, cycle, chnl.value, flags, len, size, code, *attrs, id, addr, user)
+
+        off += REC_HDR.size
+        self.buf[off:off + self.bus_bytes] = data.to_bytes(self.bus_bytes, "little")
+        off += self.bus_bytes
+        self.buf[off:off + self.strb_bytes] = strb.to_bytes(self.strb_bytes, "little")
+
+        self.fill += 1
+        self.nr_records += 1
+        if self.fill == self.buf_records:
+            self.flush()
+
+    def write_ax(self, chnl: Channel, cycle: int, flit: AxFlit) -> None:
+        attrs = (flit.lock, flit.cache, flit.prot, flit.qos, flit.region)
+        has_attrs = any(attr is not None for attr in attrs)
+        self._pack(
+            cycle, chnl, F_ATTRS if has_attrs else 0, flit.len, flit.size, BurstType(flit.burst).value,
+            tuple(attr or 0 for attr in attrs), flit.id, flit.addr, flit.user
+        )
+
+    def write_w(self, cycle: int, flit: WFlit) -> None:
+        self._pack(cycle, Channel.W, F_LAST if flit.last else 0, user = flit.user, data = flit.data, strb = flit.strb)
+
+    def write_r(self, cycle: int, flit: RFlit) -> None:
+        self._pack(
+            cycle, Channel.R, F_LAST if flit.last else 0, code = RespType(flit.resp).value,
+            id = flit.id, user = flit.user, data = flit.data
+        )
+
+    def write_b(self, cycle: int, flit: BFlit) -> None:
+        self._pack(cycle, Channel.B, 0, code = RespType(flit.resp).value, id = flit.id, user = flit.user)
+
+    def write(self, chnl: Channel, cycle: int, flit: Flit) -> None:
+        """
+        Write one transfer (AW/AR/B) or one beat (W/R).
+        """
+        if Channel.is_addr_chnl(chnl):
+            self.write_ax(chnl, cycle, flit)
+        elif chnl == Channel.W:
+            self.write_w(cycle, flit)
+        elif chnl == Channel.R:
+            self.write_r(cycle, flit)
+        else:
+            self.write_b(cycle, flit)
+
+    def write_batch(self, chnl: Channel, cycle: int, batch: Union[WBatch, RBatch]) -> None:
+        """
+        Write every beat of a W/R batch, all stamped with `cycle`.
+        """
+        last = len(batch.datas) - 1
+        if chnl == Channel.W:
+            for i, (data, strb) in enumerate(zip(batch.datas, batch.strbs)):
+                self._pack(cycle, Channel.W, F_LAST if i == last else 0, user = batch.user, data = data, strb = strb)
+        else:
+            resp = RespType(batch.resp).value
+            for i, data in enumerate(batch.datas):
+                self._pack(cycle, Channel.R, F_LAST if i == last else 0, code = resp, id = batch.id, user = batch.user, data = data)
+
+    def write_task(self, task, cycle: Optional[int] = None) -> None:
+        """
+        Write the flit or batch of an AxTask/WTask/RTask/BTask, stamped with `cycle` (its alloc_cycle by default).
+        """
+        cycle = task.alloc_cycle if cycle is None else cycle
+        batch = getattr(task, "batch", None)
+        if batch is not None:
+            self.write_batch(task.channel, cycle, batch)
+        else:
+            self.write(task.channel, cycle, task.flit)
+
+    def flush(self) -> None:
+        self.file.write(memoryview(self.buf)[:self.fill * self.rec_size])
+        self.fill = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.file.close()
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class TraceReader:
+    """
+    Reads a trace through a read-only mmap: records are decoded lazily, one at a time,
+    so traces larger than the host memory are replayed at disk speed.
+
+    Iterating yields (cycle, Channel, flit) tuples in capture order.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file = open(path, "rb")
+        self.mm = mmap.mmap(self.file.fileno(), 0, access = mmap.ACCESS_READ)
+        self.view = memoryview(self.mm)
+
+        magic, version, self.bus_bytes, self.rec_size = FILE_HDR.unpack_from(self.mm, 0)
+        assert magic == MAGIC, f"{path} is not an AXI trace"
+        assert version == VERSION, f"{path}: unsupported trace version {version}"
+        self.strb_bytes = (self.bus_bytes + 7) >> 3
+
+        self.nr_records = (len(self.mm) - FILE_HDR.size) // self.rec_size
+
+    def __len__(self) -> int:
+        return self.nr_records
+
+    def record(self, i: int) -> Tuple[int, Channel, Flit]:
+        """
+        Decode record `i` as (cycle, channel, flit).
+        """
+        off = FILE_HDR.size + i * self.rec_size
+        cycle, chnl, flags, len, size, code, lock, cache, prot, qos, region, id, addr, user = \
+            REC_HDR.unpack_from(self.mm, off)
+        chnl = CHANNEL_OF[chnl]
+        user = user if flags & F_USER else None
+
+        if chnl == Channel.AW or chnl == Channel.AR:
+            if flags & F_ATTRS:
+                return cycle, chnl, AxFlit(id, addr, len, size, BURST_OF[code], lock, cache, prot, qos, region, user)
+            return cycle, chnl, AxFlit(id, addr, len, size, BURST_OF[code], user = user)
+
+        if chnl == Channel.B:
+            return cycle, chnl, BFlit(id, RESP_OF[code], user)
+
+        off += REC_HDR.size
+        data = int.from_bytes(self.view[off:off + self.bus_bytes], "little")
+        last = bool(flags & F_LAST)
+        if chnl == Channel.W:
+            off += self.bus_bytes
+            strb = int.from_bytes(self.view[off:off + self.strb_bytes], "little")
+            return cycle, chnl, WFlit(data, strb, last, user)
+        return cycle, chnl, RFlit(id, data, RESP_OF[code], last, user)
+
+    def __iter__(self) -> Iterator[Tuple[int, Channel, Flit]]:
+        for i in range(self.nr_records):
+            yield self.record(i)
+
+    def iter_channel(self, chnl: Channel) -> Iterator[Tuple[int, Flit]]:
+        """
+        (cycle, flit) of the records of one channel, in one in-order walk of the mapping:
+        the other records are skipped on their channel byte, without being decoded or copied.
+        """
+        mm, code = self.mm, chnl.value
+        off = FILE_HDR.size + 8  # Channel byte of record 0.
+        for i in range(self.nr_records):
+            if mm[off] == code:
+                cycle, _, flit = self.record(i)
+                yield cycle, flit
+            off += self.rec_size
+
+    def tasks(self, chnl: Channel, timeout_threshold: int = 10000, label: Optional[str] = None) -> Iterator:
+        """
+        Replay one channel as the tasks agents consume (see TaskAssembler).
+        To replay several channels, `all_tasks()` reads the file once instead of once per channel.
+        """
+        asm = TaskAssembler(chnl, timeout_threshold, label)
+        for cycle, flit in self.iter_channel(chnl):
+            task = asm.push(cycle, flit)
+            if task is not None:
+                yield task
+
+    def all_tasks(self, timeout_threshold: int = 10000, label: Optional[str] = None) -> Iterator[Tuple[Channel, object]]:
+        """
+        Replay every channel in a single pass: each record is dispatched to the TaskAssembler of its channel
+        as it is read, and (channel, task) is yielded as soon as the task is complete.
+        Tasks of one channel come in the same order as from `tasks(chnl)`.
+        """
+        asms = [TaskAssembler(chnl, timeout_threshold, label) for chnl in Channel]
+        for cycle, chnl, flit in self:
+            task = asms[chnl.value].push(cycle, flit)
+            if task is not None:
+                yield chnl, task
+
+    def close(self) -> None:
+        self.view.release()
+        self.mm.close()
+        self.file.close()
+
+    def __enter__(self) -> "TraceReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class TaskAssembler:
+    """
+    Turns the records of one channel, in capture order, into the tasks agents consume:
+    AxTask/BTask per transfer, WTask/RTask per burst (beats gathered up to `last`).
+    alloc_cycle is the cycle of the (first) record.
+
+    R beats are gathered per ID, since bursts of different IDs may interleave; an RTask is complete
+    when its ID sees `last`. W beats carry no ID in AXI4 and are gathered in order.
+    """
+    def __init__(self, chnl: Channel, timeout_threshold: int = 10000, label: Optional[str] = None) -> None:
+        self.chnl = chnl
+        self.timeout_threshold = timeout_threshold
+        self.label = label
+
+        self.first_cycle = 0
+        self.beats: List[WFlit] = []
+        # ID -> (cycle of the first beat, beats so far) of every unfinished R burst.
+        self.bursts: Dict[int, Tuple[int, List[RFlit]]] = {}
+
+    def push(self, cycle: int, flit: Flit):
+        """
+        Add one record; return the task it completes, or None.
+        """
+        chnl = self.chnl
+        if chnl == Channel.AW or chnl == Channel.AR:
+            return AxTask.customized(flit, chnl, cycle, self.timeout_threshold, self.label)
+        if chnl == Channel.B:
+            return BTask.customized(flit, cycle, self.timeout_threshold, self.label)
+
+        if chnl == Channel.W:
+            if not self.beats:
+                self.first_cycle = cycle
+            self.beats.append(flit)
+            if not flit.last:
+                return None
+            beats, self.beats = self.beats, []
+            batch = WBatch([b.data for b in beats], [b.strb for b in beats], user = beats[0].user)
+            return WTask.customized(batch, self.first_cycle, self.timeout_threshold, self.label)
+
+        burst = self.bursts.get(flit.id)
+        if burst is None:
+            burst = self.bursts[flit.id] = (cycle, [])
+        burst[1].append(flit)
+        if not flit.last:
+            return None
+        del self.bursts[flit.id]
+        first_cycle, beats = burst
+        batch = RBatch(flit.id, [b.data for b in beats], flit.resp, user = beats[0].user)
+        return RTask.customized(batch, first_cycle, self.timeout_threshold, self.label)
@@ -0,0 +1,52 @@
+"""
+    AXI4_DB_Helper round trip: the rows read back equal the saved flits (data and strobes
+    decoded from little-endian BLOBs), across hand-overs to the writer thread;
+    addresses too wide for an INTEGER column are refused on the calling thread.
+"""
+import pytest
+
+from PyVeriUtils.protocol.AXI4.spec.Encodings import BurstType, RespType
+from PyVeriUtils.protocol.AXI4.spec.Flit import AxFlit, BFlit, RFlit, WFlit
+from PyVeriUtils.protocol.AXI4.utils.DataBase import INT_LIMIT, AXI4_DB_Helper
+
+
+def blob(v: bytes) -> int:
+    return int.from_bytes(v, "little")
+
+
+def test_round_trip(tmp_path):
+    aws = [AxFlit(i, INT_LIMIT - 1 - i, i, 6, BurstType.WRAP) for i in range(5)]
+    ws  = [WFlit((1 << 511) | i, (1 << 64) - 1, i == 4) for i in range(5)]
+    bs  = [BFlit(i, RespType.SLAVERR) for i in range(5)]
+    rs  = [RFlit(i, i, RespType.OKAY, True) for i in range(5)]
+
+    with AXI4_DB_Helper(str(tmp_path / "axi.db"), batch_size = 3) as db:
+        for cycle in range(5):
+            db.aw_save_db(cycle, "mst", aws[cycle])
+            db.ar_save_db(cycle, "slv", aws[cycle])
+            db.w_save_db(cycle, "mst", ws[cycle])
+            db.b_save_db(cycle, "mst", bs[cycle])
+            db.r_save_db(cycle, "slv", rs[cycle])
+        db.flush()
+
+        agents = dict(db.query("SELECT name, agent FROM agents"))
+        assert set(agents) == {"mst", "slv"}
+
+        ax = [(c, agents["mst"], f.id, f.addr, f.len, f.size, f.burst.value) for c, f in enumerate(aws)]
+        assert db.query("SELECT * FROM aw ORDER BY cycle") == ax
+        assert db.query("SELECT * FROM ar ORDER BY cycle") == [(*row[:1], agents["slv"], *row[2:]) for row in ax]
+
+        w = [(c, a, blob(d), blob(s), l) for c, a, d, s, l in db.query("SELECT * FROM w ORDER BY cycle")]
+        assert w == [(c, agents["mst"], f.data, f.strb, f.last) for c, f in enumerate(ws)]
+        assert db.query("SELECT * FROM b ORDER BY cycle") == [(c, agents["mst"], f.id, f.resp.value) for c, f in enumerate(bs)]
+        r = [(c, a, i, blob(d), resp, l) for c, a, i, d, resp, l in db.query("SELECT * FROM r ORDER BY cycle")]
+        assert r == [(c, agents["slv"], f.id, f.data, f.resp.value, f.last) for c, f in enumerate(rs)]
+
+
+def test_wide_addr_is_refused_on_the_calling_thread(tmp_path):
+    with AXI4_DB_Helper(str(tmp_path / "axi.db")) as db:
+        with pytest.raises(AssertionError):
+            db.aw_save_db(0, "mst", AxFlit(0, INT_LIMIT, 0, 6))
+        with pytest.raises(AssertionError):
+            db.ar_save_db(0, "mst", AxFlit(0, (1 << 64) - 1, 0, 6))
+        assert db.nr_buffered == 0
@@ -0,0 +1,65 @@
+"""
+    Trace round trip: what TraceWriter packs, TraceReader decodes back to equal flits,
+    and the single-pass all_tasks() replays the same tasks as tasks() per channel.
+"""
+import pytest
+
+from PyVeriUtils.protocol.AXI4.spec.Encodings import BurstType, Channel, RespType
+from PyVeriUtils.protocol.AXI4.spec.Flit import AxFlit, BFlit, RFlit, WFlit
+from PyVeriUtils.protocol.AXI4.utils.Trace import TraceReader, TraceWriter
+from PyVeriUtils.signals.Mock.MockDut import MockValue
+
+BUS_BYTES = 64
+
+RECORDS = [
+    (0, Channel.AW, AxFlit(1, 0x1000, 1, 6, BurstType.INCR, user = 3)),
+    (1, Channel.AR, AxFlit(2, 0x2040, 3, 6, BurstType.WRAP, 0, 2, 1, 4, 5, (1 << 64) - 1)),
+    (1, Channel.W , WFlit(0xdead, 0xff, False, 3)),
+    (2, Channel.W , WFlit((1 << 511) | 1, (1 << 64) - 1, True, 3)),
+    (3, Channel.R , RFlit(2, 0xa0, RespType.OKAY, False)),
+    (3, Channel.R , RFlit(5, 0xb0, RespType.SLAVERR, True)),  # Another ID interleaves and completes first.
+    (4, Channel.B , BFlit(1, RespType.EXOKAY)),
+    (5, Channel.R , RFlit(2, 0xa1, RespType.OKAY, False)),
+    (6, Channel.R , RFlit(2, 0xa2, RespType.OKAY, False)),
+    (7, Channel.R , RFlit(2, 0xa3, RespType.OKAY, True)),
+]
+
+
+def write_trace(path) -> None:
+    with TraceWriter(str(path), BUS_BYTES, buffer_records = 3) as trace:
+        for cycle, chnl, flit in RECORDS:
+            trace.write(chnl, cycle, flit)
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "run.trc"
+    write_trace(path)
+
+    with TraceReader(str(path)) as trace:
+        assert list(trace) == RECORDS
+        for chnl in Channel:
+            assert list(trace.iter_channel(chnl)) == [(cycle, flit) for cycle, c, flit in RECORDS if c == chnl]
+
+
+def test_all_tasks_matches_tasks_per_channel(tmp_path):
+    path = tmp_path / "run.trc"
+    write_trace(path)
+
+    with TraceReader(str(path)) as trace:
+        one_pass = list(trace.all_tasks(label = "replay"))
+        for chnl in Channel:
+            expected = [str(task) for task in trace.tasks(chnl, label = "replay")]
+            assert [str(task) for c, task in one_pass if c == chnl] == expected, Channel.enum_to_str(chnl)
+
+        r_bursts = [task.batch for c, task in one_pass if c == Channel.R]
+        assert [(r.id, r.datas) for r in r_bursts] == [(5, [0xb0]), (2, [0xa0, 0xa1, 0xa2, 0xa3])]
+
+
+def test_user_is_converted_and_checked(tmp_path):
+    with TraceWriter(str(tmp_path / "user.trc"), BUS_BYTES) as trace:
+        trace.write(Channel.B, 0, BFlit(1, RespType.OKAY, MockValue(7)))  # A raw handle value, not an int.
+        with pytest.raises(AssertionError):
+            trace.write(Channel.B, 1, BFlit(1, RespType.OKAY, 1 << 64))
+
+    with TraceReader(str(tmp_path / "user.trc")) as trace:
+        assert list(trace) == [(0, Channel.B, BFlit(1, RespType.OKAY, 7))]
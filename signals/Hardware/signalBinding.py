@@ -1,4 +1,178 @@
-from typing import List, Optional
+from collections import deque, namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from PyVeriUtils.utils.Common.CodeGen import compile_function
+
+
+@dataclass
+class BindingRecord:
+    path  : str
+    owner : str   # Class name of the binding that requested the handle.
+    cached: bool  # True if the handle was served from HandleCache.
+
+
+class HandleCache:
+    """
+        Process-wide cache of resolved signal handles, keyed by (dut, hierarchical path).
+
+        cocotb keeps the same top-level dut handle alive for every test in a regression,
+        so handles resolved by one test are reused by the following ones instead of walking the
+        simulator hierarchy again. Call `clear()` if handles may have become stale.
+
+        Resolutions are counted (`nr_resolved`, `nr_hits`) and the last `MAX_RECORDS` of them are kept
+        in `records` instead of being printed, so the log stays bounded over a long regression.
+        Set `verbose = True` to get the old "[Signal Binding] <path>" console output back.
+    """
+    MAX_RECORDS = 4096
+
+    handles    : Dict[Tuple[Any, str], Any] = {}
+    records    : Deque[BindingRecord] = deque(maxlen = MAX_RECORDS)
+    nr_resolved: int = 0
+    nr_hits    : int = 0
+    verbose    : bool = False
+
+    @classmethod
+    def resolve(cls, dut, path: str, owner: str = "") -> Any:
+        key    = (dut, path)
+        handle = cls.handles.get(key)
+        cached = handle is not None
+
+        if not cached:
+            handle = getattr(dut, path)
+            cls.handles[key] = handle
+
+        cls.nr_resolved += 1
+        cls.nr_hits += cached
+        cls.records.append(BindingRecord(path, owner, cached))
+        if cls.verbose:
+            print(f"[Signal Binding] {path}{' (cached)' if cached else ''}")
+
+        return handle
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.handles.clear()
+        cls.records.clear()
+        cls.nr_resolved = 0
+        cls.nr_hits = 0
+
+    @classmethod
+    def report(cls) -> str:
+        lines = [f"[Signal Binding] {cls.nr_resolved} bindings, {cls.nr_hits} cache hits, {len(cls.handles)} handles cached"]
+        if cls.nr_resolved > len(cls.records):
+            lines.append(f"\t(last {len(cls.records)} bindings)")
+        lines += [f"\t{rec.owner:<12} {rec.path}{' (cached)' if rec.cached else ''}" for rec in cls.records]
+
+        return "\n".join(lines)
+
+
+class ShadowGroup:
+    """
+        Dirty list and write counters shared by the ShadowSignals of one bundle.
+
+        `flush()` should be called once per drive_phase. It writes only the fields whose shadow
+        value differs from the value last written to the simulator; all other writes are elided.
+    """
+    __slots__ = ("dirty", "writes_issued", "writes_elided")
+
+    def __init__(self) -> None:
+        self.dirty: List["ShadowSignal"] = []
+        self.writes_issued: int = 0
+        self.writes_elided: int = 0
+
+    @staticmethod
+    def of(shadow: Union[bool, "ShadowGroup", None]) -> Optional["ShadowGroup"]:
+        if isinstance(shadow, ShadowGroup):
+            return shadow
+        return ShadowGroup() if shadow else None
+
+    def flush(self) -> None:
+        for sig in self.dirty:
+            if sig.pending != sig.flushed:
+                sig.handle.value = sig.pending
+                sig.flushed = sig.pending
+                self.writes_issued += 1
+            else:
+                self.writes_elided += 1
+            sig.pending = ShadowSignal.UNSET
+        self.dirty.clear()
+
+
+class ShadowSignal:
+    """
+        Python-side shadow of a signal handle. Writes to `.value` are buffered in the owning
+        ShadowGroup until it is flushed.
+
+        A read returns the pending write if there is one (so a value written earlier in the same drive_phase
+        reads back as written, not as the simulator's old value), and the simulator's value otherwise.
+
+        The group assumes it is the only driver of its signals: `flushed` remembers the last value it wrote,
+        and a write equal to it is elided. If something else drives the signal in between, call `resync()`.
+    """
+    __slots__ = ("handle", "group", "pending", "flushed")
+
+    UNSET = object()
+
+    def __init__(self, handle, group: ShadowGroup) -> None:
+        self.handle  = handle
+        self.group   = group
+        self.pending = ShadowSignal.UNSET
+        self.flushed = ShadowSignal.UNSET  # Unknown until the first flush, so it is never elided.
+
+    @property
+    def value(self):
+        pending = self.pending
+        return self.handle.value if pending is ShadowSignal.UNSET else pending
+
+    @value.setter
+    def value(self, value) -> None:
+        if self.pending is ShadowSignal.UNSET:
+            self.group.dirty.append(self)
+        self.pending = value
+
+    def resync(self) -> None:
+        """
+            Forget the last flushed value, so the next flush writes the signal even if it looks unchanged.
+        """
+        self.flushed = ShadowSignal.UNSET
+
+
+@lru_cache(maxsize=None)
+def record_type(fields: Tuple[str, ...]):
+    """
+        Return the (shared) namedtuple type used to hold one sample of a bundle with the given fields.
+    """
+    return namedtuple("BundleRecord", fields)
+
+
+class Snapshot:
+    """
+        Values of a DecoupledIO sampled once in sample_phase.
+
+        valid and ready are read when the snapshot is taken. `bits` is a namedtuple in field order,
+        read from `payload` on first access and only when valid is high (the payload is meaningless otherwise).
+        So the payload of a channel an agent drives itself, or of a transfer nobody receives, is never read.
+    """
+    __slots__ = ("valid", "ready", "payload", "record")
+
+    def __init__(self, valid: bool, ready: bool, payload) -> None:
+        self.valid   = valid
+        self.ready   = ready
+        self.payload = payload if valid else None
+        self.record: Optional[tuple] = None
+
+    @property
+    def bits(self) -> Optional[tuple]:
+        if self.record is None and self.payload is not None:
+            self.record = self.payload.sample()
+        return self.record
+
+    def fire(self) -> bool:
+        return self.valid and self.ready
+
 
 class SignalBinding:
     """
@@ -16,20 +190,84 @@ class SignalBinding:
 
         return f"{hierar_str}{prefix_str}{suffix}"
 
+    # Handles are resolved lazily: `_defer()` only records where a signal lives,
+    # and the first attribute access resolves it through HandleCache and stores it on the instance,
+    # so subsequent accesses are plain attribute lookups that never reach `__getattr__` again.
+    #
+    # If the binding has a ShadowGroup (shadow-register mode), every handle is wrapped in a ShadowSignal.
+    def _defer(self, dut, name: str, path: str, lazy: bool = True) -> None:
+        if lazy:
+            self.__dict__.setdefault("_unbound", {})[name] = (dut, path)
+        else:
+            self._bind(dut, name, path)
+
+    def _bind(self, dut, name: str, path: str):
+        handle = HandleCache.resolve(dut, path, type(self).__name__)
+        shadow = self.__dict__.get("shadow")
+        if shadow is not None:
+            handle = ShadowSignal(handle, shadow)
+        setattr(self, name, handle)
+
+        return handle
+
+    def __getattr__(self, name: str):
+        unbound = self.__dict__.get("_unbound")
+        if unbound is None or name not in unbound:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        dut, path = unbound.pop(name)
+
+        return self._bind(dut, name, path)
+
+    def bind_all(self) -> None:
+        """
+            Resolve every deferred handle now, e.g. to surface missing signals at elaboration time.
+        """
+        for name in list(self.__dict__.get("_unbound", {})):
+            getattr(self, name)
+
+    def flush(self) -> None:
+        """
+            Write dirty shadow registers to the simulator. No-op unless in shadow-register mode.
+        """
+        if self.shadow is not None:
+            self.shadow.flush()
+
+    def shadow_stats(self) -> Tuple[int, int]:
+        """
+            Return (writes issued, writes elided) since construction.
+        """
+        if self.shadow is None:
+            return 0, 0
+        return self.shadow.writes_issued, self.shadow.writes_elided
+
+    # Bulk connections (`dst <= src`) build a copy plan once per (dst, src) pair and cache it on dst.
+    # Endpoints bound to signals are keyed by identity; software payloads are keyed by type,
+    # since a new payload object is usually handed over every cycle.
+    def connect_plan(self, src) -> Callable:
+        key  = src if isinstance(src, SignalBinding) else type(src)
+        plan = self.connect_plans.get(key)
+        if plan is None:
+            plan = self.connect_plans[key] = self.build_connect_plan(src)
+        return plan
+
+    def build_connect_plan(self, src) -> Callable:
+        raise TypeError(f"{type(self).__name__} cannot be connected to {type(src).__name__}")
+
 class DutSignal(SignalBinding):
     def __init__(
             self,
             dut ,
             suffix   : str,
             prefix   : Optional[str] = None,
-            hierarchy: Optional[str] = None
-
+            hierarchy: Optional[str] = None,
+            lazy     : bool = True,
+            shadow   : Union[bool, ShadowGroup] = False
     ) -> None:
+        self.shadow: Optional[ShadowGroup] = ShadowGroup.of(shadow)
         path: str = self.hierarchical_path(suffix, prefix, hierarchy)
 
-        print(f"[Signal Binding] {path}")
-
-        setattr(self, suffix, getattr(dut, path))
+        self._defer(dut, suffix, path, lazy)
 
 class DutBundle(SignalBinding):
     def __init__(
@@ -37,16 +275,86 @@ class DutBundle(SignalBinding):
             dut,
             fields: List[str],
             prefix: Optional[str] = None,
-            hierarchy: Optional[str] = None
+            hierarchy: Optional[str] = None,
+            lazy: bool = True,
+            shadow: Union[bool, ShadowGroup] = False
     ) -> None:
+        self.shadow: Optional[ShadowGroup] = ShadowGroup.of(shadow)
+        self.fields: List[str] = list(fields)
+        self.record_type = record_type(tuple(fields))
+        self.connect_plans: Dict[Any, Callable] = {}
+        self.sample_plan: Optional[Callable] = None
+
         for field in fields:
             path: str = self.hierarchical_path(field, prefix, hierarchy)
 
-            print(f"[Signal Binding] {path}")
+            self._defer(dut, field, path, lazy)
+
+    def sample(self) -> tuple:
+        """
+            Read every field once and return them as a `record_type` namedtuple.
+
+            The reads go through a compiled plan, built on the first call (not in the constructor,
+            so that handles stay lazily bound until the bundle is actually sampled).
+        """
+        plan = self.sample_plan
+        if plan is None:
+            plan = self.sample_plan = self.build_sample_plan()
+        return plan()
+
+    def build_sample_plan(self) -> Callable:
+        env = {"tuple_new": tuple.__new__, "record": self.record_type}
+        reads = []
+        for i, field in enumerate(self.fields):
+            env[f"s{i}"] = getattr(self, field)
+            reads.append(f"s{i}.value, ")
+
+        return compile_function("sample_bits", [], [f"return tuple_new(record, ({''.join(reads)}))"], env)
 
-            setattr(self, field, getattr(dut, path))
+    def __le__(self, src) -> "DutBundle":
+        """
+            Bulk connect: `dst <= src` drives every field of dst from the field of the same name in src.
 
-        # TODO: rewrite <= and >=
+            src is either another DutBundle (fields missing on either side are skipped)
+            or a software payload with one attribute per field (a Flit, a `record_type` sample, ...).
+            Only fields whose value changed since the last copy are written.
+        """
+        self.connect_plan(src)(src)
+        return self
+
+    def __ge__(self, dst) -> "DutBundle":
+        if not isinstance(dst, DutBundle):
+            return NotImplemented
+        dst <= self
+        return self
+
+    def build_connect_plan(self, src) -> Callable:
+        # last[i] holds the value last written to field i, so an unchanged field costs a compare and no write.
+        env   = {"last": [], "Enum": Enum}
+        lines = []
+        if isinstance(src, DutBundle):
+            for field in self.fields:
+                if field in src.fields:
+                    i = len(env["last"])
+                    env[f"s{i}"] = getattr(src, field)
+                    lines.append(f"v = s{i}.value")
+                    lines += self._copy_lines(env, field)
+        elif isinstance(src, SignalBinding):
+            return super().build_connect_plan(src)
+        else:
+            for field in self.fields:
+                lines.append(f"v = src.{field}")
+                lines.append("if isinstance(v, Enum): v = v.value")
+                lines += self._copy_lines(env, field)
+
+        return compile_function("connect_bits", ["src"], lines or ["pass"], env)
+
+    def _copy_lines(self, env: Dict[str, Any], field: str) -> List[str]:
+        i = len(env["last"])
+        env["last"].append(ShadowSignal.UNSET)
+        env[f"d{i}"] = getattr(self, field)
+
+        return [f"if v != last[{i}]:", f"    d{i}.value = v", f"    last[{i}] = v"]
 
 # The same bundle structure with DecoupledIO in chisel
 class DecoupledIO(SignalBinding):
@@ -70,22 +378,268 @@ class DecoupledIO(SignalBinding):
             fields   : List[str],
             prefix   : str,                   # Should always have a prefix for DecoupledIO bundle.
             hierarchy: Optional[str] = None,
-            has_bits : bool = True            # To control whether we have "bits" in signal name.
+            has_bits : bool = True,           # To control whether we have "bits" in signal name.
+            lazy     : bool = True,           # Resolve handles on first access instead of at construction.
+            shadow   : bool = False           # Buffer writes in shadow registers until flush().
     ) -> None:
-        self.bits  = DutBundle(dut, fields, prefix = f"{prefix}_bits" if has_bits else prefix, hierarchy = hierarchy)
-        self.valid = getattr(dut, self.hierarchical_path(
+        # valid/ready and bits share one ShadowGroup, so a single flush() per drive_phase covers the channel.
+        self.shadow: Optional[ShadowGroup] = ShadowGroup.of(shadow)
+        self.bits = DutBundle(dut, fields, prefix = f"{prefix}_bits" if has_bits else prefix, hierarchy = hierarchy, lazy = lazy, shadow = self.shadow)
+        self._defer(dut, "valid", self.hierarchical_path(
             suffix    = "valid",
             prefix    = prefix,
             hierarchy = hierarchy
-        ))
-        self.ready = getattr(dut, self.hierarchical_path(
+        ), lazy)
+        self._defer(dut, "ready", self.hierarchical_path(
             suffix    = "ready",
             prefix    = prefix,
             hierarchy = hierarchy
-        ))
+        ), lazy)
+
+        # Snapshot of the current cycle, taken by sample() and dropped by invalidate().
+        # sample() refills `snap_buf` in place, so taking a snapshot allocates nothing.
+        self.snap: Optional[Snapshot] = None
+        self.snap_buf = Snapshot(False, False, None)
+        self.connect_plans: Dict[Any, Callable] = {}
+
+    def bind_all(self) -> None:
+        super().bind_all()
+        self.bits.bind_all()
+
+    def sample(self) -> Snapshot:
+        """
+            Read valid and ready exactly once for this cycle; the bits are read on first use (see Snapshot).
+
+            Should be called at the start of sample_phase. Until `invalidate()` is called,
+            `fire()`, `is_ready()` and the Flit `recv()` constructors use the snapshot
+            instead of reading the simulator again.
+
+            The same Snapshot object is refilled every cycle: copy what you need out of it
+            rather than keeping the object across cycles.
+        """
+        snap = self.snap_buf
+        valid = bool(self.valid.value)
+        snap.valid   = valid
+        snap.ready   = bool(self.ready.value)
+        snap.payload = self.bits if valid else None
+        snap.record  = None
+        self.snap = snap
+
+        return snap
+
+    def snapshot(self) -> Snapshot:
+        """
+            The snapshot of this cycle, or a fresh one (not kept) outside the sample_phase.
+            Only `sample()` and `invalidate()` change the kept snapshot.
+        """
+        if self.snap is not None:
+            return self.snap
+        return Snapshot(bool(self.valid.value), bool(self.ready.value), self.bits)
+
+    def invalidate(self) -> None:
+        """
+            Drop the snapshot. Should be called at the start of drive_phase, before signals change.
+        """
+        self.snap = None
 
     def fire(self) -> bool:
+        if self.snap is not None:
+            return self.snap.valid and self.snap.ready
         return bool(self.valid.value and self.ready.value)
 
     def is_ready(self) -> bool:
-        return bool(self.ready.value)
\ No newline at end of file
+        if self.snap is not None:
+            return self.snap.ready
+        return bool(self.ready.value)
+
+    def __le__(self, src) -> "DecoupledIO":
+        """
+            Bulk connect: `dst <= src` forwards valid and bits from src to dst and ready from dst back to src.
+
+            src is either another DecoupledIO or a software endpoint (sDecoupledIO, or sValidIO which has no ready).
+            Bits are only copied while valid is high, and only the signals that changed are written.
+            Meant to be called once per cycle in drive_phase, e.g. by a pass-through bridge.
+        """
+        self.connect_plan(src)(src)
+        return self
+
+    def __ge__(self, dst) -> "DecoupledIO":
+        """
+            Bulk connect: `src >= dst` is `dst <= src`.
+
+            dst may also be a software endpoint: it then receives valid and a `record_type` sample
+            of the bits (None while valid is low), and its ready is driven back to this bundle.
+        """
+        if isinstance(dst, SignalBinding):
+            dst <= self
+            return self
+
+        valid = bool(self.valid.value)
+        dst.valid = valid
+        dst.bits  = self.bits.sample() if valid else None
+        if hasattr(dst, "ready"):
+            self.ready.value = int(dst.ready)
+        return self
+
+    def build_connect_plan(self, src) -> Callable:
+        # last = [valid, ready] as last written, so unchanged handshake signals are not rewritten.
+        last = [ShadowSignal.UNSET, ShadowSignal.UNSET]
+        valid, ready = self.valid, self.ready
+
+        if isinstance(src, DecoupledIO):
+            bits_plan = self.bits.connect_plan(src.bits)
+            s_valid, s_ready = src.valid, src.ready
+
+            def connect(_) -> None:
+                v = s_valid.value
+                if v != last[0]:
+                    valid.value = v
+                    last[0] = v
+                if v:
+                    bits_plan(None)
+                r = ready.value
+                if r != last[1]:
+                    s_ready.value = r
+                    last[1] = r
+
+            return connect
+
+        if isinstance(src, SignalBinding) or not (hasattr(src, "valid") and hasattr(src, "bits")):
+            return super().build_connect_plan(src)
+
+        has_ready = hasattr(src, "ready")
+
+        def connect(sio) -> None:
+            v = int(sio.valid)
+            if v != last[0]:
+                valid.value = v
+                last[0] = v
+            if v:
+                self.bits <= sio.bits
+            if has_ready:
+                sio.ready = bool(ready.value)
+
+        return connect
+
+class DecoupledIOArray:
+    """
+        N numbered DecoupledIO instances with identical structure, e.g. axi_0_aw_* ... axi_63_aw_*.
+
+        Batched operations walk every port in one Python loop and pack the results into an int bitmask
+        (bit i <=> port i), so one agent loop can serve all ports instead of N separate objects.
+
+        full hierarchical path of port i:
+            dut.<hierarchy>.<prefix>_<i>_bits_<fields>
+            dut.<hierarchy>.<prefix>_<i>_valid
+            dut.<hierarchy>.<prefix>_<i>_ready
+    """
+    def __init__(
+            self,
+            dut,
+            fields   : List[str],
+            prefix   : str,
+            size     : int,
+            hierarchy: Optional[str] = None,
+            has_bits : bool = True,
+            lazy     : bool = True,
+            shadow   : bool = False
+    ) -> None:
+        self.ports: List[DecoupledIO] = [
+            DecoupledIO(dut, fields, f"{prefix}_{i}", hierarchy, has_bits, lazy, shadow) for i in range(size)
+        ]
+
+    @classmethod
+    def from_ports(cls, ports: List[DecoupledIO]) -> "DecoupledIOArray":
+        """
+            Wrap already constructed ports, e.g. the same channel of several Axi4Bundles.
+        """
+        arr = cls.__new__(cls)
+        arr.ports = list(ports)
+
+        return arr
+
+    def __len__(self) -> int:
+        return len(self.ports)
+
+    def __getitem__(self, idx: int) -> DecoupledIO:
+        return self.ports[idx]
+
+    def __iter__(self):
+        return iter(self.ports)
+
+    def bind_all(self) -> None:
+        for port in self.ports:
+            port.bind_all()
+
+    def sample(self) -> None:
+        for port in self.ports:
+            port.sample()
+
+    def invalidate(self) -> None:
+        for port in self.ports:
+            port.invalidate()
+
+    def flush(self) -> None:
+        for port in self.ports:
+            port.flush()
+
+    def fire_mask(self) -> int:
+        mask = 0
+        for i, port in enumerate(self.ports):
+            if port.fire():
+                mask |= 1 << i
+        return mask
+
+    def valid_mask(self) -> int:
+        mask = 0
+        for i, port in enumerate(self.ports):
+            if (port.snap.valid if port.snap is not None else port.valid.value):
+                mask |= 1 << i
+        return mask
+
+    def ready_mask(self) -> int:
+        mask = 0
+        for i, port in enumerate(self.ports):
+            if port.is_ready():
+                mask |= 1 << i
+        return mask
+
+    def set_valid(self, mask: int) -> None:
+        """
+            Drive valid of every port from `mask` (bit i high <=> port i valid).
+        """
+        for i, port in enumerate(self.ports):
+            port.valid.value = (mask >> i) & 1
+
+    def set_ready(self, mask: int) -> None:
+        """
+            Drive ready of every port from `mask` (bit i high <=> port i ready).
+        """
+        for i, port in enumerate(self.ports):
+            port.ready.value = (mask >> i) & 1
+
+    def drive_valid(self, indices: Iterable[int], value: int = 1) -> None:
+        """
+            Drive valid only on the given ports, leaving the others untouched.
+        """
+        for i in indices:
+            self.ports[i].valid.value = value
+
+    def drive_ready(self, indices: Iterable[int], value: int = 1) -> None:
+        """
+            Drive ready only on the given ports, leaving the others untouched.
+        """
+        for i in indices:
+            self.ports[i].ready.value = value
+
+    @staticmethod
+    def indices(mask: int) -> List[int]:
+        """
+            Expand a port bitmask into the list of set indices, LSB first.
+        """
+        idx = []
+        while mask:
+            low = mask & -mask
+            idx.append(low.bit_length() - 1)
+            mask ^= low
+        return idx
@@ -0,0 +1,105 @@
+"""
+    Signal bindings against direct access to the dut: lazily bound handles are the ones an eager
+    binding resolves, and each (dut, path) is looked up in the simulator hierarchy only once;
+    snapshots hold what reading every signal directly returns, and the bitmasks of a DecoupledIOArray
+    are those of its numbered ports taken one by one.
+"""
+import random
+
+from PyVeriUtils.signals.Hardware.signalBinding import DecoupledIO, DecoupledIOArray, HandleCache, record_type
+from PyVeriUtils.signals.Mock.MockDut import MockDut
+
+FIELDS = ["id", "addr", "len"]
+
+
+class CountingDut:
+    """
+    Forwards every attribute lookup to a MockDut and counts them, like walking the simulator hierarchy.
+    """
+    def __init__(self) -> None:
+        self.mock = MockDut(widths = lambda path: 16)
+        self.lookups = []
+
+    def __getattr__(self, path: str):
+        self.lookups.append(path)
+        return getattr(self.mock, path)
+
+
+def test_lazy_binding_matches_eager():
+    HandleCache.clear()
+    dut = CountingDut()
+    lazy  = DecoupledIO(dut, FIELDS, "axi_aw")
+    assert dut.lookups == []  # Nothing resolved at construction.
+
+    eager = DecoupledIO(dut, FIELDS, "axi_aw", lazy = False)
+    paths = ["axi_aw_bits_id", "axi_aw_bits_addr", "axi_aw_bits_len", "axi_aw_valid", "axi_aw_ready"]
+    assert sorted(dut.lookups) == sorted(paths)
+
+    for field in FIELDS:
+        assert getattr(lazy.bits, field) is getattr(eager.bits, field) is getattr(dut.mock, f"axi_aw_bits_{field}")
+    assert lazy.valid is eager.valid and lazy.ready is eager.ready
+    assert sorted(dut.lookups) == sorted(paths), "a handle was looked up in the dut twice"
+    assert HandleCache.nr_resolved == 2 * len(paths) and HandleCache.nr_hits == len(paths)
+
+    again = DecoupledIO(dut, FIELDS, "axi_aw")
+    again.bind_all()
+    assert again.bits.addr is eager.bits.addr and len(dut.lookups) == len(paths)
+    assert f"{len(paths)} handles cached" in HandleCache.report()
+    HandleCache.clear()
+
+
+def test_snapshot_matches_direct_reads():
+    rng = random.Random(0)
+    dut = MockDut(widths = lambda path: 16)
+    io = DecoupledIO(dut, FIELDS, "axi_ar")
+    handles = {field: getattr(dut, f"axi_ar_bits_{field}") for field in FIELDS}
+
+    for _ in range(200):
+        dut.axi_ar_valid.value = rng.getrandbits(1)
+        dut.axi_ar_ready.value = rng.getrandbits(1)
+        for handle in handles.values():
+            handle.value = rng.getrandbits(16)
+        valid, ready = bool(dut.axi_ar_valid.value), bool(dut.axi_ar_ready.value)
+
+        snap = io.sample()
+        assert (snap.valid, snap.ready, io.fire()) == (valid, ready, valid and ready)
+        assert io.snapshot() is snap
+        if valid:
+            assert snap.bits == record_type(tuple(FIELDS))(*(handles[f].value for f in FIELDS))
+        else:
+            assert snap.bits is None  # The payload is not read while valid is low.
+        assert io.bits.sample() == tuple(handles[f].value for f in FIELDS)
+
+        io.invalidate()
+        assert io.snap is None and io.snapshot() is not snap and io.snapshot().valid == valid
+
+
+def test_array_masks_match_ports():
+    rng = random.Random(1)
+    dut = MockDut(widths = lambda path: 16)
+    arr = DecoupledIOArray(dut, FIELDS, "axi_aw", 12)
+    ports = [DecoupledIO(dut, FIELDS, f"axi_aw_{i}") for i in range(12)]
+
+    for step in range(200):
+        valid, ready = rng.getrandbits(12), rng.getrandbits(12)
+        if step & 1:
+            arr.set_valid(valid)
+            arr.set_ready(ready)
+        else:
+            for i, port in enumerate(ports):
+                port.valid.value = valid >> i & 1
+                port.ready.value = ready >> i & 1
+        if step & 2:
+            arr.sample()
+
+        assert arr.valid_mask() == sum(bool(p.valid.value) << i for i, p in enumerate(ports)) == valid
+        assert arr.ready_mask() == ready
+        assert arr.fire_mask() == sum(p.fire() << i for i, p in enumerate(ports)) == valid & ready
+        assert arr.indices(valid) == [i for i in range(12) if valid >> i & 1]
+        arr.invalidate()
+
+    arr.drive_valid([3, 5], 0)
+    arr.drive_ready(DecoupledIOArray.indices(0b1001))
+    assert [bool(ports[i].valid.value) for i in (3, 5)] == [False, False]
+    assert bool(ports[0].ready.value) and bool(ports[3].ready.value)
+    assert arr[7].bits.addr is ports[7].bits.addr
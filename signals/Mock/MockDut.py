@@ -0,0 +1,92 @@
+from operator import attrgetter
+from typing import Callable, Dict, Optional
+
+
+class MockValue(int):
+    """
+        Integer value of a MockSignal.
+
+        Mirrors the parts of cocotb's BinaryValue the framework relies on (`.integer`),
+        while still behaving as a plain int everywhere else.
+    """
+    __slots__ = ()
+
+    @property
+    def integer(self) -> int:
+        return int(self)
+
+
+class MockSignal:
+    """
+        A pure-Python stand-in for a cocotb signal handle.
+
+        Writes are masked to `width` bits and take effect immediately
+        (there is no delta-cycle scheduling, see MockDut).
+    """
+    __slots__ = ("name", "width", "mask", "_value")
+
+    def __init__(self, name: str, width: int = 1, init: int = 0) -> None:
+        assert width > 0, f"Width of {name} should be greater than zero!"
+
+        self.name   = name
+        self.width  = width
+        self.mask   = (1 << width) - 1
+        self._value = MockValue(init & self.mask)
+
+    def _set_value(self, value) -> None:
+        value = int(value) & self.mask
+        if value != self._value:
+            self._value = MockValue(value)
+
+    # The getter is a C-level attrgetter rather than a Python function: reads are the hottest path of a MockDut run.
+    value = property(attrgetter("_value"), _set_value)
+
+    def setimmediatevalue(self, value) -> None:
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"MockSignal({self.name}[{self.width - 1}:0] = {hex(self._value)})"
+
+
+class MockDut:
+    """
+        A simulator-free dut satisfying the `getattr(dut, path).value` contract of the signal bindings,
+        including `dut.cycles.value.integer`.
+
+        Signals are either declared with `add_signal()` or, if a `widths` resolver is given,
+        created on first access with the width it returns for the hierarchical path.
+        Paths are plain strings, so hierarchical paths like "u_top.axi_aw_valid" work as well.
+
+        Writes are visible immediately, so callers must respect the drive/sample ordering themselves:
+        drive every agent first, then sample every agent, then `tick()`.
+    """
+    def __init__(
+            self,
+            name  : str = "mock_dut",
+            widths: Optional[Callable[[str], int]] = None
+    ) -> None:
+        self.name = name
+        self.widths = widths
+        self.signals: Dict[str, MockSignal] = {}
+        self.cycles = self.add_signal("cycles", 64)
+
+    def add_signal(self, path: str, width: int = 1, init: int = 0) -> MockSignal:
+        sig = MockSignal(path, width, init)
+        self.signals[path] = sig
+        # Stored on the instance so later lookups never reach __getattr__.
+        self.__dict__[path] = sig
+
+        return sig
+
+    def __getattr__(self, path: str) -> MockSignal:
+        widths = self.__dict__.get("widths")
+        if widths is None or path.startswith("__"):
+            raise AttributeError(f"{self.__dict__.get('name', 'MockDut')} has no signal '{path}'")
+
+        return self.add_signal(path, widths(path))
+
+    def tick(self, cycles: int = 1) -> None:
+        self.cycles.value = self.cycles.value + cycles
+
+    def dump(self) -> str:
+        return "\n".join(repr(sig) for sig in self.signals.values())
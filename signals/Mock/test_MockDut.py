@@ -0,0 +1,40 @@
+"""
+    MockDut against the handle contract the bindings rely on: values masked to the signal width,
+    readable as ints and through `.integer`, signals created on first access, and the cycle counter.
+"""
+import random
+
+import pytest
+
+from PyVeriUtils.signals.Mock.MockDut import MockDut
+
+
+def test_signals_behave_like_masked_registers():
+    rng = random.Random(0)
+    dut = MockDut(widths = lambda path: int(path.rsplit("_", 1)[-1]))
+    ref = {}
+
+    for _ in range(2000):
+        path = f"sig_{rng.choice([1, 3, 8, 64, 512])}"
+        width = int(path.rsplit("_", 1)[-1])
+        value = rng.getrandbits(width + 8)
+        getattr(dut, path).value = value
+        ref[path] = value & ((1 << width) - 1)
+
+        read = getattr(dut, path).value
+        assert read == ref[path] and read.integer == ref[path] and isinstance(read, int)
+
+    assert {path: sig.value for path, sig in dut.signals.items() if path != "cycles"} == ref
+    assert getattr(dut, "sig_8") is dut.signals["sig_8"]
+
+
+def test_declared_signals_and_cycles():
+    dut = MockDut()
+    dut.add_signal("u_top.axi_aw_valid", 1, init = 1)
+    assert getattr(dut, "u_top.axi_aw_valid").value == 1
+    with pytest.raises(AttributeError):
+        dut.missing
+
+    dut.tick()
+    dut.tick(4)
+    assert dut.cycles.value.integer == 5
@@ -0,0 +1,131 @@
+import math
+import random
+import sys
+from array import array
+from typing import Dict, Tuple
+
+_BIT_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+_ASCII_TO_BIT = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class BitPattern:
+    """
+    A periodic bitstream, precomputed once and stored packed (8 cycles per byte, LSB first).
+
+    Reading the bit of a cycle is an index and a shift: `pattern[cycle]` costs no random draw.
+    Patterns built by the factories below are cached by their parameters, so agents asking for the same
+    (kind, parameters, seed) share one object.
+
+    Attributes:
+        bits (bytes): Packed bits, bit i in bits[i >> 3] at position i & 7.
+        length (int): Period in cycles.
+        name (str): Description of the pattern (for reports).
+    """
+    _cache: Dict[Tuple, "BitPattern"] = {}
+
+    def __init__(self, bits: bytes, length: int, name: str = "pattern") -> None:
+        assert length > 0, "A pattern must be at least one cycle long"
+        assert len(bits) >= (length + 7) >> 3, f"{name}: {len(bits)} bytes cannot hold {length} bits"
+        self.bits = bytes(bits)
+        self.length = length
+        self.name = name
+
+    def __getitem__(self, cycle: int) -> int:
+        i = cycle % self.length
+        return (self.bits[i >> 3] >> (i & 7)) & 1
+
+    def __len__(self) -> int:
+        return self.length
+
+    def duty(self) -> float:
+        """
+        Fraction of ones over one period.
+        """
+        return self.to_bytes().count(1) / self.length
+
+    def to_bytes(self) -> bytes:
+        """
+        The bits unpacked, one 0/1 byte per cycle.
+        """
+        packed = int.from_bytes(self.bits, "little")
+        return format(packed, f"0{len(self.bits) << 3}b")[::-1][:self.length].encode().translate(_ASCII_TO_BIT)
+
+    @classmethod
+    def from_bytes(cls, bits: bytes, name: str = "pattern") -> "BitPattern":
+        """
+        Pack a pattern given as one 0/1 byte per cycle.
+        """
+        ascii = bytes(bits).translate(_BIT_TO_ASCII)[::-1]
+        packed = int(ascii, 2) if ascii else 0
+        return cls(packed.to_bytes((len(bits) + 7) >> 3, "little"), len(bits), name)
+
+    @classmethod
+    def _cached(cls, key: Tuple, build) -> "BitPattern":
+        pattern = cls._cache.get(key)
+        if pattern is None:
+            pattern = cls._cache[key] = build()
+        return pattern
+
+    @classmethod
+    def constant(cls, value: int = 1) -> "BitPattern":
+        return cls._cached(("constant", value), lambda: cls(b"\x01" if value else b"\x00", 1, f"constant {value}"))
+
+    @classmethod
+    def random(cls, duty: float, length: int = 1 << 16, seed: int = 0) -> "BitPattern":
+        """
+        Independent cycles, each 1 with probability `duty` (16-bit resolution).
+        """
+        def build():
+            vals = array("H", random.Random(f"random/{duty}/{length}/{seed}").randbytes(length << 1))
+            if sys.byteorder != "little":
+                vals.byteswap()
+            threshold = round(duty * 0x10000)
+            return cls.from_bytes(bytes(v < threshold for v in vals), f"random duty {duty} (seed {seed})")
+
+        return cls._cached(("random", duty, length, seed), build)
+
+    @classmethod
+    def bursty(cls, on_mean: float, off_mean: float, length: int = 1 << 16, seed: int = 0) -> "BitPattern":
+        """
+        Alternating runs of ones and zeros with geometric lengths of mean `on_mean` and `off_mean` cycles,
+        e.g. a DUT that accepts bursts of traffic between stalls.
+        """
+        def run(rng: random.Random, mean: float) -> int:
+            # Geometric distribution on 1, 2, ... with the given mean: the floor of an exponential of rate
+            # ln(mean / (mean - 1)) is geometric on 0, 1, ... with mean `mean - 1`.
+            return 1 + int(rng.expovariate(math.log(mean / (mean - 1)))) if mean > 1 else 1
+
+        def build():
+            rng = random.Random(f"bursty/{on_mean}/{off_mean}/{length}/{seed}")
+            runs, total, on = [], 0, True
+            while total < length:
+                n = run(rng, on_mean if on else off_mean)
+                runs.append((b"\x01" if on else b"\x00") * n)
+                total += n
+                on = not on
+            return cls.from_bytes(b"".join(runs)[:length], f"bursty on {on_mean}/off {off_mean} (seed {seed})")
+
+        return cls._cached(("bursty", on_mean, off_mean, length, seed), build)
+
+    @classmethod
+    def from_file(cls, path: str) -> "BitPattern":
+        """
+        Load a pattern saved with `save()`: a text file of '0'/'1' characters, one per cycle
+        (whitespace is ignored, so dumps can be wrapped in lines).
+        """
+        def build():
+            with open(path, "rb") as f:
+                text = b"".join(f.read().split())
+            assert text and not text.strip(b"01"), f"{path}: expected only '0'/'1' characters"
+            return cls.from_bytes(text.translate(_ASCII_TO_BIT), f"file {path}")
+
+        return cls._cached(("file", path), build)
+
+    def save(self, path: str, line_len: int = 64) -> None:
+        text = self.to_bytes().translate(_BIT_TO_ASCII)
+        with open(path, "wb") as f:
+            for i in range(0, len(text), line_len):
+                f.write(text[i:i + line_len] + b"\n")
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.length} cycles, duty {self.duty():.3f}"
@@ -1,81 +1,187 @@
-from typing import List
+import struct
+import sys
+from typing import List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the *_batch variants on arrays need it.
+    np = None
+
+# Lookup tables indexed by one byte of enables.
+# _BE_EXPAND[b]  : the 8 byte enables of b expanded to a 64-bit mask, as 8 little-endian bytes.
+# _NBE_EXPAND[b] : the 8 nibble enables of b expanded to a 32-bit mask, as 4 little-endian bytes.
+# _NBE_TO_BE_LO/HI[b]: the 4 byte enables covered by the 8 nibble enables of b, in the low/high half of a be byte.
+_BE_EXPAND  = [bytes(0xFF if (b >> i) & 1 else 0 for i in range(8)) for b in range(256)]
+_NBE_EXPAND = [
+    bytes((0x0F if (b >> (2 * i)) & 1 else 0) | (0xF0 if (b >> (2 * i + 1)) & 1 else 0) for i in range(4))
+    for b in range(256)
+]
+_NBE_TO_BE_LO = bytes(sum(1 << i for i in range(4) if (b >> (2 * i)) & 0x3) for b in range(256))
+_NBE_TO_BE_HI = bytes(v << 4 for v in _NBE_TO_BE_LO)
+
+# ASCII "0"/"1" to 0/1 bytes.
+_ASCII_TO_BIT = bytes.maketrans(b"01", b"\x00\x01")
+
+# memoryview formats for unsigned chunks of 1/2/4/8 bytes. memoryview uses native byte order,
+# so chunks can only be read through a cast on little-endian hosts.
+_NATIVE_UINT = (
+    {size: fmt for size, fmt in ((1, "B"), (2, "H"), (4, "I"), (8, "Q")) if struct.calcsize(fmt) == size}
+    if sys.byteorder == "little" else {}
+)
+
 
 class BitUtils:
     @staticmethod
     def be_to_bit_en(be: int) -> int:
-        bit_en = 0
-        for i in range(be.bit_count()):
-            byte_flag = (be >> i) & 0x1
-            byte_mask = 0xFF if bool(byte_flag) else 0
-
-            bit_en |= byte_mask << (8 * i)
+        """
+        Expand byte-enable (be) to bit-enable: every set bit i of `be` becomes 0xFF at byte i.
 
-        return bit_en
+        Works a byte of enables (64 mask bits) per table lookup, so wide strobes (e.g. 128 bytes) stay cheap.
+        """
+        nr_bytes = (be.bit_length() + 7) >> 3
+        return int.from_bytes(b"".join(map(_BE_EXPAND.__getitem__, be.to_bytes(nr_bytes, "little"))), "little")
 
     @staticmethod
     def nbe_to_bit_en(be: int) -> int:
-        bit_en = 0
-        for i in range(be.bit_count()):
-            byte_flag = (be >> i) & 0x1
-            byte_mask = 0xF if bool(byte_flag) else 0
-
-            bit_en |= byte_mask << (4 * i)
-
-        return bit_en
+        """
+        Expand nibble-enable to bit-enable: every set bit i of `be` becomes 0xF at nibble i.
+        """
+        nr_bytes = (be.bit_length() + 7) >> 3
+        return int.from_bytes(b"".join(map(_NBE_EXPAND.__getitem__, be.to_bytes(nr_bytes, "little"))), "little")
 
     @staticmethod
     def nbe_to_be(nbe: int) -> int:
         """
         Convert nibble-enable (nbe) to byte-enable (be).
 
+        A byte is enabled if either of its two nibbles is enabled.
+
         Args:
             nbe (int): Nibble-enable bitmask. Each bit represents a 4-bit nibble.
-            nbits (int): Total number of valid nibble bits (optional).
-                         If not given, will use nbe.bit_length().
 
         Returns:
             int: Byte-enable bitmask. Each bit represents an 8-bit byte.
         """
-        be = 0
+        # Even nbe bytes fill the low half of each be byte, odd ones the high half.
+        nr_bytes = ((nbe.bit_length() + 15) >> 4) << 1
+        nbe_bytes = nbe.to_bytes(nr_bytes, "little")
+
+        lo = int.from_bytes(nbe_bytes[0::2].translate(_NBE_TO_BE_LO), "little")
+        hi = int.from_bytes(nbe_bytes[1::2].translate(_NBE_TO_BE_HI), "little")
+
+        return lo | hi
+
+    @staticmethod
+    def be_to_bit_en_batch(bes, nr_bytes: int):
+        """
+        Expand many byte-enables at once.
 
-        nbits = nbe.bit_length()
+        Args:
+            bes: Either a sequence of int strobes, or a NumPy integer array of shape (N,) (strobes of up to 64 bits)
+                 or a uint8 array of shape (N, ceil(nr_bytes / 8)) holding little-endian strobe bytes.
+            nr_bytes (int): Strobe width in bytes (the bus width in bytes).
 
-        for i in range(0, nbits, 2):
-            # Extract the two nibbles (as bits)
-            nib0 = (nbe >> i) & 1
-            nib1 = (nbe >> (i + 1)) & 1
-            if nib0 or nib1:
-                be |= (1 << (i >> 1))
+        Returns:
+            For a sequence: List[int] of bit-enables.
+            For a NumPy array: uint8 array of shape (N, nr_bytes), 0xFF for enabled bytes,
+            i.e. the little-endian bytes of each bit-enable.
+            Either way, strobe bits at or above `nr_bytes` are dropped.
+        """
+        if np is not None and isinstance(bes, np.ndarray):
+            if bes.ndim == 1:
+                assert nr_bytes <= 8, f"1-D strobe arrays hold up to 8 bytes of strobes, got nr_bytes = {nr_bytes}"
+                bes = bes.astype("<u8").view(np.uint8).reshape(-1, 8)
+            bits = np.unpackbits(bes, axis = 1, count = nr_bytes, bitorder = "little")
+            return bits * np.uint8(0xFF)
+
+        table = _BE_EXPAND
+        width = (nr_bytes + 7) >> 3
+        mask = (1 << (nr_bytes << 3)) - 1  # The table expands whole bytes of strobes.
+        return [
+            int.from_bytes(b"".join(map(table.__getitem__, be.to_bytes(width, "little"))), "little") & mask
+            for be in bes
+        ]
 
-        return be
+    @staticmethod
+    def nbe_to_bit_en_batch(nbes: Sequence[int], nr_nibbles: int) -> List[int]:
+        """
+        Expand many nibble-enables (each `nr_nibbles` bits wide) at once.
+        """
+        table = _NBE_EXPAND
+        width = (nr_nibbles + 7) >> 3
+        mask = (1 << (nr_nibbles << 2)) - 1
+        return [
+            int.from_bytes(b"".join(map(table.__getitem__, nbe.to_bytes(width, "little"))), "little") & mask
+            for nbe in nbes
+        ]
 
     @staticmethod
-    def slice_by_stride(data: int, total_bits: int, stride: int) -> List[int]:
+    def slice_by_stride(data: int, total_bits: int, stride: int, as_array: bool = False):
         """
         Splits `data` from LSB to MSB into chunks of `stride` bits.
 
+        The value is converted to bytes (or to a bit string if `stride` is not a multiple of 8) once,
+        and the chunks are cut from that buffer, so the cost is linear in the bus width
+        instead of one big-int shift and mask per chunk.
+
         Args:
             data (int): The input integer to split.
             total_bits (int): The total number of meaningful bits in `data`.
             stride (int): The bit-width of each chunk (stride length).
+            as_array (bool): Return an array view over the chunks instead of a list.
+                             For byte-aligned strides this is a NumPy array viewing the data bytes
+                             (one element per chunk for 8/16/32/64-bit strides, otherwise an (N, stride / 8) uint8 array),
+                             or a memoryview when NumPy is unavailable.
 
         Returns:
-            List[int]: A list of integers, each `stride` bits wide, LSB-first.
+            List[int]: A list of integers, each `stride` bits wide, LSB-first (unless `as_array`).
         """
         assert total_bits % stride == 0, "total_bits must be divisible by stride"
-        result: List[int] = []
+        data &= (1 << total_bits) - 1
+
+        if stride & 0x7:
+            # Not byte aligned: cut the chunks out of the binary string (MSB first).
+            bits = format(data, f"0{total_bits}b")
+            result = [int(bits[lo - stride:lo], 2) for lo in range(total_bits, 0, -stride)]
+            if as_array and np is not None and stride <= 64:
+                return np.array(result, dtype = np.uint64)
+            return result
+
+        buf = data.to_bytes(total_bits >> 3, "little")
+        stride_bytes = stride >> 3
+        fmt = _NATIVE_UINT.get(stride_bytes)
+
+        if as_array:
+            if np is not None:
+                if stride_bytes in (1, 2, 4, 8):
+                    return np.frombuffer(buf, dtype = f"<u{stride_bytes}")
+                return np.frombuffer(buf, dtype = np.uint8).reshape(-1, stride_bytes)
+            if fmt is not None:
+                return memoryview(buf).cast(fmt)
+            return memoryview(buf).cast("B", [len(buf) // stride_bytes, stride_bytes])
+
+        if fmt is not None:
+            return memoryview(buf).cast(fmt).tolist()
+
+        view = memoryview(buf)
+        return [int.from_bytes(view[i:i + stride_bytes], "little") for i in range(0, len(buf), stride_bytes)]
+
+    @staticmethod
+    def split_into_bits(data: int, total_bits: int, as_array: bool = False):
+        """
+        Splits `data` into its `total_bits` lowest bits, LSB first.
 
-        for i in range(total_bits // stride):
-            shift = i * stride
-            mask = (1 << stride) - 1
-            chunk = (data >> shift) & mask
-            result.append(chunk)
+        Returns a list of 0/1 ints, or with `as_array` a NumPy uint8 array
+        (bytes of 0/1 values when NumPy is unavailable).
+        """
+        data &= (1 << total_bits) - 1
 
-        return result
+        if as_array and np is not None:
+            buf = np.frombuffer(data.to_bytes((total_bits + 7) >> 3, "little"), dtype = np.uint8)
+            return np.unpackbits(buf, count = total_bits, bitorder = "little")
 
-    @staticmethod
-    def split_into_bits(data: int, total_bits: int) -> list[int]:
-        return [(data >> i) & 1 for i in range(total_bits)]
+        bits = format(data, f"0{total_bits}b")[::-1].encode().translate(_ASCII_TO_BIT)
+        return bits if as_array else list(bits)
 
     @staticmethod
     def apply_byte_enable(data: int, be: int) -> int:
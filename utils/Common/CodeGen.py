@@ -0,0 +1,24 @@
+from typing import Any, Dict, List
+
+
+def compile_function(name: str, params: List[str], lines: List[str], env: Dict[str, Any]):
+    """
+    Compile a straight-line function from source lines.
+
+    Used to build per-configuration hot paths (e.g. bundle send/recv plans) once at construction,
+    so the per-cycle code neither branches on configuration flags nor loops over field lists.
+
+    Args:
+        name (str): Function name, also shown in tracebacks.
+        params (List[str]): Parameter names.
+        lines (List[str]): Body statements, one per line, without indentation.
+        env (Dict[str, Any]): Names the body refers to (handles, classes, ...), bound as the function's globals.
+
+    Returns:
+        The compiled function.
+    """
+    src = f"def {name}({', '.join(params)}):\n" + "".join(f"    {line}\n" for line in lines)
+    scope = dict(env)
+    exec(compile(src, f"<{name}>", "exec"), scope)
+
+    return scope[name]
@@ -0,0 +1,109 @@
+from array import array
+from typing import List, Optional, Tuple
+
+
+class Histogram:
+    """
+    Fixed-bin histogram of integer samples (e.g. latencies in cycles), in constant memory.
+
+    Bin i counts the samples in [lo + i * bin_width, lo + (i + 1) * bin_width); samples below `lo`
+    go to the first bin and samples at or above the last edge to an extra overflow bin.
+    Counts are kept in an array('Q'), so the histogram stays the same size however many samples it sees;
+    exact count, sum, min and max are tracked alongside.
+
+    Attributes:
+        counts (array): nr_bins + 1 counters, the last one being the overflow bin.
+        count (int): Number of samples.
+        total (int): Sum of the samples.
+    """
+    def __init__(self, nr_bins: int = 256, bin_width: int = 1, lo: int = 0, name: str = "histogram") -> None:
+        assert nr_bins > 0 and bin_width > 0, f"{name}: need at least one bin of positive width"
+
+        self.name = name
+        self.nr_bins = nr_bins
+        self.bin_width = bin_width
+        self.lo = lo
+
+        self.counts = array("Q", bytes(8 * (nr_bins + 1)))
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def add(self, value: int) -> None:
+        i = (value - self.lo) // self.bin_width
+        if i < 0:
+            i = 0
+        elif i > self.nr_bins:
+            i = self.nr_bins
+        self.counts[i] += 1
+
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Add the samples of `other`, which must have the same bins.
+        """
+        assert (self.nr_bins, self.bin_width, self.lo) == (other.nr_bins, other.bin_width, other.lo), \
+            f"Cannot merge {other.name} into {self.name}: different bins"
+
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> Optional[int]:
+        """
+        Upper edge of the bin holding the p-th percentile (0 < p <= 100), capped by the exact max.
+        With `bin_width = 1` this is the exact percentile.
+        """
+        if not self.count:
+            return None
+
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                if i == self.nr_bins:
+                    return self.max
+                return min(self.lo + (i + 1) * self.bin_width - 1, self.max)
+        return self.max
+
+    def bins(self) -> List[Tuple[int, int, int]]:
+        """
+        (low edge, high edge, count) of every non-empty bin; the overflow bin ends at the max sample.
+        """
+        rows = []
+        for i, n in enumerate(self.counts):
+            if n:
+                lo = self.lo + i * self.bin_width
+                hi = self.max if i == self.nr_bins else lo + self.bin_width - 1
+                rows.append((lo, hi, n))
+        return rows
+
+    def clear(self) -> None:
+        self.counts = array("Q", bytes(8 * (self.nr_bins + 1)))
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def __str__(self) -> str:
+        if not self.count:
+            return f"{self.name}: no samples"
+        return (
+            f"{self.name}: {self.count} samples, mean {self.mean():.1f}, min {self.min}, "
+            f"p50 {self.percentile(50)}, p90 {self.percentile(90)}, p99 {self.percentile(99)}, max {self.max}"
+        )
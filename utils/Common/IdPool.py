@@ -3,15 +3,23 @@ from collections import deque
 
 class IdPool:
     """
-    A pool for managing unique integer IDs with efficient allocation and release operations.
+    A pool for managing unique integer IDs with O(1) allocation, specific allocation and release.
 
-    Uses a deque for O(1) operations on both ends. Note that after multiple allocations
-    and releases, the order of IDs in the pool may not be sorted numerically due to the
-    release mechanism appending IDs to the right end.
+    The state of every ID is kept in a bytearray (one byte per ID), so membership checks,
+    allocating a specific ID and detecting a double release never scan the pool.
+
+    Allocation order matches the former deque-based pool: IDs that were never released are handed
+    out in ascending order (through the `fresh` cursor), then released IDs in release order.
+    Released IDs are appended to `free_list` together with a release stamp; allocating a specific
+    released ID leaves its entry behind, and such stale entries are skipped (and compacted) lazily.
 
     Attributes:
         ID_EMPTY (int): Special value returned when pool is empty
-        pool (deque): Available IDs in the pool
+        state (bytearray): state[id - start] is FREE, ALLOCATED or RELEASED
+        stamp (list): Stamp of the latest release of each ID
+        free_list (deque): (id, stamp) entries of released IDs, possibly stale
+        fresh (int): IDs from start + fresh upward have not been reached by the cursor yet
+        nr_free (int): Number of available IDs
         start (int): Starting value for ID range
         size (int): Total number of IDs in the pool
         name (str): Descriptive name for the pool
@@ -19,6 +27,10 @@ class IdPool:
 
     ID_EMPTY = 677
 
+    FREE      = 0  # Available, never released: handed out by the fresh cursor.
+    ALLOCATED = 1
+    RELEASED  = 2  # Available, handed out through free_list.
+
     def __init__(self, size, name="id pool", start=0):
         """
         Initialize the ID pool with a range of IDs.
@@ -28,19 +40,25 @@ class IdPool:
             name: Descriptive name for the pool (default "id pool")
             start: Starting value for ID range (default 0)
         """
-        self.pool = deque(range(start, size + start))
         self.start = start
         self.size = size
         self.name = name
+        self.state = bytearray(size)
+        self.stamp = [0] * size
+        self.free_list = deque()
+        self.fresh = 0
+        self.nr_free = size
+        self.nr_releases = 0
 
     def list(self):
         """
         Print and return all available IDs in the pool.
         """
+        available = self._available()
         print(f"{self.name} available id:\n\t|", end='')
-        for id in self.pool:
+        for id in available:
             print(f"{id:^5}", end='|')  # :^5 central align 5 characters
-        return list(self.pool)  # Convert to list for external use
+        return available
 
     def allocate(self, id=None):
         """
@@ -48,23 +66,61 @@ class IdPool:
 
         Args:
             id: Specific ID to allocate (optional). If not provided,
-                allocates the leftmost ID (O(1) operation).
+                allocates the next available ID (O(1) amortized).
 
         Returns:
             int: Allocated ID or ID_EMPTY if pool is empty
         """
+        state = self.state
+
         if id is not None:
             # Handle specific ID request
-            if id in self.pool:
-                self.pool.remove(id)  # O(n) operation
+            idx = id - self.start
+            if 0 <= idx < self.size and state[idx] != self.ALLOCATED:
+                state[idx] = self.ALLOCATED
+                self.nr_free -= 1
                 return id
             else:
                 assert False, f"trying to alloc a non-exist id ==> {id}"
-        else:
-            # Handle generic allocation request
-            if self.is_empty():
-                return self.ID_EMPTY
-            return self.pool.popleft()  # O(1) operation
+
+        # Handle generic allocation request
+        if self.nr_free == 0:
+            return self.ID_EMPTY
+        self.nr_free -= 1
+
+        while self.fresh < self.size:
+            idx = self.fresh
+            self.fresh += 1
+            if state[idx] == self.FREE:
+                state[idx] = self.ALLOCATED
+                return idx + self.start
+
+        while True:
+            id, stamp = self.free_list.popleft()
+            idx = id - self.start
+            if state[idx] == self.RELEASED and self.stamp[idx] == stamp:
+                state[idx] = self.ALLOCATED
+                return id
+
+    def allocate_n(self, n: int):
+        """
+        Allocate `n` IDs at once and return them as a list.
+
+        A run of never-used IDs at the cursor is claimed with a single bytearray slice assignment.
+        """
+        assert n <= self.nr_free, f"trying to alloc {n} ids from {self.name} with only {self.nr_free} available"
+
+        ids = []
+        lo, hi = self.fresh, min(self.fresh + n, self.size)
+        if hi > lo and self.state.count(self.FREE, lo, hi) == hi - lo:
+            self.state[lo:hi] = bytes([self.ALLOCATED]) * (hi - lo)
+            ids = list(range(lo + self.start, hi + self.start))
+            self.nr_free -= hi - lo
+            self.fresh = hi
+
+        while len(ids) < n:
+            ids.append(self.allocate())
+        return ids
 
     def release(self, id: int):
         """
@@ -73,14 +129,51 @@ class IdPool:
         Note: Released IDs are appended to the right end, which may
         result in non-sorted order after multiple operations.
         """
-        if id in self.pool:
+        idx = id - self.start
+        if not (0 <= idx < self.size):
+            raise ValueError(f'id {id} does not belong to {self.name}')
+        if self.state[idx] != self.ALLOCATED:
             raise ValueError(f'id {id} is already in {self.name}')
-        self.pool.append(id)  # O(1) operation
+
+        self.nr_releases += 1
+        self.state[idx] = self.RELEASED
+        self.stamp[idx] = self.nr_releases
+        self.nr_free += 1
+        self.free_list.append((id, self.nr_releases))
+
+        # Stale entries only pile up when released IDs are re-allocated by specific requests;
+        # drop them once they outnumber the pool.
+        if len(self.free_list) > 2 * self.size:
+            self.free_list = deque(entry for entry in self.free_list if self._is_live(entry))
+
+    def release_n(self, ids):
+        """Release several IDs back to the pool, in the given order."""
+        for id in ids:
+            self.release(id)
 
     def reset_pool(self):
         """Reset the pool to its initial state with all IDs."""
-        self.pool = deque(range(self.start, self.size + self.start))
+        self.state = bytearray(self.size)
+        self.free_list.clear()
+        self.fresh = 0
+        self.nr_free = self.size
+
+    def is_allocated(self, id: int) -> bool:
+        """Check whether an ID is currently in use."""
+        return self.state[id - self.start] == self.ALLOCATED
 
     def is_empty(self):
         """Check if the pool is empty."""
-        return len(self.pool) == 0
\ No newline at end of file
+        return self.nr_free == 0
+
+    def __len__(self):
+        return self.nr_free
+
+    def _is_live(self, entry) -> bool:
+        id, stamp = entry
+        idx = id - self.start
+        return self.state[idx] == self.RELEASED and self.stamp[idx] == stamp
+
+    def _available(self):
+        fresh = [idx + self.start for idx in range(self.fresh, self.size) if self.state[idx] == self.FREE]
+        return fresh + [id for id, stamp in self.free_list if self._is_live((id, stamp))]
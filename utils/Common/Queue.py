@@ -1,51 +1,177 @@
-from typing import Generic, Deque, TypeVar, Optional
-from collections import deque
+from typing import Generic, Iterator, List, TypeVar, Optional
 
 T = TypeVar('T')
 
 class Queue(Generic[T]):
+    """
+    A FIFO queue backed by a preallocated ring buffer.
+
+    A bounded queue (`depth` given) allocates its `depth` slots once and never reallocates.
+    An unbounded queue (`depth = None`) starts small and doubles its buffer when it runs out of slots.
+
+    With `fast = True` the emptiness assertions of deq/popleft/peek/rear are dropped,
+    so callers must check `is_empty()` themselves.
+
+    Occupancy instrumentation:
+        high_water  : the largest number of items ever held at once (updated on every enq).
+        full_cycles : number of `tick()` calls that found the queue full.
+        empty_cycles: number of `tick()` calls that found the queue empty.
+    `tick()` is expected to be called once per clock cycle by the owner of the queue.
+    """
+    __slots__ = (
+        "name", "depth", "buf", "cap", "head", "count",
+        "high_water", "full_cycles", "empty_cycles", "cycles"
+    )
+
+    INIT_CAP = 8  # Initial capacity of an unbounded queue.
+
     def __init__(
             self,
             depth: Optional[int] = None,
-            label: Optional[str] = None
+            label: Optional[str] = None,
+            fast : bool = False
     ):
         if depth is not None:
             assert depth > 0, "The depth of the queue should be greater than zero!"
 
         self.name: str = f"{label}_Queue" if label is not None else "Queue"
-
-        self.queue: Deque[T] = deque()
         self.depth: Optional[int] = depth
 
+        self.cap  : int = depth if depth is not None else self.INIT_CAP
+        self.buf  : List[Optional[T]] = [None] * self.cap
+        self.head : int = 0
+        self.count: int = 0
+
+        self.high_water  : int = 0
+        self.full_cycles : int = 0
+        self.empty_cycles: int = 0
+        self.cycles      : int = 0
+
+        if fast:
+            self.__class__ = FastQueue
+
     def is_empty(self) -> bool:
-        return len(self.queue) == 0
+        return self.count == 0
 
     def is_full(self) -> bool:
-        return len(self.queue) == self.depth if self.depth is not None else False
+        # Never true for an unbounded queue since depth is None.
+        return self.count == self.depth
 
     def enq(self, bits: T) -> None:
-        assert not self.is_full(), f"{self.name} is already full!"
+        count = self.count
+        if count == self.cap:
+            assert self.depth is None, f"{self.name} is already full!"
+            self._grow()
+
+        tail = self.head + count
+        if tail >= self.cap:
+            tail -= self.cap
+        self.buf[tail] = bits
 
-        self.queue.append(bits)
+        self.count = count + 1
+        if count >= self.high_water:
+            self.high_water = count + 1
 
     def deq(self) -> None:
-        self.queue.popleft()
+        assert self.count > 0, f"{self.name} is empty!"
+        self._pop()
 
     def popleft(self) -> T:
-        return self.queue.popleft()
+        assert self.count > 0, f"{self.name} is empty!"
+        return self._pop()
 
     def peek(self) -> T:
-        return self.queue[0]
+        assert self.count > 0, f"{self.name} is empty!"
+        return self.buf[self.head]
 
     def rear(self) -> T:
-        return self.queue[-1]
+        assert self.count > 0, f"{self.name} is empty!"
+        return self.buf[(self.head + self.count - 1) % self.cap]
 
     def len(self) -> int:
-        return len(self.queue)
-    
+        return self.count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[T]:
+        for i in range(self.count):
+            yield self.buf[(self.head + i) % self.cap]
+
     def list(self) -> None:
-        print(f"---- {self.name} Contents ({len(self.queue)} items) ----")
-        for i, item in enumerate(self.queue):
+        print(f"---- {self.name} Contents ({self.count} items) ----")
+        for i, item in enumerate(self):
             print(f"[{i}] {item}")
         print("---- End of Queue ----")
-    
+
+    def tick(self) -> None:
+        """
+        Sample the occupancy counters. Call once per clock cycle.
+        """
+        self.cycles += 1
+        if self.count == 0:
+            self.empty_cycles += 1
+        elif self.count == self.depth:
+            self.full_cycles += 1
+
+    @staticmethod
+    def tick_all(queues) -> None:
+        """
+        `tick()` every queue of `queues` in one loop, without a method call per queue.
+        """
+        for q in queues:
+            q.cycles += 1
+            count = q.count
+            if count == 0:
+                q.empty_cycles += 1
+            elif count == q.depth:
+                q.full_cycles += 1
+
+    def stats(self) -> str:
+        cycles = max(self.cycles, 1)
+        return (
+            f"{self.name}: depth = {self.depth}, high water = {self.high_water}, "
+            f"full = {self.full_cycles}/{self.cycles} cycles ({100 * self.full_cycles / cycles:.1f}%), "
+            f"empty = {self.empty_cycles}/{self.cycles} cycles ({100 * self.empty_cycles / cycles:.1f}%)"
+        )
+
+    def reset_stats(self) -> None:
+        self.high_water   = self.count
+        self.full_cycles  = 0
+        self.empty_cycles = 0
+        self.cycles       = 0
+
+    def _pop(self) -> T:
+        head = self.head
+        bits = self.buf[head]
+        self.buf[head] = None  # Drop the reference so dequeued items can be collected.
+
+        head += 1
+        self.head  = 0 if head == self.cap else head
+        self.count -= 1
+
+        return bits
+
+    def _grow(self) -> None:
+        self.buf  = list(self) + [None] * self.cap
+        self.head = 0
+        self.cap *= 2
+
+
+class FastQueue(Queue[T]):
+    """
+    Queue without the emptiness assertions. Created through `Queue(..., fast = True)`.
+    """
+    __slots__ = ()
+
+    def deq(self) -> None:
+        self._pop()
+
+    def popleft(self) -> T:
+        return self._pop()
+
+    def peek(self) -> T:
+        return self.buf[self.head]
+
+    def rear(self) -> T:
+        return self.buf[(self.head + self.count - 1) % self.cap]
@@ -0,0 +1,94 @@
+from collections import deque
+from typing import Deque, Dict, Generic, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class TxnTracker(Generic[T]):
+    """
+    Tracks outstanding transactions in one FIFO per ID.
+
+    AXI only orders transactions that share an ID, so a response always completes the oldest outstanding
+    transaction of its ID. Keeping one FIFO per ID makes matching a response O(1),
+    however many transactions are in flight and in whatever order the IDs complete.
+
+    Attributes:
+        fifos (Dict[int, Deque[T]]): Outstanding transactions of each ID, oldest first
+        nr_outstanding (int): Total number of outstanding transactions
+        max_outstanding (Optional[int]): Capacity limit (None for unlimited)
+        name (str): Descriptive name for the tracker
+    """
+    def __init__(self, name: str = "txn tracker", max_outstanding: Optional[int] = None):
+        self.name = name
+        self.max_outstanding = max_outstanding
+        self.fifos: Dict[int, Deque[T]] = {}
+        self.nr_outstanding = 0
+
+    def push(self, id: int, txn: T) -> None:
+        """
+        Record a newly issued transaction as the youngest outstanding one of its ID.
+        """
+        assert not self.is_full(), f"{self.name} is already full ({self.max_outstanding} outstanding)!"
+
+        fifo = self.fifos.get(id)
+        if fifo is None:
+            fifo = self.fifos[id] = deque()
+        fifo.append(txn)
+        self.nr_outstanding += 1
+
+    def match(self, id: int) -> T:
+        """
+        Complete and return the oldest outstanding transaction of `id`, e.g. when its response arrives.
+        """
+        fifo = self.fifos.get(id)
+        if not fifo:
+            raise ValueError(f"{self.name}: response for id {id} without an outstanding transaction")
+
+        self.nr_outstanding -= 1
+        return fifo.popleft()
+
+    def peek(self, id: int) -> Optional[T]:
+        """
+        Return the oldest outstanding transaction of `id` without completing it (None if there is none).
+        """
+        fifo = self.fifos.get(id)
+        return fifo[0] if fifo else None
+
+    def check_order(self, id: int, txn: T) -> bool:
+        """
+        Check that `txn` is the oldest outstanding transaction of `id`, i.e. completing it now respects AXI ordering.
+        """
+        return self.peek(id) is txn
+
+    def outstanding(self, id: int) -> int:
+        fifo = self.fifos.get(id)
+        return len(fifo) if fifo is not None else 0
+
+    def counts(self) -> Dict[int, int]:
+        """
+        Number of outstanding transactions of every ID that has any.
+        """
+        return {id: len(fifo) for id, fifo in self.fifos.items() if fifo}
+
+    def ids(self) -> List[int]:
+        return [id for id, fifo in self.fifos.items() if fifo]
+
+    def is_full(self) -> bool:
+        return self.max_outstanding is not None and self.nr_outstanding >= self.max_outstanding
+
+    def is_empty(self) -> bool:
+        return self.nr_outstanding == 0
+
+    def __len__(self) -> int:
+        return self.nr_outstanding
+
+    def clear(self) -> None:
+        self.fifos.clear()
+        self.nr_outstanding = 0
+
+    def list(self) -> None:
+        print(f"---- {self.name} ({self.nr_outstanding} outstanding) ----")
+        for id, fifo in self.fifos.items():
+            for i, txn in enumerate(fifo):
+                print(f"[id {id} #{i}] {txn}")
+        print(f"---- End of {self.name} ----")
@@ -0,0 +1,39 @@
+"""
+    Packed BitPattern lookups against the unpacked list of bits they encode,
+    the file round trip, and the statistics of the random factories.
+"""
+import random
+
+from PyVeriUtils.utils.Common.BitPattern import BitPattern
+
+
+def test_packed_lookup_matches_bits():
+    rng = random.Random(0)
+    for length in (1, 7, 8, 9, 64, 1000):
+        bits = [rng.getrandbits(1) for _ in range(length)]
+        pattern = BitPattern.from_bytes(bytes(bits))
+        assert len(pattern) == length and list(pattern.to_bytes()) == bits
+        assert [pattern[cycle] for cycle in range(3 * length + 5)] == [bits[c % length] for c in range(3 * length + 5)]
+        assert pattern.duty() == sum(bits) / length
+
+
+def test_file_round_trip(tmp_path):
+    pattern = BitPattern.bursty(4, 3, length = 1001, seed = 2)
+    pattern.save(str(tmp_path / "ready.txt"), line_len = 10)
+    loaded = BitPattern.from_file(str(tmp_path / "ready.txt"))
+    assert loaded.to_bytes() == pattern.to_bytes()
+
+
+def test_factories():
+    assert BitPattern.random(0.3, seed = 1) is BitPattern.random(0.3, seed = 1)  # Shared through the cache.
+    assert BitPattern.random(0.3, seed = 1).to_bytes() != BitPattern.random(0.3, seed = 2).to_bytes()
+    for duty in (0.0, 0.25, 0.9, 1.0):
+        assert abs(BitPattern.random(duty, seed = 3).duty() - duty) < 0.01
+
+    bits = BitPattern.bursty(8, 2, seed = 4).to_bytes()
+    on_runs, off_runs = bits.replace(b"\x00", b" ").split(), bits.replace(b"\x01", b" ").split()
+    assert abs(sum(map(len, on_runs)) / len(on_runs) - 8) < 0.3
+    assert abs(sum(map(len, off_runs)) / len(off_runs) - 2) < 0.1
+    assert abs(BitPattern.bursty(8, 2, seed = 4).duty() - 0.8) < 0.02
+    assert [BitPattern.constant(0)[c] for c in range(3)] == [0, 0, 0]
+    assert [BitPattern.constant(1)[c] for c in range(3)] == [1, 1, 1]
@@ -0,0 +1,91 @@
+"""
+    The table-driven enable expansions and the byte-buffer slicing against bit-by-bit
+    (shift-and-mask) reference versions, and the NumPy paths against the scalar ones.
+"""
+import random
+
+import pytest
+
+from PyVeriUtils.utils.Common.BitUtils import BitUtils
+
+
+def naive_be_to_bit_en(be: int, nr_bytes: int) -> int:
+    return sum(0xFF << (8 * i) for i in range(nr_bytes) if be >> i & 1)
+
+
+def naive_nbe_to_bit_en(nbe: int, nr_nibbles: int) -> int:
+    return sum(0xF << (4 * i) for i in range(nr_nibbles) if nbe >> i & 1)
+
+
+def naive_nbe_to_be(nbe: int) -> int:
+    return sum(1 << i for i in range((nbe.bit_length() + 1) // 2) if nbe >> (2 * i) & 0x3)
+
+
+def test_tables_match_naive():
+    rng = random.Random(0)
+    for nr_bytes in (1, 2, 3, 4, 7, 8, 9, 16, 64, 128):
+        bes = [rng.getrandbits(nr_bytes) for _ in range(200)] + [0, (1 << nr_bytes) - 1]
+        expected = [naive_be_to_bit_en(be, nr_bytes) for be in bes]
+        assert [BitUtils.be_to_bit_en(be) for be in bes] == expected
+        assert BitUtils.be_to_bit_en_batch(bes, nr_bytes) == expected
+
+        nbes = [rng.getrandbits(2 * nr_bytes) for _ in range(200)]
+        assert [BitUtils.nbe_to_bit_en(nbe) for nbe in nbes] == [naive_nbe_to_bit_en(nbe, 2 * nr_bytes) for nbe in nbes]
+        assert BitUtils.nbe_to_bit_en_batch(nbes, 2 * nr_bytes) == [naive_nbe_to_bit_en(nbe, 2 * nr_bytes) for nbe in nbes]
+        assert [BitUtils.nbe_to_be(nbe) for nbe in nbes] == [naive_nbe_to_be(nbe) for nbe in nbes]
+
+
+def test_batch_is_masked_to_width():
+    # Within the byte of strobes the table expands, bits at or above nr_bytes are dropped.
+    assert BitUtils.be_to_bit_en_batch([0x3], 1) == [0xFF]
+    assert BitUtils.be_to_bit_en_batch([0xFF], 4) == [0xFFFF_FFFF]
+    assert BitUtils.nbe_to_bit_en_batch([0x3], 1) == [0xF]
+
+
+def test_numpy_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(1)
+
+    for nr_bytes in (1, 3, 4, 8):
+        bes = [rng.getrandbits(8) for _ in range(100)]
+        expected = BitUtils.be_to_bit_en_batch(bes, nr_bytes)
+        got = BitUtils.be_to_bit_en_batch(np.array(bes, dtype = np.uint64), nr_bytes)
+        assert [int.from_bytes(row.tobytes(), "little") for row in got] == expected
+
+    for nr_bytes in (9, 64, 128):
+        bes = [rng.getrandbits(nr_bytes) for _ in range(100)]
+        rows = np.array([list(be.to_bytes((nr_bytes + 7) >> 3, "little")) for be in bes], dtype = np.uint8)
+        got = BitUtils.be_to_bit_en_batch(rows, nr_bytes)
+        assert [int.from_bytes(row.tobytes(), "little") for row in got] == BitUtils.be_to_bit_en_batch(bes, nr_bytes)
+
+    with pytest.raises(AssertionError):
+        BitUtils.be_to_bit_en_batch(np.array([1], dtype = np.uint64), 9)
+
+
+def naive_slice_by_stride(data: int, total_bits: int, stride: int):
+    return [(data >> shift) & ((1 << stride) - 1) for shift in range(0, total_bits, stride)]
+
+
+SLICINGS = [(8, 8), (64, 8), (64, 16), (96, 32), (512, 64), (512, 128), (24, 24), (48, 12), (30, 5), (128, 1)]
+
+
+def chunks_of(array_view):
+    """
+    The chunks of an `as_array` result as ints; rows of 2-D (chunk, byte) views are little-endian bytes.
+    """
+    items = array_view.tolist() if hasattr(array_view, "tolist") else list(array_view)
+    return [int.from_bytes(bytes(item), "little") if isinstance(item, list) else int(item) for item in items]
+
+
+def test_slicing_matches_shift_and_mask():
+    rng = random.Random(2)
+    for total_bits, stride in SLICINGS:
+        for data in [0, (1 << total_bits) - 1, rng.getrandbits(total_bits), rng.getrandbits(total_bits + 40)]:
+            expected = naive_slice_by_stride(data, total_bits, stride)
+            assert BitUtils.slice_by_stride(data, total_bits, stride) == expected, (total_bits, stride)
+            assert chunks_of(BitUtils.slice_by_stride(data, total_bits, stride, as_array = True)) == expected, \
+                (total_bits, stride)
+
+            bits = [(data >> i) & 1 for i in range(total_bits)]
+            assert BitUtils.split_into_bits(data, total_bits) == bits
+            assert list(BitUtils.split_into_bits(data, total_bits, as_array = True)) == bits
@@ -0,0 +1,81 @@
+"""
+    The bytearray IdPool against the deque-based pool it replaces: the same IDs are handed out,
+    in the same order, through any mix of generic, specific and bulk allocations and releases.
+"""
+import random
+from collections import deque
+
+import pytest
+
+from PyVeriUtils.utils.Common.IdPool import IdPool
+
+
+class DequePool:
+    """
+    The former pool: every available ID in a deque, released IDs appended to the right.
+    """
+    def __init__(self, size, start=0):
+        self.start, self.size = start, size
+        self.pool = deque(range(start, start + size))
+
+    def allocate(self, id=None):
+        if id is not None:
+            self.pool.remove(id)
+            return id
+        return self.pool.popleft() if self.pool else IdPool.ID_EMPTY
+
+    def release(self, id):
+        self.pool.append(id)
+
+
+@pytest.mark.parametrize("size, start", [(1, 0), (16, 0), (64, 100)])
+def test_matches_deque_pool(size, start):
+    rng = random.Random(size)
+    pool, ref = IdPool(size, start = start), DequePool(size, start)
+    used = []
+
+    for step in range(20000):
+        op = rng.random()
+        if op < 0.35:
+            id = pool.allocate()
+            assert id == ref.allocate()
+            if id != IdPool.ID_EMPTY:
+                used.append(id)
+        elif op < 0.45 and ref.pool:
+            id = rng.choice(ref.pool)
+            assert pool.allocate(id) == ref.allocate(id)
+            used.append(id)
+        elif op < 0.5:
+            n = rng.randint(0, len(ref.pool))
+            ids = pool.allocate_n(n)
+            assert ids == [ref.allocate() for _ in range(n)]
+            used += ids
+        elif op < 0.95 and used:
+            for _ in range(rng.randint(1, 3)):
+                if used:
+                    id = used.pop(rng.randrange(len(used)))
+                    pool.release(id)
+                    ref.release(id)
+        elif op >= 0.999:
+            pool.reset_pool()
+            ref = DequePool(size, start)
+            used = []
+
+        assert len(pool) == len(ref.pool) and pool.is_empty() == (not ref.pool)
+        if step % 101 == 0:
+            assert pool._available() == list(ref.pool)
+            assert all(pool.is_allocated(id) for id in used)
+
+
+def test_misuse_is_refused():
+    pool = IdPool(4, start = 8)
+    id = pool.allocate()
+    pool.release(id)
+    with pytest.raises(ValueError):
+        pool.release(id)
+    with pytest.raises(ValueError):
+        pool.release(12)
+    with pytest.raises(AssertionError):
+        pool.allocate(pool.allocate(9))
+    with pytest.raises(AssertionError):
+        pool.allocate_n(4)
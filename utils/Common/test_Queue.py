@@ -0,0 +1,68 @@
+"""
+    The ring-buffer Queue (bounded, growing, fast) against collections.deque,
+    and its occupancy counters.
+"""
+import random
+from collections import deque
+
+import pytest
+
+from PyVeriUtils.utils.Common.Queue import Queue
+
+
+@pytest.mark.parametrize("depth, fast", [(1, False), (5, False), (None, False), (5, True), (None, True)])
+def test_matches_deque(depth, fast):
+    rng = random.Random(depth)
+    q, ref = Queue(depth, fast = fast), deque()
+    high_water = 0
+
+    for i in range(5000):
+        op = rng.random()
+        if op < 0.55 and len(ref) != depth:
+            q.enq(i)
+            ref.append(i)
+            high_water = max(high_water, len(ref))
+        elif op < 0.8 and ref:
+            assert q.popleft() == ref.popleft()
+        elif ref:
+            assert (q.peek(), q.rear()) == (ref[0], ref[-1])
+            q.deq()
+            ref.popleft()
+
+        assert len(q) == len(ref)
+        assert q.is_empty() == (not ref) and q.is_full() == (len(ref) == depth)
+        if i % 97 == 0:
+            assert list(q) == list(ref)
+
+    assert q.high_water == high_water
+    assert all(item is None for item in q.buf if item not in ref)  # Dequeued items are released.
+
+
+def test_bounds_are_checked():
+    q = Queue(2)
+    with pytest.raises(AssertionError):
+        q.deq()
+    q.enq(1)
+    q.enq(2)
+    with pytest.raises(AssertionError):
+        q.enq(3)
+
+
+def test_tick_all_matches_tick():
+    rng = random.Random(0)
+    ticked, batched = [Queue(2), Queue(4), Queue(None)], [Queue(2), Queue(4), Queue(None)]
+
+    for _ in range(500):
+        for a, b in zip(ticked, batched):
+            if rng.random() < 0.5 and not a.is_full():
+                a.enq(1)
+                b.enq(1)
+            elif not a.is_empty():
+                a.deq()
+                b.deq()
+        for q in ticked:
+            q.tick()
+        Queue.tick_all(batched)
+
+    for a, b in zip(ticked, batched):
+        assert (a.cycles, a.empty_cycles, a.full_cycles) == (b.cycles, b.empty_cycles, b.full_cycles)
@@ -0,0 +1,43 @@
+"""
+    TxnTracker against a single list of outstanding transactions in issue order,
+    where a response completes the first entry of its ID.
+"""
+import random
+
+import pytest
+
+from PyVeriUtils.utils.Common.TxnTracker import TxnTracker
+
+
+def test_matches_issue_order_list():
+    rng = random.Random(0)
+    tracker, ref = TxnTracker[int]("trk", max_outstanding = 32), []
+
+    for txn in range(20000):
+        if rng.random() < 0.5 and not tracker.is_full():
+            id = rng.randrange(8)
+            tracker.push(id, txn)
+            ref.append((id, txn))
+        elif ref:
+            id = rng.choice(ref)[0] if rng.random() < 0.9 else rng.randrange(8)
+            oldest = next((entry for entry in ref if entry[0] == id), None)
+            assert tracker.peek(id) == (oldest[1] if oldest else None)
+            if oldest is None:
+                with pytest.raises(ValueError):
+                    tracker.match(id)
+                continue
+            assert tracker.check_order(id, oldest[1])
+            assert tracker.match(id) == oldest[1]
+            ref.remove(oldest)
+
+        assert len(tracker) == len(ref) and tracker.is_full() == (len(ref) == 32)
+        if txn % 53 == 0:
+            counts = {}
+            for id, _ in ref:
+                counts[id] = counts.get(id, 0) + 1
+            assert tracker.counts() == counts and sorted(tracker.ids()) == sorted(counts)
+            assert all(tracker.outstanding(id) == counts.get(id, 0) for id in range(8))
+
+    with pytest.raises(AssertionError):
+        for txn in range(33):
+            tracker.push(0, txn)
@@ -1,15 +1,127 @@
-from typing import List
+from array import array
+from typing import List, Optional, Union
+
+from PyVeriUtils.utils.Common.BitUtils import np, _NATIVE_UINT
+
 class FakeSram:
-    def __init__(self, depth: int, name: str = "SRAM") -> None:
+    """
+    A word-addressed SRAM model.
+
+    Without `width`, entries are Python ints of any width, kept in a list.
+
+    With `width`, entries live in a flat byte buffer (`width` bits per entry, rounded up to bytes).
+    Entries of 8/16/32/64 bits are accessed through a typed memoryview, so every entry costs exactly
+    its width in memory (8 bytes for a 64-bit word instead of a ~32-byte Python int),
+    and range reads/writes/fills are single C-level slice operations.
+    Wider (or odd-sized) entries are stored as little-endian bytes and converted on access.
+    Writing a value that does not fit in `width` bits is an error.
+
+    `storage` lets several SRAMs share one buffer (see FakeSramArray); by default a new one is allocated.
+    """
+    def __init__(
+            self,
+            depth: int,
+            name: str = "SRAM",
+            width: Optional[int] = None,
+            storage: Optional[Union[bytearray, memoryview]] = None
+    ) -> None:
         self.name  = name
         self.depth = depth
-        self.rams  = [0] * depth
+        self.width = width
+
+        if width is None:
+            assert storage is None, f"{name}: shared storage needs a fixed width"
+            self.mask = None
+            self.word_bytes = None
+            self.storage = None
+            self.fmt = None
+            self.rams = [0] * depth
+            return
+
+        self.mask  = (1 << width) - 1
+        self.word_bytes = (width + 7) >> 3
+
+        self.storage = storage if storage is not None else bytearray(depth * self.word_bytes)
+        assert len(self.storage) == depth * self.word_bytes, \
+            f"Expected {depth * self.word_bytes} bytes of storage for {name}, got {len(self.storage)}"
+
+        self.fmt = _NATIVE_UINT.get(self.word_bytes)
+        # Typed view (one element per entry) if the word size has a native format, raw bytes otherwise.
+        self.rams = memoryview(self.storage).cast(self.fmt) if self.fmt is not None else memoryview(self.storage)
+
+    def check_fits(self, data: int) -> None:
+        assert 0 <= data <= self.mask, f"{self.name}: {hex(data)} does not fit in {self.width} bits"
+
+    def check_range(self, addr: int, nr_words: int) -> None:
+        # Slices would silently clip (or, in list mode, grow the SRAM) instead of failing.
+        assert 0 <= addr and 0 <= nr_words and addr + nr_words <= self.depth, \
+            f"{self.name}: [{addr}, {addr + nr_words}) is out of depth {self.depth}"
 
     def read(self, addr: int) -> int:
-        return self.rams[addr]
+        if self.fmt is not None or self.width is None:
+            return self.rams[addr]
+        wb = self.word_bytes
+        return int.from_bytes(self.rams[addr * wb:(addr + 1) * wb], "little")
 
     def write(self, addr: int, data: int) -> None:
-        self.rams[addr] = data
+        if self.width is None:
+            self.rams[addr] = data
+            return
+
+        self.check_fits(data)
+        if self.fmt is not None:
+            self.rams[addr] = data
+        else:
+            wb = self.word_bytes
+            self.rams[addr * wb:(addr + 1) * wb] = data.to_bytes(wb, "little")
+
+    def read_range(self, addr: int, nr_words: int) -> List[int]:
+        self.check_range(addr, nr_words)
+        if self.width is None:
+            return self.rams[addr:addr + nr_words]
+        if self.fmt is not None:
+            return self.rams[addr:addr + nr_words].tolist()
+        return [self.read(a) for a in range(addr, addr + nr_words)]
+
+    def write_range(self, addr: int, datas: List[int]) -> None:
+        self.check_range(addr, len(datas))
+        if self.width is None:
+            self.rams[addr:addr + len(datas)] = datas
+            return
+
+        if datas:
+            self.check_fits(min(datas))
+            self.check_fits(max(datas))
+        if self.fmt is not None:
+            self.rams[addr:addr + len(datas)] = array(self.fmt, datas)
+        else:
+            wb = self.word_bytes
+            self.rams[addr * wb:(addr + len(datas)) * wb] = b"".join(data.to_bytes(wb, "little") for data in datas)
+
+    def fill(self, data: int, addr: int = 0, nr_words: Optional[int] = None) -> None:
+        """
+        Write `data` to `nr_words` entries starting at `addr` (the whole SRAM by default).
+        """
+        nr_words = self.depth - addr if nr_words is None else nr_words
+        self.check_range(addr, nr_words)
+        if self.width is None:
+            self.rams[addr:addr + nr_words] = [data] * nr_words
+            return
+
+        self.check_fits(data)
+        word = data.to_bytes(self.word_bytes, "little")
+        self.storage[addr * self.word_bytes:(addr + nr_words) * self.word_bytes] = word * nr_words
+
+    def as_numpy(self):
+        """
+        NumPy view (no copy) of the contents: shape (depth,) for 8/16/32/64-bit words,
+        (depth, word_bytes) uint8 otherwise. Needs a fixed `width`.
+        """
+        assert np is not None, "as_numpy() requires NumPy"
+        assert self.width is not None, f"{self.name}: as_numpy() needs a fixed width"
+        if self.word_bytes in (1, 2, 4, 8):
+            return np.frombuffer(self.storage, dtype = f"<u{self.word_bytes}")
+        return np.frombuffer(self.storage, dtype = np.uint8).reshape(self.depth, self.word_bytes)
 
     def dump(self, addr: int) -> str:
         return f"{self.name}[{addr}] = {hex(self.read(addr))}"
@@ -18,18 +130,44 @@ class FakeSram:
         return "\n".join([self.dump(addr) for addr in range(self.depth)])
 
 class FakeSramArray:
-    def __init__(self, depth: int, bank: int, name: str = "SRAMs") -> None:
+    """
+    `bank` FakeSrams of the same `width` (see FakeSram).
+
+    With a fixed width they share one bank-major buffer of bank x depth x word bytes. With native word sizes,
+    a set (the same address in every bank) is then a strided slice of that buffer,
+    so `read_set`/`write_set` are single slice operations instead of a loop over the banks.
+    """
+    def __init__(self, depth: int, bank: int, name: str = "SRAMs", width: Optional[int] = None) -> None:
         self.depth = depth
         self.bank = bank
         self.name = name
+        self.width = width
+
+        if width is None:
+            self.storage = None
+            self.srams = [FakeSram(depth=depth, name=f"{name}_bank_{i}") for i in range(bank)]
+            self.fmt = None
+            self.words = None
+            return
+
+        word_bytes = (width + 7) >> 3
+        bank_bytes = depth * word_bytes
+        self.storage = bytearray(bank * bank_bytes)
+        view = memoryview(self.storage)
         self.srams = [
-            FakeSram(depth=depth, name=f"{name}_bank_{i}") for i in range(bank)
+            FakeSram(depth=depth, name=f"{name}_bank_{i}", width=width, storage=view[i * bank_bytes:(i + 1) * bank_bytes])
+            for i in range(bank)
         ]
 
+        self.fmt = _NATIVE_UINT.get(word_bytes)
+        self.words = view.cast(self.fmt) if self.fmt is not None else None
+
     def read(self, bank_id: int, addr: int) -> int:
         return self.srams[bank_id].read(addr)
 
     def read_set(self, addr: int) -> List[int]:
+        if self.words is not None:
+            return self.words[addr::self.depth].tolist()
         return [sram.read(addr) for sram in self.srams]
 
     def write(self, bank_id: int, addr: int, data: int) -> None:
@@ -38,8 +176,35 @@ class FakeSramArray:
     def write_set(self, addr: int, datas: List[int]) -> None:
         assert len(datas) == self.bank, \
             f"Expected {self.bank} elements in datas, got {len(datas)}"
-        for i, data in enumerate(datas):
-            self.srams[i].write(addr, data)
+        if self.words is not None:
+            self.srams[0].check_fits(min(datas))
+            self.srams[0].check_fits(max(datas))
+            self.words[addr::self.depth] = array(self.fmt, datas)
+        else:
+            for i, data in enumerate(datas):
+                self.srams[i].write(addr, data)
+
+    def read_range(self, bank_id: int, addr: int, nr_words: int) -> List[int]:
+        return self.srams[bank_id].read_range(addr, nr_words)
+
+    def write_range(self, bank_id: int, addr: int, datas: List[int]) -> None:
+        self.srams[bank_id].write_range(addr, datas)
+
+    def fill(self, data: int) -> None:
+        for sram in self.srams:
+            sram.fill(data)
+
+    def as_numpy(self):
+        """
+        NumPy view (no copy) of all banks: shape (bank, depth) for 8/16/32/64-bit words,
+        (bank, depth, word_bytes) uint8 otherwise.
+        """
+        assert np is not None, "as_numpy() requires NumPy"
+        assert self.width is not None, f"{self.name}: as_numpy() needs a fixed width"
+        word_bytes = self.srams[0].word_bytes
+        if word_bytes in (1, 2, 4, 8):
+            return np.frombuffer(self.storage, dtype = f"<u{word_bytes}").reshape(self.bank, self.depth)
+        return np.frombuffer(self.storage, dtype = np.uint8).reshape(self.bank, self.depth, word_bytes)
 
     def dump(self, bank_id: int, addr: int) -> str:
         return self.srams[bank_id].dump(addr)
@@ -54,3 +219,4 @@ class FakeSramArray:
         return "\n\n".join([self.dump_bank(i) for i in range(self.bank)])
 
 
+
@@ -0,0 +1,168 @@
+import mmap
+import os
+from typing import Dict, Optional, Union
+
+from PyVeriUtils.utils.Common.BitUtils import BitUtils
+
+class SparseMemory:
+    """
+    A byte-addressed memory of `size` bytes whose pages (2 ** page_bits bytes each) are allocated on first write.
+
+    Reading an address that was never written returns zeros without allocating anything,
+    so a 40-bit address map only costs memory for the pages a test actually touches.
+
+    Writes are split at page boundaries and every page-sized chunk is applied in one go:
+    fully enabled chunks are plain slice assignments, partially strobed chunks are merged
+    with `BitUtils.apply_byte_enable` semantics (`new = old & ~bit_en | data & bit_en`) on the whole chunk at once.
+
+    With `backing_file`, pages live in a (sparse) file mapped with mmap instead of in RAM,
+    which suits images larger than the host memory. The file is grown to `size` bytes if needed
+    and its previous contents are visible through reads.
+
+    Statistics:
+        resident_pages(): number of allocated pages.
+        bytes_touched() : number of distinct bytes ever written (with their strobe set).
+    """
+    def __init__(
+            self,
+            size        : int = 1 << 40,
+            page_bits   : int = 12,
+            name        : str = "MEM",
+            backing_file: Optional[str] = None
+    ) -> None:
+        self.name      = name
+        self.size      = size
+        self.page_bits = page_bits
+        self.page_size = 1 << page_bits
+        self.page_mask = self.page_size - 1
+
+        self.pages  : Dict[int, Union[bytearray, memoryview]] = {}
+        self.touched: Dict[int, int] = {}  # Page number -> bitmask of the bytes written in that page.
+
+        self.store: Optional[mmap.mmap] = None
+        if backing_file is not None:
+            self.fd = os.open(backing_file, os.O_RDWR | os.O_CREAT, 0o644)
+            if os.fstat(self.fd).st_size < size:
+                os.ftruncate(self.fd, size)  # Leaves a hole: the file only takes disk space where it is written.
+            self.store = mmap.mmap(self.fd, size)
+
+    def _page(self, page_no: int) -> Union[bytearray, memoryview]:
+        page = self.pages.get(page_no)
+        if page is None:
+            if self.store is not None:
+                base = page_no << self.page_bits
+                page = memoryview(self.store)[base:base + self.page_size]
+            else:
+                page = bytearray(self.page_size)
+            self.pages[page_no] = page
+        return page
+
+    def _check_range(self, addr: int, nr_bytes: int) -> None:
+        assert 0 <= addr and addr + nr_bytes <= self.size, \
+            f"Access [{hex(addr)}, {hex(addr + nr_bytes)}) is out of {self.name} (size {hex(self.size)})"
+
+    def read(self, addr: int, nr_bytes: int) -> bytes:
+        """
+        Read `nr_bytes` bytes starting at `addr`. Unwritten bytes read as zero.
+        """
+        self._check_range(addr, nr_bytes)
+        out = bytearray(nr_bytes)
+        pos = 0
+        while pos < nr_bytes:
+            cur = addr + pos
+            page_no, off = cur >> self.page_bits, cur & self.page_mask
+            chunk = min(nr_bytes - pos, self.page_size - off)
+
+            page = self.pages.get(page_no)
+            if page is not None:
+                out[pos:pos + chunk] = page[off:off + chunk]
+            elif self.store is not None:
+                out[pos:pos + chunk] = self.store[cur:cur + chunk]
+            pos += chunk
+        return bytes(out)
+
+    def read_int(self, addr: int, nr_bytes: int) -> int:
+        """
+        Read `nr_bytes` bytes starting at `addr` as a little-endian integer.
+        """
+        return int.from_bytes(self.read(addr, nr_bytes), "little")
+
+    def write(self, addr: int, data: Union[bytes, bytearray, memoryview], strb: Optional[int] = None) -> None:
+        """
+        Write the bytes of `data` starting at `addr`.
+
+        Args:
+            addr (int): Byte address of data[0].
+            data (bytes-like): Bytes to write.
+            strb (Optional[int]): Byte-enable mask, bit i enables data[i] (None enables every byte).
+        """
+        nr_bytes = len(data)
+        self._check_range(addr, nr_bytes)
+        pos = 0
+        while pos < nr_bytes:
+            cur = addr + pos
+            page_no, off = cur >> self.page_bits, cur & self.page_mask
+            chunk = min(nr_bytes - pos, self.page_size - off)
+            full = (1 << chunk) - 1
+            be = full if strb is None else (strb >> pos) & full
+
+            if be:
+                page = self._page(page_no)
+                if be == full:
+                    page[off:off + chunk] = data[pos:pos + chunk]
+                else:
+                    old = int.from_bytes(page[off:off + chunk], "little")
+                    new = int.from_bytes(data[pos:pos + chunk], "little")
+                    bit_en = BitUtils.be_to_bit_en(be)
+                    page[off:off + chunk] = ((old & ~bit_en) | (new & bit_en)).to_bytes(chunk, "little")
+                self.touched[page_no] = self.touched.get(page_no, 0) | (be << off)
+            pos += chunk
+
+    def write_int(self, addr: int, data: int, nr_bytes: int, strb: Optional[int] = None) -> None:
+        """
+        Write the `nr_bytes` low bytes of `data` (little-endian) starting at `addr`, honoring `strb` (see `write`).
+        """
+        self.write(addr, (data & ((1 << (nr_bytes << 3)) - 1)).to_bytes(nr_bytes, "little"), strb)
+
+    def fill(self, addr: int, nr_bytes: int, value: int = 0) -> None:
+        """
+        Set `nr_bytes` bytes starting at `addr` to the byte `value`.
+        """
+        self.write(addr, bytes([value]) * nr_bytes)
+
+    def resident_pages(self) -> int:
+        return len(self.pages)
+
+    def bytes_touched(self) -> int:
+        return sum(mask.bit_count() for mask in self.touched.values())
+
+    def stats(self) -> str:
+        return (
+            f"{self.name}: {self.resident_pages()} resident pages of {self.page_size} bytes "
+            f"({self.resident_pages() * self.page_size} bytes), {self.bytes_touched()} bytes touched"
+        )
+
+    def clear(self) -> None:
+        """
+        Drop every page. With a backing file, the file contents are left as they are.
+        """
+        for page in self.pages.values():
+            if isinstance(page, memoryview):
+                page.release()
+        self.pages.clear()
+        self.touched.clear()
+
+    def close(self) -> None:
+        """
+        Flush and unmap the backing file (no-op for in-RAM memories).
+        """
+        if self.store is None:
+            return
+        self.clear()
+        self.store.flush()
+        self.store.close()
+        os.close(self.fd)
+        self.store = None
+
+    def dump(self, addr: int, nr_bytes: int) -> str:
+        return f"{self.name}[{hex(addr)}+:{nr_bytes}] = {self.read(addr, nr_bytes)[::-1].hex()}"
@@ -0,0 +1,70 @@
+"""
+    FakeSram in every storage mode (Python ints, native words, byte-packed odd widths) against a plain list,
+    and FakeSramArray sets against its banks; ranges past the depth are refused in every mode.
+"""
+import random
+
+import pytest
+
+from PyVeriUtils.utils.HWComponents.FakeSram import FakeSram, FakeSramArray
+
+DEPTH = 64
+WIDTHS = [None, 8, 32, 64, 24, 100]
+
+
+def random_word(rng: random.Random, width) -> int:
+    return rng.getrandbits(width if width is not None else 200)
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+def test_matches_list(width):
+    rng = random.Random(width)
+    sram = FakeSram(DEPTH, width = width)
+    ref = [0] * DEPTH
+
+    for _ in range(500):
+        op = rng.randrange(4)
+        addr = rng.randrange(DEPTH)
+        n = rng.randint(0, DEPTH - addr)
+        if op == 0:
+            data = random_word(rng, width)
+            sram.write(addr, data)
+            ref[addr] = data
+        elif op == 1:
+            datas = [random_word(rng, width) for _ in range(n)]
+            sram.write_range(addr, datas)
+            ref[addr:addr + n] = datas
+        elif op == 2:
+            data = random_word(rng, width)
+            sram.fill(data, addr, n)
+            ref[addr:addr + n] = [data] * n
+        else:
+            assert list(sram.read_range(addr, n)) == ref[addr:addr + n]
+
+    assert [sram.read(addr) for addr in range(DEPTH)] == ref
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+def test_ranges_past_depth_are_refused(width):
+    sram = FakeSram(DEPTH, width = width)
+    with pytest.raises(AssertionError):
+        sram.write_range(DEPTH - 1, [1, 2])
+    with pytest.raises(AssertionError):
+        sram.fill(1, DEPTH - 1, 2)
+    with pytest.raises(AssertionError):
+        sram.read_range(DEPTH - 1, 2)
+    with pytest.raises(AssertionError):
+        sram.fill(1, DEPTH + 1)
+    assert len(sram.read_range(0, DEPTH)) == DEPTH
+    assert [sram.read(addr) for addr in range(DEPTH)] == [0] * DEPTH
+
+
+@pytest.mark.parametrize("width", [None, 32, 24])
+def test_array_sets_match_banks(width):
+    rng = random.Random(1)
+    srams = FakeSramArray(DEPTH, 4, width = width)
+    for addr in range(DEPTH):
+        srams.write_set(addr, [random_word(rng, width) for _ in range(4)])
+
+    for addr in range(DEPTH):
+        assert srams.read_set(addr) == [srams.read(bank, addr) for bank in range(4)]
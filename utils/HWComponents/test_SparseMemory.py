@@ -0,0 +1,52 @@
+"""
+    SparseMemory (in RAM and file-backed) against a dict of written bytes,
+    with strobed writes and reads spanning page boundaries.
+"""
+import random
+
+import pytest
+
+from PyVeriUtils.utils.HWComponents.SparseMemory import SparseMemory
+
+SIZE = 1 << 16
+
+
+@pytest.mark.parametrize("backed", [False, True])
+def test_matches_byte_dict(tmp_path, backed):
+    rng = random.Random(backed)
+    mem = SparseMemory(SIZE, page_bits = 6, backing_file = str(tmp_path / "mem.img") if backed else None)
+    ref = {}
+
+    def ref_read(addr, n):
+        return bytes(ref.get(a, 0) for a in range(addr, addr + n))
+
+    for _ in range(3000):
+        addr = rng.randrange(SIZE - 300)
+        n = rng.randint(1, 300)
+        op = rng.random()
+        if op < 0.4:
+            data = rng.randbytes(n)
+            strb = rng.getrandbits(n) if rng.random() < 0.5 else None
+            mem.write(addr, data, strb)
+            for i in range(n):
+                if strb is None or strb >> i & 1:
+                    ref[addr + i] = data[i]
+        elif op < 0.5:
+            value = rng.randrange(256)
+            mem.fill(addr, n, value)
+            ref.update((addr + i, value) for i in range(n))
+        elif op < 0.6:
+            data = rng.getrandbits(8 * n + 8)  # Bits above nr_bytes are dropped.
+            mem.write_int(addr, data, n)
+            ref.update((addr + i, data >> (8 * i) & 0xFF) for i in range(n))
+        else:
+            assert mem.read(addr, n) == ref_read(addr, n)
+            assert mem.read_int(addr, n) == int.from_bytes(ref_read(addr, n), "little")
+
+    assert mem.bytes_touched() == len(ref)
+    assert mem.resident_pages() == len({addr >> 6 for addr in ref})
+    assert mem.read(0, SIZE) == ref_read(0, SIZE)
+
+    with pytest.raises(AssertionError):
+        mem.read(SIZE - 1, 2)
+    mem.close()